@@ -0,0 +1,93 @@
+"""
+Benchmark the HTML parser backends (lxml vs bs4) on the saved data_raw/ pages
+
+For every page the venue parser (if one exists) runs on both backends; the
+script prints the time per run, the speedup and whether both produced the
+same events. Pages without a scraper are measured as tree build + get_text().
+Scrapers declaring TARGETS parse only those subtrees; --whole parses the full
+documents instead for comparison. The structured-data fast path is bypassed.
+
+Usage: python debug_scripts/benchmark_parsers.py [--runs 20] [--month 11 --year 2025] [--whole]
+"""
+import argparse
+import importlib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from scrapers.html_parser import BACKENDS, parse_document
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'data_raw')
+
+# data_raw page -> scraper class
+PAGES = {
+    'buena_vista.html': 'BuenaVistaClubBrowserScraper',
+    'cross_club.html': 'CrossClubBrowserScraper',
+    'podlampou.html': 'DivadloPodLampouBrowserScraper',
+    'serikovka.html': 'KDSerikovkaBrowserScraper',
+    'sportovni_hala_fortuna.html': 'TipsportArenaBrowserScraper',
+    'u_stare_pani_(goout).html': 'UStarePaniJazzClubBrowserScraper',
+    'kdjas.html': None,
+    'lucerna_velky_sal.html': None,
+}
+
+
+def make_job(class_name, backend, month, year, whole=False):
+    """Function html -> comparable result for one backend"""
+    if class_name is None:
+        return lambda html: parse_document(html, backend).get_text(' ', strip=True)
+
+    module = importlib.import_module('scrapers.browser_scraper')
+    scraper = getattr(module, class_name)(month=month, year=year)
+    scraper.configure({'parser': backend})
+    if whole:
+        scraper.TARGETS = None
+    return scraper.parse_venue
+
+
+def timed(job, html, runs):
+    """Best-of-runs seconds per call and the last result"""
+    best = float('inf')
+    result = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = job(html)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark HTML parser backends on data_raw/')
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--month', type=int, default=11)
+    parser.add_argument('--year', type=int, default=2025)
+    parser.add_argument('--whole', action='store_true', help='ignore TARGETS, parse whole documents')
+    args = parser.parse_args()
+
+    print(f"{'page':32} {'scraper':34} " + ' '.join(f"{b:>9}" for b in BACKENDS) + f" {'speedup':>8}  same")
+    totals = dict.fromkeys(BACKENDS, 0.0)
+    for page, class_name in PAGES.items():
+        path = os.path.join(DATA_DIR, page)
+        if not os.path.exists(path):
+            continue
+        with open(path, encoding='utf-8') as f:
+            html = f.read()
+
+        times, results = {}, {}
+        for backend in BACKENDS:
+            times[backend], results[backend] = timed(make_job(class_name, backend, args.month, args.year, args.whole), html, args.runs)
+            totals[backend] += times[backend]
+
+        same = results['lxml'] == results['bs4']
+        print(f"{page:32} {class_name or '(tree + text)':34} "
+              + ' '.join(f"{times[b] * 1000:7.1f}ms" for b in BACKENDS)
+              + f" {times['bs4'] / times['lxml']:7.1f}x  {'yes' if same else 'NO'}")
+
+    print(f"{'total':67} " + ' '.join(f"{totals[b] * 1000:7.1f}ms" for b in BACKENDS)
+          + f" {totals['bs4'] / max(totals['lxml'], 1e-9):7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -5,21 +5,34 @@ Main framework for scraping concert data from multiple venues.
 
 Usage:
     python scrape_concerts.py
+    python scrape_concerts.py --workers 4     # scrape venues in parallel
+    python scrape_concerts.py --workers 4 --parse-processes 2  # parse in worker processes
 
 Configuration:
     Read from kluby.json - month, year, and venue list
 """
 
 import argparse
+import asyncio
+import importlib
 import json
-import requests_cache
+import time
+from collections import defaultdict
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextlib import nullcontext
 import logging
-from typing import List, Dict, Tuple, Optional
+from typing import Callable, List, Dict, Tuple, Optional
 from datetime import datetime
 
-
-# Enable HTTP caching for development
-requests_cache.install_cache('concert_scraper_cache', expire_after=3600)
+from scrapers.checkpoint import RunCheckpoint
+from scrapers.deadline import RunDeadline, VenueSkipped, parse_duration, venue_priority
+from scrapers.durations import DurationHistory, predict_makespan
+from scrapers.http_session import close_session
+from scrapers.parse_pool import ParsePool
+from scrapers.scheduler import VenueScheduler, venue_host
+from scrapers.state_store import atomic_write_json
+from scrapers.watchdog import DEFAULT_PAGE_CAP, configure_watchdog
+from update_month_config import CZECH_MONTHS, next_month
 
 # Configure logging
 logging.basicConfig(
@@ -35,16 +48,102 @@ def load_config(config_file: str = 'kluby.json') -> Dict:
         return json.load(f)
 
 
-def scrape_venue(venue: Dict, month: int, year: int) -> Tuple[List[Dict], Dict, Optional[Exception]]:
+# Venue name -> (module, scraper class, log note)
+# AUTOMATED APPROACH: Playwright → Beautiful Soup → Fail
+# (WebFetch is now only for manual debugging with Claude)
+VENUE_SCRAPERS = {
+    "Rock Café": ("scrapers.browser_scraper", "RockCafeBrowserScraper", "Using Playwright (automated)"),
+    "Lucerna Music Bar": ("scrapers.browser_scraper", "LucernaMusicBarBrowserScraper", "Using Playwright (automated)"),
+    "Roxy": ("scrapers.browser_scraper", "RoxyBrowserScraper", "Using Playwright (automated)"),
+    "Vagon": ("scrapers.browser_scraper", "VagonBrowserScraper", "Using Playwright (automated)"),
+    "Jazz Dock": ("scrapers.browser_scraper", "JazzDockBrowserScraper", "Using Playwright (automated)"),
+    "Forum Karlín": ("scrapers.browser_scraper", "ForumKarlinBrowserScraper", "Using Playwright (automated)"),
+    "MeetFactory": ("scrapers.browser_scraper", "MeetFactoryBrowserScraper", "Using Playwright (automated)"),
+    "Malostranská beseda": ("scrapers.browser_scraper", "MalostranaskaBesedaBrowserScraper", "Using Playwright (automated)"),
+    "Reduta Jazz Club": ("scrapers.browser_scraper", "RedutaJazzClubBrowserScraper", "Using Playwright (automated)"),
+    "Watt Music Club": ("scrapers.browser_scraper", "WattMusicClubBrowserScraper", "Using Playwright (automated)"),
+    "O2 Arena": ("scrapers.browser_scraper", "O2ArenaBrowserScraper", "Using Playwright (automated, filters sports)"),
+    "O2 Universum": ("scrapers.browser_scraper", "O2UniversumBrowserScraper", "Using Playwright (automated)"),
+    "Divadlo Pod lampou": ("scrapers.browser_scraper", "DivadloPodLampouBrowserScraper", "Using Playwright (automated, filters theatre)"),
+    "Kulturní dům Šeříkovka": ("scrapers.browser_scraper", "KDSerikovkaBrowserScraper", "Using Playwright (automated, filters non-music)"),
+    "Buena Vista Club": ("scrapers.browser_scraper", "BuenaVistaClubBrowserScraper", "Using Playwright (automated)"),
+    "Papírna Plzeň": ("scrapers.browser_scraper", "PapirnaPlzenBrowserScraper", "Using Playwright via GoOut (automated)"),
+    "U Staré Paní Jazz & Cocktail Club": ("scrapers.browser_scraper", "UStarePaniJazzClubBrowserScraper", "Using Playwright via GoOut (automated)"),
+    "Cross Club": ("scrapers.browser_scraper", "CrossClubBrowserScraper", "Using Playwright (automated)"),
+    "Sportovní hala Fortuna (Tipsport Arena)": ("scrapers.browser_scraper", "TipsportArenaBrowserScraper", "Using Playwright via Ticketportal (automated, filters sports)"),
+    "Sono Centrum": ("scrapers.browser_scraper", "SonoCentrumBrowserScraper", "Using Playwright (automated)"),
+    "Fléda": ("scrapers.browser_scraper", "FledaBrowserScraper", "Using Playwright (automated)"),
+    "Kabinet Múz": ("scrapers.browser_scraper", "KabinetMuzBrowserScraper", "Using Playwright (automated)"),
+    "Stará Pekárna": ("scrapers.browser_scraper", "StaraPekarnaBrowserScraper", "Using Playwright (automated)"),
+    "Melodka": ("scrapers.browser_scraper", "MelodkaBrowserScraper", "Using Playwright (automated)"),
+    # Beautiful Soup scrapers (static HTML)
+    "Palác Akropolis": ("scrapers.scraper_akropolis", "AkropolisScraper", "Using Beautiful Soup (static HTML)"),
+}
+
+
+def create_scraper(venue: Dict, month: int, year: int):
+    """
+    Instantiate and configure the scraper for a venue (see VENUE_SCRAPERS)
+
+    Returns:
+        Configured scraper, or None if no scraper is implemented for the venue
+    """
+    entry = VENUE_SCRAPERS.get(venue['nazev'])
+    if entry is None:
+        return None
+
+    module_name, class_name, note = entry
+    scraper_class = getattr(importlib.import_module(module_name), class_name)
+    logger.info(f"{venue['nazev']}: {note}")
+
+    scraper = scraper_class(month=month, year=year)
+    scraper.configure(venue)
+    return scraper
+
+
+# Callback receiving the extra months of a horizon run: (venue, (month, year), events, validation)
+HorizonCollector = Callable[[Dict, Tuple[int, int], List[Dict], Dict], None]
+
+
+def horizon_months(month: int, year: int, count: int) -> List[Tuple[int, int]]:
+    """[(month, year), next month, ...] - count months starting with the target month"""
+    months = [(month, year)]
+    while len(months) < count:
+        next_year, next_month_num = next_month(months[-1][1], months[-1][0])
+        months.append((next_month_num, next_year))
+    return months
+
+
+def collect_horizon(venue: Dict, scrapers_by_month: Dict, month: int, year: int,
+                    collect: Optional[HorizonCollector]) -> List[Dict]:
+    """Hand the extra months of a horizon scrape to collect(); return the target month's events"""
+    min_events = venue.get('min_akci', 0)
+    max_events = venue.get('max_akci', 100)
+    for (m, y), scraper in scrapers_by_month.items():
+        if (m, y) != (month, year) and collect is not None:
+            collect(venue, (m, y), scraper.events,
+                    scraper.validate(min_events=min_events, max_events=max_events))
+    return scrapers_by_month[(month, year)].events
+
+
+def scrape_venue(venue: Dict, month: int, year: int, horizon: Optional[List[Tuple[int, int]]] = None,
+                 collect: Optional[HorizonCollector] = None,
+                 budget: Optional[float] = None) -> Tuple[List[Dict], Dict, Optional[Exception]]:
     """
     Scrape a single venue with error handling (Hybrid approach)
 
-    Uses Beautiful Soup for static sites, WebFetch data for dynamic sites.
+    Uses Playwright for JavaScript sites, Beautiful Soup for static sites
+    (see VENUE_SCRAPERS).
 
     Args:
         venue: Venue configuration dict from kluby.json
         month: Month number
         year: Year
+        horizon: Optional (month, year) list starting with the target month;
+            the venue is fetched once and every month is handed to collect()
+        collect: Receives the events of the horizon months after the first
+        budget: Optional time budget in seconds (run deadline, see scrapers/deadline.py);
+            caps the scraper's network and page timeouts
 
     Returns:
         Tuple of (events, validation, error)
@@ -53,255 +152,353 @@ def scrape_venue(venue: Dict, month: int, year: int) -> Tuple[List[Dict], Dict,
         - error: Exception if failed, None if success
     """
     venue_name = venue['nazev']
-    url = venue['url']
-    city = venue['mesto']
     min_events = venue.get('min_akci', 0)
     max_events = venue.get('max_akci', 100)
 
     try:
-        # AUTOMATED APPROACH: Playwright → Beautiful Soup → Fail
-        # (WebFetch is now only for manual debugging with Claude)
-
-        # 1. Try Playwright scraper (JavaScript sites) - AUTOMATED
-        if venue_name == "Rock Café":
-            from scrapers.browser_scraper import RockCafeBrowserScraper
-            logger.info(f"{venue_name}: Using Playwright (automated)")
-            scraper = RockCafeBrowserScraper(month=month, year=year)
-            events = scraper.scrape()
-            validation = scraper.validate(min_events=min_events, max_events=max_events)
-            logger.info(f"{venue_name}: {validation['total_events']} events ({validation['status']})")
-            return events, validation, None
-
-        if venue_name == "Lucerna Music Bar":
-            from scrapers.browser_scraper import LucernaMusicBarBrowserScraper
-            logger.info(f"{venue_name}: Using Playwright (automated)")
-            scraper = LucernaMusicBarBrowserScraper(month=month, year=year)
-            events = scraper.scrape()
-            validation = scraper.validate(min_events=min_events, max_events=max_events)
-            logger.info(f"{venue_name}: {validation['total_events']} events ({validation['status']})")
-            return events, validation, None
-
-        if venue_name == "Roxy":
-            from scrapers.browser_scraper import RoxyBrowserScraper
-            logger.info(f"{venue_name}: Using Playwright (automated)")
-            scraper = RoxyBrowserScraper(month=month, year=year)
-            events = scraper.scrape()
-            validation = scraper.validate(min_events=min_events, max_events=max_events)
-            logger.info(f"{venue_name}: {validation['total_events']} events ({validation['status']})")
-            return events, validation, None
-
-        if venue_name == "Vagon":
-            from scrapers.browser_scraper import VagonBrowserScraper
-            logger.info(f"{venue_name}: Using Playwright (automated)")
-            scraper = VagonBrowserScraper(month=month, year=year)
-            events = scraper.scrape()
-            validation = scraper.validate(min_events=min_events, max_events=max_events)
-            logger.info(f"{venue_name}: {validation['total_events']} events ({validation['status']})")
-            return events, validation, None
-
-        if venue_name == "Jazz Dock":
-            from scrapers.browser_scraper import JazzDockBrowserScraper
-            logger.info(f"{venue_name}: Using Playwright (automated)")
-            scraper = JazzDockBrowserScraper(month=month, year=year)
-            events = scraper.scrape()
-            validation = scraper.validate(min_events=min_events, max_events=max_events)
-            logger.info(f"{venue_name}: {validation['total_events']} events ({validation['status']})")
-            return events, validation, None
-
-        if venue_name == "Forum Karlín":
-            from scrapers.browser_scraper import ForumKarlinBrowserScraper
-            logger.info(f"{venue_name}: Using Playwright (automated)")
-            scraper = ForumKarlinBrowserScraper(month=month, year=year)
-            events = scraper.scrape()
-            validation = scraper.validate(min_events=min_events, max_events=max_events)
-            logger.info(f"{venue_name}: {validation['total_events']} events ({validation['status']})")
-            return events, validation, None
-
-        if venue_name == "MeetFactory":
-            from scrapers.browser_scraper import MeetFactoryBrowserScraper
-            logger.info(f"{venue_name}: Using Playwright (automated)")
-            scraper = MeetFactoryBrowserScraper(month=month, year=year)
-            events = scraper.scrape()
-            validation = scraper.validate(min_events=min_events, max_events=max_events)
-            logger.info(f"{venue_name}: {validation['total_events']} events ({validation['status']})")
-            return events, validation, None
-
-        if venue_name == "Malostranská beseda":
-            from scrapers.browser_scraper import MalostranaskaBesedaBrowserScraper
-            logger.info(f"{venue_name}: Using Playwright (automated)")
-            scraper = MalostranaskaBesedaBrowserScraper(month=month, year=year)
-            events = scraper.scrape()
-            validation = scraper.validate(min_events=min_events, max_events=max_events)
-            logger.info(f"{venue_name}: {validation['total_events']} events ({validation['status']})")
-            return events, validation, None
-
-        if venue_name == "Reduta Jazz Club":
-            from scrapers.browser_scraper import RedutaJazzClubBrowserScraper
-            logger.info(f"{venue_name}: Using Playwright (automated)")
-            scraper = RedutaJazzClubBrowserScraper(month=month, year=year)
-            events = scraper.scrape()
-            validation = scraper.validate(min_events=min_events, max_events=max_events)
-            logger.info(f"{venue_name}: {validation['total_events']} events ({validation['status']})")
-            return events, validation, None
-
-        if venue_name == "Watt Music Club":
-            from scrapers.browser_scraper import WattMusicClubBrowserScraper
-            logger.info(f"{venue_name}: Using Playwright (automated)")
-            scraper = WattMusicClubBrowserScraper(month=month, year=year)
-            events = scraper.scrape()
-            validation = scraper.validate(min_events=min_events, max_events=max_events)
-            logger.info(f"{venue_name}: {validation['total_events']} events ({validation['status']})")
-            return events, validation, None
-
-        if venue_name == "O2 Arena":
-            from scrapers.browser_scraper import O2ArenaBrowserScraper
-            logger.info(f"{venue_name}: Using Playwright (automated, filters sports)")
-            scraper = O2ArenaBrowserScraper(month=month, year=year)
-            events = scraper.scrape()
-            validation = scraper.validate(min_events=min_events, max_events=max_events)
-            logger.info(f"{venue_name}: {validation['total_events']} events ({validation['status']})")
-            return events, validation, None
-
-        if venue_name == "O2 Universum":
-            from scrapers.browser_scraper import O2UniversumBrowserScraper
-            logger.info(f"{venue_name}: Using Playwright (automated)")
-            scraper = O2UniversumBrowserScraper(month=month, year=year)
-            events = scraper.scrape()
-            validation = scraper.validate(min_events=min_events, max_events=max_events)
-            logger.info(f"{venue_name}: {validation['total_events']} events ({validation['status']})")
-            return events, validation, None
-
-        if venue_name == "Divadlo Pod lampou":
-            from scrapers.browser_scraper import DivadloPodLampouBrowserScraper
-            logger.info(f"{venue_name}: Using Playwright (automated, filters theatre)")
-            scraper = DivadloPodLampouBrowserScraper(month=month, year=year)
-            events = scraper.scrape()
-            validation = scraper.validate(min_events=min_events, max_events=max_events)
-            logger.info(f"{venue_name}: {validation['total_events']} events ({validation['status']})")
-            return events, validation, None
-
-        if venue_name == "Kulturní dům Šeříkovka":
-            from scrapers.browser_scraper import KDSerikovkaBrowserScraper
-            logger.info(f"{venue_name}: Using Playwright (automated, filters non-music)")
-            scraper = KDSerikovkaBrowserScraper(month=month, year=year)
-            events = scraper.scrape()
-            validation = scraper.validate(min_events=min_events, max_events=max_events)
-            logger.info(f"{venue_name}: {validation['total_events']} events ({validation['status']})")
-            return events, validation, None
-
-        if venue_name == "Buena Vista Club":
-            from scrapers.browser_scraper import BuenaVistaClubBrowserScraper
-            logger.info(f"{venue_name}: Using Playwright (automated)")
-            scraper = BuenaVistaClubBrowserScraper(month=month, year=year)
-            events = scraper.scrape()
-            validation = scraper.validate(min_events=min_events, max_events=max_events)
-            logger.info(f"{venue_name}: {validation['total_events']} events ({validation['status']})")
-            return events, validation, None
-
-        if venue_name == "Papírna Plzeň":
-            from scrapers.browser_scraper import PapirnaPlzenBrowserScraper
-            logger.info(f"{venue_name}: Using Playwright via GoOut (automated)")
-            scraper = PapirnaPlzenBrowserScraper(month=month, year=year)
-            events = scraper.scrape()
-            validation = scraper.validate(min_events=min_events, max_events=max_events)
-            logger.info(f"{venue_name}: {validation['total_events']} events ({validation['status']})")
-            return events, validation, None
-
-        if venue_name == "U Staré Paní Jazz & Cocktail Club":
-            from scrapers.browser_scraper import UStarePaniJazzClubBrowserScraper
-            logger.info(f"{venue_name}: Using Playwright via GoOut (automated)")
-            scraper = UStarePaniJazzClubBrowserScraper(month=month, year=year)
-            events = scraper.scrape()
-            validation = scraper.validate(min_events=min_events, max_events=max_events)
-            logger.info(f"{venue_name}: {validation['total_events']} events ({validation['status']})")
-            return events, validation, None
-
-        if venue_name == "Cross Club":
-            from scrapers.browser_scraper import CrossClubBrowserScraper
-            logger.info(f"{venue_name}: Using Playwright (automated)")
-            scraper = CrossClubBrowserScraper(month=month, year=year)
-            events = scraper.scrape()
-            validation = scraper.validate(min_events=min_events, max_events=max_events)
-            logger.info(f"{venue_name}: {validation['total_events']} events ({validation['status']})")
-            return events, validation, None
-
-        if venue_name == "Sportovní hala Fortuna (Tipsport Arena)":
-            from scrapers.browser_scraper import TipsportArenaBrowserScraper
-            logger.info(f"{venue_name}: Using Playwright via Ticketportal (automated, filters sports)")
-            scraper = TipsportArenaBrowserScraper(month=month, year=year)
-            events = scraper.scrape()
-            validation = scraper.validate(min_events=min_events, max_events=max_events)
-            logger.info(f"{venue_name}: {validation['total_events']} events ({validation['status']})")
-            return events, validation, None
-
-        if venue_name == "Sono Centrum":
-            from scrapers.browser_scraper import SonoCentrumBrowserScraper
-            logger.info(f"{venue_name}: Using Playwright (automated)")
-            scraper = SonoCentrumBrowserScraper(month=month, year=year)
-            events = scraper.scrape()
-            validation = scraper.validate(min_events=min_events, max_events=max_events)
-            logger.info(f"{venue_name}: {validation['total_events']} events ({validation['status']})")
-            return events, validation, None
-
-        if venue_name == "Fléda":
-            from scrapers.browser_scraper import FledaBrowserScraper
-            logger.info(f"{venue_name}: Using Playwright (automated)")
-            scraper = FledaBrowserScraper(month=month, year=year)
-            events = scraper.scrape()
-            validation = scraper.validate(min_events=min_events, max_events=max_events)
-            logger.info(f"{venue_name}: {validation['total_events']} events ({validation['status']})")
-            return events, validation, None
-
-        if venue_name == "Kabinet Múz":
-            from scrapers.browser_scraper import KabinetMuzBrowserScraper
-            logger.info(f"{venue_name}: Using Playwright (automated)")
-            scraper = KabinetMuzBrowserScraper(month=month, year=year)
-            events = scraper.scrape()
-            validation = scraper.validate(min_events=min_events, max_events=max_events)
-            logger.info(f"{venue_name}: {validation['total_events']} events ({validation['status']})")
-            return events, validation, None
-
-        if venue_name == "Stará Pekárna":
-            from scrapers.browser_scraper import StaraPekarnaBrowserScraper
-            logger.info(f"{venue_name}: Using Playwright (automated)")
-            scraper = StaraPekarnaBrowserScraper(month=month, year=year)
-            events = scraper.scrape()
-            validation = scraper.validate(min_events=min_events, max_events=max_events)
-            logger.info(f"{venue_name}: {validation['total_events']} events ({validation['status']})")
-            return events, validation, None
-
-        if venue_name == "Melodka":
-            from scrapers.browser_scraper import MelodkaBrowserScraper
-            logger.info(f"{venue_name}: Using Playwright (automated)")
-            scraper = MelodkaBrowserScraper(month=month, year=year)
-            events = scraper.scrape()
-            validation = scraper.validate(min_events=min_events, max_events=max_events)
-            logger.info(f"{venue_name}: {validation['total_events']} events ({validation['status']})")
-            return events, validation, None
-
-        # 2. Try Beautiful Soup scraper (static HTML) - AUTOMATED
-        if venue_name == "Palác Akropolis":
-            from scrapers.scraper_akropolis import AkropolisScraper
-            logger.info(f"{venue_name}: Using Beautiful Soup (static HTML)")
-            scraper = AkropolisScraper(month=month, year=year)
-            events = scraper.scrape()
-            validation = scraper.validate(min_events=min_events, max_events=max_events)
-            logger.info(f"{venue_name}: {validation['total_events']} events ({validation['status']})")
-            return events, validation, None
-
-        # 3. No scraper available
-        logger.warning(f"No scraper implemented for {venue_name}")
-        return [], None, Exception(f"No scraper for {venue_name}")
+        scraper = create_scraper(venue, month, year)
+        if scraper is None:
+            logger.warning(f"No scraper implemented for {venue_name}")
+            return [], None, Exception(f"No scraper for {venue_name}")
+        scraper.set_budget(budget)
+
+        if horizon and len(horizon) > 1:
+            events = collect_horizon(venue, scraper.scrape_horizon(horizon), month, year, collect)
+        else:
+            events = scraper.scrape_with_retry()
+        validation = scraper.validate(min_events=min_events, max_events=max_events)
+        logger.info(f"{venue_name}: {validation['total_events']} events ({validation['status']})")
+        return events, validation, None
+
+    except Exception as e:
+        logger.error(f"Failed to scrape {venue_name}: {e}")
+        return [], None, e
+
+
+def scrape_venue_pipelined(venue: Dict, month: int, year: int, parse_pool, retry_pool: Executor,
+                           on_done: Optional[Callable[[Tuple], None]] = None,
+                           budget: Optional[float] = None) -> Future:
+    """
+    scrape_venue() split into a fetch stage (this thread) and a parse stage (parse_pool)
+
+    BrowserScrapers whose fetch returns raw HTML or JSON get it parsed in a
+    worker process while the calling thread moves on to its next venue.
+    Everything else (HTTP tier hits, static scrapers, hedged venues,
+    failures) completes in the calling thread. A failed fetch or parse is
+    retried once right away, like scrape_with_retry(). A parse retry
+    refetches, so it runs on retry_pool: the parse pool's callbacks only
+    hand it over and keep delivering other venues' results.
+
+    Args:
+        venue: Venue configuration dict from kluby.json
+        month: Month number
+        year: Year
+        parse_pool: Shared ParsePool (see scrapers/parse_pool.py)
+        retry_pool: Thread pool running second attempts after failed parses
+        on_done: Optional callback(result) run before the future completes
+        budget: See scrape_venue()
+
+    Returns:
+        Future of the (events, validation, error) tuple of scrape_venue()
+    """
+    from scrapers.browser_scraper import BrowserScraper
+
+    venue_name = venue['nazev']
+    result: Future = Future()
+    retried = False
+
+    def complete(value: Tuple) -> None:
+        if on_done is not None:
+            on_done(value)
+        result.set_result(value)
+
+    def finish(scraper, events: List[Dict]) -> None:
+        validation = scraper.validate(min_events=venue.get('min_akci', 0), max_events=venue.get('max_akci', 100))
+        logger.info(f"{venue_name}: {validation['total_events']} events ({validation['status']})")
+        complete((events, validation, None))
+
+    def fail(e: Exception) -> None:
+        logger.error(f"Failed to scrape {venue_name}: {e}")
+        complete(([], None, e))
+
+    try:
+        scraper = create_scraper(venue, month, year)
+        if scraper is None:
+            logger.warning(f"No scraper implemented for {venue_name}")
+            complete(([], None, Exception(f"No scraper for {venue_name}")))
+            return result
+        scraper.set_budget(budget)
+        if not isinstance(scraper, BrowserScraper) or scraper.hedged:
+            finish(scraper, scraper.scrape_with_retry())
+            return result
+
+        try:
+            kind, data = scraper.fetch_source()
+        except Exception as e:
+            if scraper.budget_exhausted():
+                raise
+            logger.warning(f"{venue_name}: fetch failed ({e}), retrying once")
+            retried = True
+            scraper = scraper.fresh_attempt()
+            kind, data = scraper.fetch_source()
+        if kind == 'events':
+            finish(scraper, scraper.parse_source(kind, data))
+            return result
+    except Exception as e:
+        fail(e)
+        return result
+
+    def retry(error: Exception) -> None:
+        try:
+            if retried or scraper.budget_exhausted():
+                raise error
+            logger.warning(f"{venue_name}: parse failed ({error}), retrying once")
+            finish(scraper, scraper.second_attempt())
+        except Exception as e:
+            fail(e)
+
+    def parsed(future: Future) -> None:
+        error = future.exception()
+        if error is None:
+            try:
+                finish(scraper, future.result())
+            except Exception as e:
+                fail(e)
+            return
+        try:
+            retry_pool.submit(retry, error)
+        except RuntimeError as e:  # retry pool shut down
+            fail(e)
+
+    try:
+        future = parse_pool.submit(scraper, kind, data)
+    except Exception as e:  # broken parse pool: second attempt parses in this thread
+        retry(e)
+        return result
+    future.add_done_callback(parsed)
+    return result
+
+
+async def scrape_venue_async(venue: Dict, month: int, year: int, pool,
+                             horizon: Optional[List[Tuple[int, int]]] = None,
+                             collect: Optional[HorizonCollector] = None,
+                             budget: Optional[float] = None) -> Tuple[List[Dict], Dict, Optional[Exception]]:
+    """
+    scrape_venue() for the async engine (see scrapers/async_browser.py)
+
+    Args:
+        venue: Venue configuration dict from kluby.json
+        month: Month number
+        year: Year
+        pool: Shared AsyncBrowserPool
+        horizon: See scrape_venue()
+        collect: See scrape_venue()
+        budget: See scrape_venue(); the venue is cancelled (open pages
+            closed) when it runs out
+
+    Returns:
+        Tuple of (events, validation, error) like scrape_venue()
+    """
+    from scrapers.async_browser import scrape_async, scrape_horizon_async
+
+    venue_name = venue['nazev']
+    min_events = venue.get('min_akci', 0)
+    max_events = venue.get('max_akci', 100)
+
+    try:
+        scraper = create_scraper(venue, month, year)
+        if scraper is None:
+            logger.warning(f"No scraper implemented for {venue_name}")
+            return [], None, Exception(f"No scraper for {venue_name}")
+        scraper.set_budget(budget)
+
+        if horizon and len(horizon) > 1:
+            work = scrape_horizon_async(scraper, pool, horizon)
+        else:
+            work = scrape_async(scraper, pool)
+        try:
+            result = await asyncio.wait_for(work, timeout=budget)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Time budget of {budget:.0f} s exhausted") from None
+        if horizon and len(horizon) > 1:
+            events = collect_horizon(venue, result, month, year, collect)
+        else:
+            events = result
+        validation = scraper.validate(min_events=min_events, max_events=max_events)
+        logger.info(f"{venue_name}: {validation['total_events']} events ({validation['status']})")
+        return events, validation, None
 
     except Exception as e:
         logger.error(f"Failed to scrape {venue_name}: {e}")
         return [], None, e
 
 
-def print_validation_report(successful_venues: List[Dict], config_kluby: List[Dict]) -> List[str]:
+async def scrape_venues_async(venues: List[Dict], month: int, year: int, concurrency: int = 8,
+                              per_host_limit: int = 1, fresh_profile: bool = False,
+                              priority: Optional[Callable[[Dict], float]] = None,
+                              on_done: Optional[Callable[[Dict, Tuple, float], None]] = None,
+                              horizon: Optional[List[Tuple[int, int]]] = None,
+                              collect: Optional[HorizonCollector] = None,
+                              budget: Optional[Callable[[Dict], Optional[float]]] = None) -> List[Tuple]:
+    """
+    Async orchestrator: scrape venues concurrently on one event loop and one browser
+
+    Args:
+        priority: Optional key; venues with higher values start first
+        on_done: Optional callback(venue, result, seconds) run as each venue completes
+        horizon: See scrape_venue()
+        collect: See scrape_venue()
+        budget: Optional callback(venue) returning the time budget of a venue
+            starting now; raises VenueSkipped if the run deadline does not allow it
+
+    Returns:
+        List of (events, validation, error) tuples, in the same order as venues
+    """
+    from scrapers.async_browser import AsyncBrowserPool
+
+    host_slots = defaultdict(lambda: asyncio.Semaphore(max(1, per_host_limit)))
+    start_order = sorted(range(len(venues)), key=lambda idx: priority(venues[idx]) if priority else 0,
+                         reverse=True)
+    results: List[Tuple] = [None] * len(venues)
+
+    async with AsyncBrowserPool(max_concurrent_pages=concurrency, fresh_profile=fresh_profile) as pool:
+        async def job(idx: int) -> None:
+            venue = venues[idx]
+            async with host_slots[venue_host(venue)]:
+                start = time.monotonic()
+                try:
+                    seconds = budget(venue) if budget is not None else None
+                except VenueSkipped as e:
+                    results[idx] = ([], None, e)
+                    return
+                results[idx] = await scrape_venue_async(venue, month, year, pool, horizon, collect, seconds)
+                if on_done is not None:
+                    on_done(venue, results[idx], time.monotonic() - start)
+
+        await asyncio.gather(*(job(idx) for idx in start_order))
+
+    return results
+
+
+def select_venues(venues: List[Dict], names: Optional[str] = None, city: Optional[str] = None) -> List[Dict]:
+    """
+    Filter venues for a selective re-scrape
+
+    Args:
+        venues: Venue configuration dicts from kluby.json
+        names: Comma-separated venue names (--venues "Roxy,Fléda"), case-insensitive
+        city: City name (--city Plzeň), case-insensitive
+
+    Returns:
+        Matching venues in config order
+    """
+    selected = venues
+    if names:
+        wanted = {name.strip().casefold() for name in names.split(',') if name.strip()}
+        known = {venue['nazev'].casefold() for venue in venues}
+        for name in sorted(wanted - known):
+            logger.warning(f"Unknown venue in --venues: {name}")
+        selected = [venue for venue in selected if venue['nazev'].casefold() in wanted]
+    if city:
+        selected = [venue for venue in selected if venue['mesto'].casefold() == city.strip().casefold()]
+    return selected
+
+
+def merge_venue_results(existing: Dict, new_blocks: List[Dict], config_kluby: List[Dict]) -> Dict:
+    """
+    Replace the blocks of re-scraped venues in an existing events_data.json
+
+    Venues that were not re-scraped (or failed again) keep their old block.
+    Blocks are ordered like kluby.json and total_events is recomputed.
+    Venues of the old skipped_venues list that now have a block are dropped
+    from it (the key with them if none are left).
+
+    Args:
+        existing: Loaded events_data.json
+        new_blocks: Venue blocks ({'venue', 'city', 'events', 'validation'}) from this
+            run, checkpoint-restored ones of a resumed run included
+        config_kluby: Venue configuration dicts (defines the order)
+
+    Returns:
+        Merged events_data dict
+    """
+    blocks = {block['venue']: block for block in existing.get('venues', [])}
+    blocks.update({block['venue']: block for block in new_blocks})
+
+    order = {venue['nazev']: idx for idx, venue in enumerate(config_kluby)}
+    venues = sorted(blocks.values(), key=lambda block: order.get(block['venue'], len(order)))
+
+    merged = {
+        **existing,
+        'total_events': sum(block['validation']['total_events'] for block in venues),
+        'venues': venues
+    }
+    skipped = [name for name in existing.get('skipped_venues', []) if name not in blocks]
+    merged.pop('skipped_venues', None)
+    if skipped:
+        merged['skipped_venues'] = skipped
+    return merged
+
+
+def set_skipped_venues(data: Dict, skipped: List[str]) -> Dict:
+    """
+    Record the venues a --deadline run skipped in events_data
+
+    A merged file keeps the earlier run's skipped venues that still have no
+    block (see merge_venue_results()); the key is dropped when none are left.
+
+    Args:
+        data: events_data dict (fresh or merged)
+        skipped: Venues skipped in this run
+
+    Returns:
+        data, updated in place
+    """
+    names = data.pop('skipped_venues', [])
+    names += [name for name in skipped if name not in names]
+    if names:
+        data['skipped_venues'] = names
+    return data
+
+
+def horizon_month_data(month: int, year: int, blocks: List[Dict], config_kluby: List[Dict],
+                       existing: Optional[Dict] = None) -> Dict:
+    """
+    Contents of events_data_YYYY_MM.json for one horizon month
+
+    Args:
+        month: Month of the file
+        year: Year of the file
+        blocks: Venue blocks scraped for that month in this run
+        config_kluby: Venue configuration dicts (defines the order)
+        existing: The month's previous file; its venues not scraped in this
+            run are kept (selective and resumed runs). None replaces the file
+
+    Returns:
+        events_data dict for the month
+    """
+    data = {'month': month, 'year': year, 'month_name': CZECH_MONTHS[month], 'venues': []}
+    if existing and (existing.get('month'), existing.get('year')) == (month, year):
+        data = existing
+    return merge_venue_results(data, blocks, config_kluby)
+
+
+def load_events_file(filename: str) -> Optional[Dict]:
+    """Load an events_data*.json file, None if it is missing or unreadable"""
+    try:
+        with open(filename, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def print_validation_report(successful_venues: List[Dict], config_kluby: List[Dict],
+                            skipped_venues: Optional[List[str]] = None) -> List[str]:
     """
     Print color-coded validation report and return list of problem venue names.
 
+    Venues skipped because of the run deadline (--deadline) are listed separately.
+
     Returns:
         List of venue names with 0 events where min_akci > 0 (RED alert venues)
     """
@@ -330,6 +527,12 @@ def print_validation_report(successful_venues: List[Dict], config_kluby: List[Di
             print(f"   - {name}")
         print()
 
+    if skipped_venues:
+        print("\n⏱️  PŘESKOČENÉ VENUES (deadline běhu):")
+        for name in skipped_venues:
+            print(f"   - {name}")
+        print()
+
     return red_venues
 
 
@@ -338,6 +541,36 @@ def main():
     parser = argparse.ArgumentParser(description='Concert scraper')
     parser.add_argument('--force', action='store_true',
                         help='Přeskočit interaktivní potvrzení a vždy uložit výstup')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Počet venues scrapovaných paralelně (default 1 = sekvenčně)')
+    parser.add_argument('--per-host', type=int, default=1,
+                        help='Maximum souběžných scraperů na jeden host (default 1)')
+    parser.add_argument('--recycle-after', type=int, default=20,
+                        help='Restartovat sdílený prohlížeč po N stránkách (default 20)')
+    parser.add_argument('--engine', choices=['sync', 'async'], default='sync',
+                        help='sync = vlákna + sync Playwright (default), async = jeden event loop + async Playwright')
+    parser.add_argument('--concurrency', type=int, default=8,
+                        help='Počet současně otevřených stránek pro --engine async (default 8)')
+    parser.add_argument('--venues', type=str, default=None,
+                        help='Scrapovat jen vybrané venues (čárkami oddělené názvy) a sloučit do events_data.json')
+    parser.add_argument('--city', type=str, default=None,
+                        help='Scrapovat jen venues z daného města a sloučit do events_data.json')
+    parser.add_argument('--months', type=int, default=1,
+                        help='Horizont: stáhnout každé venue jednou a rozdělit eventy do N měsíců '
+                             '(events_data_YYYY_MM.json, default 1)')
+    parser.add_argument('--resume', action='store_true',
+                        help='Navázat na přerušený běh: načíst hotové venues z checkpointu, scrapovat jen zbytek')
+    parser.add_argument('--fresh-profile', action='store_true',
+                        help='Ignorovat uložené profily prohlížeče (cookies, consent) z předchozích běhů')
+    parser.add_argument('--deadline', type=parse_duration, default=None,
+                        help='Časový limit celého běhu, např. 300s nebo 5m; venues s nízkou prioritou '
+                             'se při nedostatku času přeskočí a uloží se částečný výsledek')
+    parser.add_argument('--page-cap', type=float, default=DEFAULT_PAGE_CAP,
+                        help='Tvrdý limit jedné stránky v sekundách; zaseknutý Chromium se zabije '
+                             f'i s celým stromem procesů (default {DEFAULT_PAGE_CAP:.0f})')
+    parser.add_argument('--parse-processes', type=int, default=0,
+                        help='Parsovat HTML v N procesech, zatímco prohlížeč stahuje další venue '
+                             '(jen --engine sync bez --months, default 0 = parsovat ve vlákně)')
     args = parser.parse_args()
 
     logger.info("Concert Scraper Framework")
@@ -349,35 +582,155 @@ def main():
     year = config['config']['rok']
     month_name = config['config']['mesic']
 
+    # Selective re-scrape (--venues / --city) merges into the existing events_data.json
+    selective = bool(args.venues or args.city)
+    venues = select_venues(config['kluby'], args.venues, args.city)
+    if selective and not venues:
+        logger.error("Výběr --venues/--city neodpovídá žádnému venue v kluby.json")
+        return
+
     logger.info(f"Scraping concerts for {month_name} {year} (month {month})")
-    logger.info(f"Total venues: {len(config['kluby'])}")
+    logger.info(f"Total venues: {len(venues)}" + (f" (výběr z {len(config['kluby'])})" if selective else ""))
+    if args.workers > 1:
+        logger.info(f"Workers: {args.workers} (max {args.per_host} per host)")
     logger.info("=" * 60)
 
-    # First pass: attempt all venues
-    successful_venues = []
-    failed_venues = []
-
-    for venue in config['kluby']:
-        events, validation, error = scrape_venue(venue, month, year)
-
+    # Supervises every browser and page of the run (kills hung Chromium, reports leaks)
+    watchdog = configure_watchdog(page_cap=args.page_cap)
+    if not watchdog.supervising:
+        logger.warning("psutil není nainstalován - watchdog nemůže zabíjet zaseknuté prohlížeče")
+
+    # One shared browser per worker thread, a fresh context per venue
+    def worker_setup():
+        from scrapers.browser_pool import browser_session
+        return browser_session(max_pages=args.recycle_after, fresh_profile=args.fresh_profile)
+
+    scheduler = VenueScheduler(workers=args.workers, per_host_limit=args.per_host,
+                               worker_setup=worker_setup)
+
+    # Per-venue checkpoints: a crashed/interrupted run can continue with --resume
+    checkpoint = RunCheckpoint(month, year)
+    if args.resume:
+        completed = {name: result for name, result in checkpoint.load_completed().items()
+                     if name in {venue['nazev'] for venue in venues}}
+    else:
+        if not selective:
+            checkpoint.clear()
+        completed = {}
+    pending_venues = [venue for venue in venues if venue['nazev'] not in completed]
+    if completed:
+        logger.info(f"Resume: {len(completed)} venues z checkpointu, {len(pending_venues)} zbývá scrapovat")
+
+    # Longest-expected-first scheduling from recorded durations (first attempt per venue is recorded)
+    history = DurationHistory()
+    durations: Dict[str, float] = {}
+
+    def expected_duration(venue: Dict) -> float:
+        return history.estimate(venue['nazev'])
+
+    def venue_done(venue: Dict, result: Tuple, seconds: float) -> None:
+        """Record duration and checkpoint a successful venue as soon as it completes"""
+        durations.setdefault(venue['nazev'], seconds)
+        events, validation, error = result
         if error is None and validation:
-            successful_venues.append({
-                'venue': venue['nazev'],
-                'city': venue['mesto'],
-                'events': events,
-                'validation': validation
-            })
-        else:
-            failed_venues.append((venue, error))
-
-    # Second pass: retry failed venues
-    if failed_venues:
-        logger.info(f"\nRetrying {len(failed_venues)} failed venues...")
-
-        for venue, first_error in failed_venues:
-            logger.info(f"Retry: {venue['nazev']}")
-            events, validation, error = scrape_venue(venue, month, year)
-
+            checkpoint.save(venue['nazev'], events, validation)
+
+    # Horizon mode (--months N): extra months are collected as venue blocks per month
+    horizon = horizon_months(month, year, args.months) if args.months > 1 else None
+    horizon_blocks: Dict[Tuple[int, int], List[Dict]] = defaultdict(list)
+
+    def collect(venue: Dict, month_year: Tuple[int, int], events: List[Dict], validation: Dict) -> None:
+        horizon_blocks[month_year].append({
+            'venue': venue['nazev'],
+            'city': venue['mesto'],
+            'events': events,
+            'validation': validation
+        })
+
+    # Fetch/parse pipeline (--parse-processes N): worker threads only fetch, parsing runs in processes
+    pipelined = args.parse_processes > 0 and args.engine == 'sync' and horizon is None
+    if args.parse_processes > 0 and not pipelined:
+        logger.warning("--parse-processes platí jen pro --engine sync bez --months, parsuje se ve vlákně")
+    parse_pool = retry_pool = None
+
+    # Run deadline (--deadline): per-venue budgets, low-priority venues skipped when time runs out
+    parallelism = args.concurrency if args.engine == 'async' else args.workers
+    deadline = RunDeadline(args.deadline, pending_venues, parallelism) if args.deadline else None
+
+    def venue_budget(venue: Dict) -> Optional[float]:
+        """Time budget of a venue starting now; raises VenueSkipped if the deadline does not allow it"""
+        if deadline is None:
+            return None
+        reason = deadline.admit(venue, expected_duration(venue))
+        if reason:
+            logger.warning(f"Přeskočeno {venue['nazev']}: {reason}")
+            raise VenueSkipped(reason)
+        return deadline.budget(venue)
+
+    def start_order(venue: Dict):
+        if deadline is None:
+            return expected_duration(venue)
+        return venue_priority(venue), expected_duration(venue)
+
+    def timed_scrape(venue: Dict):
+        start = time.monotonic()
+        try:
+            budget = venue_budget(venue)
+        except VenueSkipped as e:
+            result = ([], None, e)
+            if parse_pool is not None:
+                skipped: Future = Future()
+                skipped.set_result(result)
+                return skipped
+            return result
+        if parse_pool is not None:
+            return scrape_venue_pipelined(venue, month, year, parse_pool, retry_pool,
+                                          on_done=lambda result: venue_done(venue, result, time.monotonic() - start),
+                                          budget=budget)
+        result = scrape_venue(venue, month, year, horizon, collect, budget)
+        venue_done(venue, result, time.monotonic() - start)
+        return result
+
+    def run_pass(venues: List[Dict]) -> List[Tuple]:
+        """Scrape venues with the selected engine (results in venue order)"""
+        if not venues:
+            return []
+        if args.engine == 'async':
+            return asyncio.run(scrape_venues_async(venues, month, year, concurrency=args.concurrency,
+                                                   per_host_limit=args.per_host,
+                                                   fresh_profile=args.fresh_profile,
+                                                   priority=start_order, on_done=venue_done,
+                                                   horizon=horizon, collect=collect, budget=venue_budget))
+        results = scheduler.run(venues, timed_scrape, priority=start_order)
+        if parse_pool is not None:
+            results = [future.result() for future in results]
+        return results
+
+    predicted_makespan = predict_makespan([expected_duration(v) for v in pending_venues], parallelism)
+
+    # Sequential runs share one browser for the whole run; second attempts after
+    # failed worker parses run on their own threads (one-off browsers)
+    with (worker_setup() if args.workers == 1 and args.engine == 'sync' else nullcontext()), \
+            (ThreadPoolExecutor(max_workers=args.workers, thread_name_prefix='parse-retry')
+             if pipelined else nullcontext()) as retry_pool, \
+            (ParsePool(args.parse_processes) if pipelined else nullcontext()) as parse_pool:
+        # Scrape all venues not restored from the checkpoint; second attempts
+        # happen per venue right away (hedged for slow venues, see BrowserScraper.HEDGE)
+        successful_venues = []
+        failed_venues = []
+        skipped_venues = []
+
+        pass_start = time.monotonic()
+        results = dict(zip((venue['nazev'] for venue in pending_venues), run_pass(pending_venues)))
+        actual_makespan = time.monotonic() - pass_start
+
+        # Assemble in config order
+        for venue in venues:
+            if venue['nazev'] in completed:
+                events, validation = completed[venue['nazev']]
+                error = None
+            else:
+                events, validation, error = results[venue['nazev']]
             if error is None and validation:
                 successful_venues.append({
                     'venue': venue['nazev'],
@@ -385,17 +738,30 @@ def main():
                     'events': events,
                     'validation': validation
                 })
-                logger.info(f"  Success on retry!")
+            elif isinstance(error, VenueSkipped):
+                skipped_venues.append(venue['nazev'])
             else:
-                logger.error(f"  Failed twice: {venue['nazev']} - {error}")
+                failed_venues.append((venue, error))
+
+        for venue, error in failed_venues:
+            logger.error(f"Failed: {venue['nazev']} - {error}")
+
+    close_session()
+    watchdog.report_leaks()
+    history.record(durations)
 
     # Summary
     total_events = sum(v['validation']['total_events'] for v in successful_venues)
-    logger.info(f"\nÚspěšné venues: {len(successful_venues)}/{len(config['kluby'])}")
+    logger.info(f"\nÚspěšné venues: {len(successful_venues)}/{len(venues)}")
     logger.info(f"Celkem eventů: {total_events}")
+    if skipped_venues:
+        logger.warning(f"Přeskočeno kvůli deadline: {len(skipped_venues)} venues "
+                       f"(doběhnou s --resume)")
+    logger.info(f"Makespan běhu: odhad {predicted_makespan:.0f} s, skutečnost {actual_makespan:.0f} s "
+                f"({parallelism} paralelně)")
 
     # Validation report + interactive confirmation
-    red_venues = print_validation_report(successful_venues, config['kluby'])
+    red_venues = print_validation_report(successful_venues, config['kluby'], skipped_venues)
 
     if red_venues and not args.force:
         answer = input("Pokračovat a uložit events_data.json i přes chybějící data? [y/N]: ").strip().lower()
@@ -412,10 +778,39 @@ def main():
         'venues': successful_venues
     }
 
-    with open('events_data.json', 'w', encoding='utf-8') as f:
-        json.dump(all_events, f, ensure_ascii=False, indent=2)
+    if selective:
+        try:
+            with open('events_data.json', 'r', encoding='utf-8') as f:
+                existing = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.error(f"Nelze načíst events_data.json pro sloučení ({e}). Spusť nejdřív celý běh.")
+            return
+        if (existing.get('month'), existing.get('year')) != (month, year):
+            logger.error(f"events_data.json je za {existing.get('month')}/{existing.get('year')}, "
+                         f"ne {month}/{year} - sloučení přeskočeno.")
+            return
+        all_events = merge_venue_results(existing, successful_venues, config['kluby'])
+        logger.info(f"Sloučeno {len(successful_venues)} venues, celkem {all_events['total_events']} eventů")
+
+    # Partial result of a run cut short by --deadline
+    set_skipped_venues(all_events, skipped_venues)
+
+    # Atomic write: an interrupted save never leaves a truncated file
+    atomic_write_json('events_data.json', all_events)
 
     logger.info("\n✅ Uloženo do events_data.json")
+
+    # Horizon mode: one file per month, the target month included. Selective
+    # and resumed runs merge into the existing files like events_data.json
+    # (checkpoint-restored venues carry no extra months)
+    if horizon:
+        horizon_blocks[(month, year)] = all_events['venues']
+        for m, y in horizon:
+            filename = f"events_data_{y}_{m:02d}.json"
+            existing = load_events_file(filename) if selective or args.resume else None
+            data = horizon_month_data(m, y, horizon_blocks.get((m, y), []), config['kluby'], existing)
+            atomic_write_json(filename, data)
+            logger.info(f"✅ Uloženo do {filename} ({len(data['venues'])} venues)")
     logger.info("Spusť python generate_html.py pro vygenerování HTML.")
 
 
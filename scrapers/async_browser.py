@@ -0,0 +1,342 @@
+"""
+Async Browser Engine
+====================
+Runs BrowserScraper fetches concurrently on one asyncio event loop with
+playwright.async_api: one shared Chromium, many pages in flight at once
+(bounded by max_concurrent_pages).
+
+Scrapers are not rewritten for it. AsyncBrowserScraper reads the declarative
+fetch settings of a BrowserScraper (WAIT_SELECTOR, READY_SELECTOR, WAIT_UNTIL,
+FETCH_TIMEOUT, SETTLE_MS, EXTRACT_SELECTOR, JSON_API_PATTERN) and performs the
+fetch asynchronously; parse_html()/parse_events()/parse_json() stay plain CPU
+steps on the scraper and run in a worker thread so they do not stall the loop.
+Blocking pieces without an async equivalent - the HTTP tier (requests),
+scrapers with a custom fetch_with_browser() (MeetFactory scrolling) and
+non-browser scrapers - run through asyncio.to_thread on the sync API.
+
+Second attempts follow BaseScraper.scrape_with_retry(): immediately after a
+failure, or - for venues with HEDGE - raced against a first attempt that is
+slower than usual, the losing task being cancelled (its page closed).
+
+The sync API (BrowserScraper.scrape, browser_session) is unchanged and stays
+the default engine.
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from playwright.async_api import TimeoutError as PlaywrightTimeout, async_playwright
+
+from .browser_pool import profile_path
+from .browser_scraper import BrowserScraper, record_fetch_tier, record_json_endpoints
+from .json_capture import JsonCapture
+from .page_extract import EXTRACT_JS
+from .readiness import READY_PREDICATE_JS
+from .resource_filter import ResourceFilter
+from .state_store import atomic_write_json
+from .watchdog import get_watchdog
+
+
+DEFAULT_CONCURRENCY = 8
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBrowserPool:
+    """
+    One Chromium browser shared by all pages on the event loop
+
+    Args:
+        headless: Run browser in background
+        max_concurrent_pages: Upper bound of simultaneously open pages
+        fresh_profile: Ignore venue profiles saved by earlier runs (see browser_pool)
+    """
+
+    def __init__(self, headless: bool = True, max_concurrent_pages: int = DEFAULT_CONCURRENCY,
+                 fresh_profile: bool = False):
+        self.headless = headless
+        self.fresh_profile = fresh_profile
+        self.pages_served = 0
+        self._slots = asyncio.Semaphore(max(1, max_concurrent_pages))
+        self._profiles_saved = set()
+        self._playwright = None
+        self._browser = None
+        self._browser_pid: Optional[int] = None
+
+    async def __aenter__(self) -> 'AsyncBrowserPool':
+        self._playwright = await async_playwright().start()
+        # Tracked for the end-of-run leak report; hung pages are cancelled per venue
+        # instead (time budget, page_cap)
+        with get_watchdog().launching('async') as pids:
+            self._browser = await self._playwright.chromium.launch(headless=self.headless)
+        self._browser_pid = pids[0] if pids else None
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        try:
+            await self._browser.close()
+        finally:
+            get_watchdog().forget_browser(self._browser_pid)
+            await self._playwright.stop()
+        logger.info(f"Async browser pool closed: {self.pages_served} pages")
+
+    @asynccontextmanager
+    async def page(self, profile: Optional[str] = None) -> AsyncIterator:
+        """
+        Borrow a page in a fresh browser context (waits for a free slot)
+
+        Args:
+            profile: Venue profile name; saved cookies / localStorage are
+                loaded and saved back if the block succeeds
+        """
+        async with self._slots:
+            state_file = profile_path(profile) if profile else None
+            reuse = state_file is not None and (not self.fresh_profile or state_file in self._profiles_saved)
+            if reuse and state_file.exists():
+                context = await self._browser.new_context(storage_state=str(state_file))
+            else:
+                context = await self._browser.new_context()
+            try:
+                yield await context.new_page()
+                if state_file:
+                    try:
+                        atomic_write_json(state_file, await context.storage_state())
+                        self._profiles_saved.add(state_file)
+                    except Exception as e:
+                        logger.debug(f"Failed to save profile {state_file}: {e}")
+            finally:
+                try:
+                    await context.close()
+                except Exception as e:
+                    logger.debug(f"Failed to close browser context: {e}")
+                self.pages_served += 1
+
+
+async def wait_until_ready_async(page, selector: Optional[str] = None, min_count: Optional[int] = None,
+                                 quiet_ms: Optional[int] = 500, max_wait_ms: int = 3000) -> bool:
+    """readiness.wait_until_ready() for async pages"""
+    try:
+        await page.wait_for_function(
+            READY_PREDICATE_JS,
+            arg=[selector, min_count or 0, quiet_ms],
+            timeout=max_wait_ms,
+            polling=100,
+        )
+        return True
+    except PlaywrightTimeout:
+        return False
+
+
+class AsyncBrowserScraper:
+    """
+    Async fetch driver for one BrowserScraper
+
+    Args:
+        scraper: Configured BrowserScraper instance (provides settings and parsers)
+        pool: Shared AsyncBrowserPool
+    """
+
+    def __init__(self, scraper: BrowserScraper, pool: AsyncBrowserPool):
+        self.scraper = scraper
+        self.pool = pool
+
+    @property
+    def has_custom_fetch(self) -> bool:
+        """True if the scraper overrides fetch_with_browser() (no async equivalent)"""
+        return type(self.scraper).fetch_with_browser is not BrowserScraper.fetch_with_browser
+
+    async def scrape_with_retry(self) -> List[Dict]:
+        """BrowserScraper.scrape_with_retry() with both attempts on the event loop"""
+        s = self.scraper
+        if self.has_custom_fetch:
+            return await asyncio.to_thread(s.scrape_with_retry)
+
+        primary = asyncio.create_task(self.scrape())
+        if s.hedged:
+            delay = s.hedge_delay()
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if not done:
+                s.logger.info(f"No result after {delay:.1f} s, starting hedged attempt")
+                other = s.fresh_attempt()
+                hedge = asyncio.create_task(AsyncBrowserScraper(other, self.pool).scrape())
+                return await self._race({primary: s, hedge: other})
+
+        try:
+            return await primary
+        except Exception as e:
+            if s.budget_exhausted():
+                raise
+            s.logger.warning(f"Scrape failed ({e}), retrying once")
+        other = s.fresh_attempt()
+        await AsyncBrowserScraper(other, self.pool).scrape()
+        s.adopt(other)
+        return s.events
+
+    async def _race(self, attempts: Dict[asyncio.Task, BrowserScraper]) -> List[Dict]:
+        """First attempt returning events wins, the others are cancelled"""
+        s = self.scraper
+        pending = dict(attempts)
+        errors = []
+        empty = False
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                attempt = pending.pop(task)
+                if task.exception() is not None:
+                    errors.append(task.exception())
+                elif not task.result():
+                    empty = True
+                else:
+                    for loser in pending:
+                        loser.cancel()
+                    if attempt is not s:
+                        s.logger.info("Hedged attempt won, first one cancelled")
+                        s.adopt(attempt)
+                        return s.events
+                    return task.result()
+        if empty or not errors:
+            return []
+        raise errors[0]
+
+    async def scrape(self) -> List[Dict]:
+        """Tiered scrape like BrowserScraper.scrape(), with the browser tier on the event loop"""
+        s = self.scraper
+        if self.has_custom_fetch:
+            return await asyncio.to_thread(s.scrape)
+
+        s.logger.info(f"Scraping {s.venue_name} for {s.month:02d}/{s.year} (async)...")
+
+        http_tried = s.should_try_http()
+        if http_tried:
+            events = await asyncio.to_thread(s.scrape_http_tier)
+            if events is not None:
+                s.fetch_tier = 'http'
+                record_fetch_tier(s.venue_name, 'http')
+                return events
+
+        events = await self.scrape_via_browser()
+        s.fetch_tier = 'browser'
+        if http_tried:
+            record_fetch_tier(s.venue_name, 'browser')
+        return events
+
+    async def scrape_via_browser(self) -> List[Dict]:
+        """
+        Browser tier: captured JSON if declared, else the (extracted) DOM
+
+        The page is closed and the attempt fails when it is held past the
+        watchdog's page_cap (--page-cap). The sync engine's watchdog lease
+        would kill the browser, which here is shared by all venues.
+        """
+        s = self.scraper
+        page_cap = get_watchdog().page_cap
+        try:
+            kind, data = await asyncio.wait_for(self._fetch_page(), timeout=page_cap)
+        except PlaywrightTimeout as e:
+            raise Exception(f"Timeout fetching {s.url}: {e}")
+        except asyncio.TimeoutError:
+            raise Exception(f"Page for {s.url} held past the {page_cap:.0f} s page cap") from None
+
+        if kind == 'events':
+            return data
+        return await asyncio.to_thread(s.parse, data)
+
+    async def _fetch_page(self) -> Tuple[str, Any]:
+        """Page stage of scrape_via_browser(): ('events', events) from captured JSON or ('html', html)"""
+        s = self.scraper
+        capture = JsonCapture(s.JSON_API_PATTERN) if s.JSON_API_PATTERN else None
+        profile = s.venue_name if s.venue_config.get('persistent_profile', True) else None
+
+        async with self.pool.page(profile) as page:
+            resource_filter = ResourceFilter.for_venue(s.url, s.venue_config)
+            if resource_filter:
+                await resource_filter.install_async(page)
+            if capture:
+                capture.install(page)
+
+            s.logger.info(f"Opening async page for {s.url}")
+            with s.measure('navigation'):
+                await page.goto(s.url, wait_until=s.WAIT_UNTIL, timeout=s.fetch_timeout('navigation'))
+
+            if capture:
+                events = await self._events_from_capture(page, capture)
+                if events:
+                    return 'events', events
+
+            if s.WAIT_SELECTOR:
+                with s.measure('selector'):
+                    await page.wait_for_selector(s.WAIT_SELECTOR, timeout=s.fetch_timeout('selector'))
+            else:
+                await wait_until_ready_async(page, s.READY_SELECTOR, max_wait_ms=s.SETTLE_MS)
+            html = await self._page_html(page)
+
+            if resource_filter:
+                s.logger.info(f"Resource filter: {resource_filter.summary()}")
+        return 'html', html
+
+    async def _events_from_capture(self, page, capture: JsonCapture) -> List[Dict]:
+        s = self.scraper
+        if not capture.responses:
+            try:
+                await page.wait_for_response(lambda r: capture.matches(r.url), timeout=s.SETTLE_MS)
+            except PlaywrightTimeout:
+                pass
+
+        payloads = []
+        for response in capture.responses:
+            try:
+                payloads.append((response.url, await response.json()))
+            except Exception as e:
+                logger.debug(f"Skipping non-JSON response {response.url}: {e}")
+
+        events = s.parse_json(payloads) if payloads else []
+        if events:
+            s.logger.info(f"Captured {len(payloads)} JSON responses, {len(events)} events")
+            record_json_endpoints(s.venue_name, [url for url, _ in payloads])
+        else:
+            s.logger.info(f"No events in {len(payloads)} captured JSON responses, parsing DOM")
+        return events
+
+    async def _page_html(self, page) -> str:
+        """BrowserScraper.page_html() for async pages"""
+        s = self.scraper
+        if s.EXTRACT_SELECTOR:
+            result = await page.evaluate(EXTRACT_JS, list(s.extract_args()))
+            if result['count']:
+                return f"<html><body>\n{result['html']}\n</body></html>"
+        return await page.content()
+
+
+async def scrape_async(scraper, pool: AsyncBrowserPool) -> List[Dict]:
+    """
+    Scrape with the async engine
+
+    BrowserScrapers get the async fetch driver, other scrapers (static HTML)
+    run their sync scrape_with_retry() in a worker thread.
+    """
+    if isinstance(scraper, BrowserScraper):
+        return await AsyncBrowserScraper(scraper, pool).scrape_with_retry()
+    return await asyncio.to_thread(scraper.scrape_with_retry)
+
+
+async def scrape_horizon_async(scraper, pool: AsyncBrowserPool,
+                               months: List[Tuple[int, int]]) -> Dict[Tuple[int, int], object]:
+    """BrowserScraper.scrape_horizon() with the fetches on the event loop"""
+    if not isinstance(scraper, BrowserScraper):
+        return await asyncio.to_thread(scraper.scrape_horizon, months)
+
+    scraper.horizon = list(months)
+    await scrape_async(scraper, pool)
+
+    results = {(scraper.month, scraper.year): scraper}
+    for month, year in months:
+        if (month, year) in results or scraper.leaves_out(month, year):
+            continue
+        other = scraper.reparse_for_month(month, year)
+        if other is None:
+            other = scraper.for_month(month, year)
+            await scrape_async(other, pool)
+        results[(month, year)] = other
+    return results
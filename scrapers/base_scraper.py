@@ -8,9 +8,15 @@ import calendar
 import time
 import requests
 from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+from urllib.parse import urlparse
 import logging
 
+from . import http_session
+from .classifier import Classifier, get_classifier
+from .html_parser import BACKENDS, DEFAULT_BACKEND, parse_document, strainer
+from .structured_data import events_from_structured_data
+
 
 class ScraperError(Exception):
     """Raised when scraping fails for a known reason (parsing, no data, etc.)"""
@@ -22,6 +28,11 @@ class NetworkError(ScraperError):
     pass
 
 
+class AttemptCancelled(ScraperError):
+    """Raised when an attempt stops because another attempt at the venue won (hedging)"""
+    pass
+
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -32,6 +43,28 @@ logging.basicConfig(
 class BaseScraper:
     """Base class for all venue scrapers"""
 
+    # HTML tree backend of make_soup(): 'lxml' or 'bs4' (see html_parser;
+    # kluby.json "parser" overrides)
+    PARSER_BACKEND = DEFAULT_BACKEND
+    # Elements the parser reads, as a simple CSS selector (tag.class[attr]);
+    # make_soup() then builds only their subtrees (see html_parser)
+    TARGETS: Optional[str] = None
+    # Event categories (sport/theatre/other, see classifier) whose events
+    # filter_categories() drops, and the venue's keywords per category
+    # (kluby.json "kategorie" adds more)
+    SKIP_CATEGORIES: Tuple[str, ...] = ()
+    CATEGORY_KEYWORDS: Dict[str, Tuple[str, ...]] = {}
+    # Read schema.org Event data (JSON-LD, microdata) instead of running the
+    # venue parser (see parse_structured_data(); kluby.json "structured_data"
+    # overrides). Opt-in: only the category filter is applied to those events,
+    # so enable it only where they match the venue parser's
+    STRUCTURED_DATA = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.TARGETS:
+            strainer(cls.TARGETS)  # reject unsupported selectors at import
+
     def __init__(self, venue_name: str, url: str, city: str, month: int, year: int):
         """
         Args:
@@ -47,12 +80,188 @@ class BaseScraper:
         self.month = month
         self.year = year
         self.events: List[Dict] = []
+        self.venue_config: Dict = {}
+        self.budget_ends: Optional[float] = None  # time.monotonic() limit, see set_budget()
+        self.parser_override: Optional[str] = None  # backend forced after a failed parse
         self.logger = logging.getLogger(f"scraper.{venue_name}")
 
+    def configure(self, venue_config: Dict) -> None:
+        """
+        Attach the venue's kluby.json entry (optional per-venue settings)
+
+        Args:
+            venue_config: Venue configuration dict from kluby.json
+        """
+        self.venue_config = venue_config or {}
+        if self.venue_config.get('http_pool_size'):
+            http_session.mount_host_pool(urlparse(self.url).netloc, self.venue_config['http_pool_size'])
+
+    def set_budget(self, seconds: Optional[float]) -> None:
+        """
+        Limit this scrape to a wall-time budget (run deadline, see deadline.py)
+
+        Network and page timeouts are capped by what is left of it.
+
+        Args:
+            seconds: Budget in seconds from now, None = unlimited
+        """
+        self.budget_ends = None if seconds is None else time.monotonic() + seconds
+
+    def budget_exhausted(self) -> bool:
+        """True if a time budget is set and used up"""
+        left = self.budget_left()
+        return left is not None and left <= 0
+
+    def budget_left(self) -> Optional[float]:
+        """Seconds left of the time budget (None without a budget)"""
+        if self.budget_ends is None:
+            return None
+        return max(0.0, self.budget_ends - time.monotonic())
+
+    @property
+    def parser_backend(self) -> str:
+        """Backend make_soup() uses for this venue"""
+        backend = self.parser_override or self.venue_config.get('parser') or self.PARSER_BACKEND
+        if backend not in BACKENDS:
+            self.logger.warning(f"Unknown parser backend {backend!r}, using {DEFAULT_BACKEND}")
+            return DEFAULT_BACKEND
+        return backend
+
+    def make_soup(self, html: str, strain: bool = True):
+        """
+        Parse HTML into a BeautifulSoup-compatible tree with the venue's backend
+
+        Args:
+            html: HTML document or fragment
+            strain: Keep only the TARGETS subtrees (False for other fragments)
+
+        Returns:
+            LxmlNode ('lxml') or BeautifulSoup ('bs4') document root
+        """
+        return parse_document(html, self.parser_backend, self.TARGETS if strain else None)
+
+    @property
+    def classifier(self) -> Classifier:
+        """Event classifier with this venue's keywords (compiled once, shared)"""
+        keywords = {category: list(words) for category, words in self.CATEGORY_KEYWORDS.items()}
+        for category, words in self.venue_config.get('kategorie', {}).items():
+            keywords.setdefault(category, []).extend(words)
+        return get_classifier(keywords)
+
+    def filter_categories(self, events: List[Dict]) -> List[Dict]:
+        """
+        Drop events whose artist is classified into one of SKIP_CATEGORIES
+
+        All artists are classified in one batch.
+
+        Args:
+            events: Parsed event dictionaries
+
+        Returns:
+            The kept events, in order
+        """
+        if not self.SKIP_CATEGORIES:
+            return events
+        labels = self.classifier.classify_batch([event['artist'] for event in events])
+        kept = []
+        for event, label in zip(events, labels):
+            if label.category in self.SKIP_CATEGORIES:
+                self.logger.debug(f"Skipping {label.category} event: {event['artist']} ('{label.rule}')")
+            else:
+                kept.append(event)
+        return kept
+
+    def parse_structured_data(self, html: str) -> Optional[List[Dict]]:
+        """
+        Fast path before the venue parser: events from the page's schema.org
+        Event data (see structured_data), category filter applied
+
+        Returns:
+            Events if at least max(1, min_akci) were found, None if the venue
+            parser is needed
+        """
+        if not self.venue_config.get('structured_data', self.STRUCTURED_DATA):
+            return None
+        events = self.filter_categories(events_from_structured_data(
+            html, self.url, self.venue_name, self.city, self.month, self.year))
+        min_events = max(1, self.venue_config.get('min_akci', 1))
+        if len(events) < min_events:
+            if events:
+                self.logger.debug(f"Structured data: only {len(events)} events (need {min_events}), using venue parser")
+            return None
+
+        self.logger.info(f"Structured data: {len(events)} events, venue parser skipped")
+        return events
+
+    def for_month(self, month: int, year: int) -> 'BaseScraper':
+        """New scraper of the same class and configuration for another month"""
+        other = type(self)(month=month, year=year)
+        other.configure(self.venue_config)
+        return other
+
+    def fresh_attempt(self) -> 'BaseScraper':
+        """New scraper for another attempt at the same venue and month (same budget)"""
+        other = self.for_month(self.month, self.year)
+        other.budget_ends = self.budget_ends
+        return other
+
+    def adopt(self, other: 'BaseScraper') -> None:
+        """Take over the results of another attempt at the same venue and month"""
+        self.events = other.events
+
+    def scrape_with_retry(self) -> List[Dict]:
+        """
+        scrape() with one immediate second attempt on a fresh scraper
+
+        Skipped when the time budget is used up. BrowserScraper may start the
+        second attempt early instead (hedging).
+
+        Returns:
+            List of event dictionaries
+        """
+        try:
+            return self.scrape()
+        except Exception as e:
+            if self.budget_exhausted():
+                raise
+            self.logger.warning(f"Scrape failed ({e}), retrying once")
+        return self.second_attempt()
+
+    def second_attempt(self) -> List[Dict]:
+        """Scrape on a fresh scraper and take over its results"""
+        other = self.fresh_attempt()
+        other.scrape()
+        self.adopt(other)
+        return self.events
+
+    def scrape_horizon(self, months: List[Tuple[int, int]]) -> Dict[Tuple[int, int], 'BaseScraper']:
+        """
+        Scrape several months (horizon mode)
+
+        Default: one scrape per month; repeated GETs of the same listing are
+        served by the HTTP cache (see http_session). BrowserScraper fetches
+        the page once and re-parses it per month.
+
+        Args:
+            months: (month, year) pairs, starting with this scraper's month
+
+        Returns:
+            (month, year) -> scraper holding that month's events (self for its own month)
+        """
+        results = {}
+        for month, year in months:
+            scraper = self if (month, year) == (self.month, self.year) else self.for_month(month, year)
+            scraper.scrape_with_retry()
+            results[(month, year)] = scraper
+        return results
+
     def fetch_html(self, url: Optional[str] = None, timeout: int = 10) -> str:
         """
         Fetch HTML from URL
 
+        Uses the shared keep-alive session (see http_session) with the
+        venue's cache TTL ("cache_ttl" in kluby.json).
+
         Args:
             url: URL to fetch (defaults to self.url)
             timeout: Request timeout in seconds
@@ -64,14 +273,14 @@ class BaseScraper:
             Exception: If request fails
         """
         target_url = url or self.url
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
+        left = self.budget_left()
+        if left is not None:
+            timeout = max(1, min(timeout, left))
 
         try:
             self.logger.info(f"Fetching {target_url}")
-            response = requests.get(target_url, headers=headers, timeout=timeout)
-            response.raise_for_status()
+            response = http_session.fetch(target_url, timeout=timeout,
+                                          cache_ttl=self.venue_config.get('cache_ttl'))
             return response.text
         except requests.Timeout as e:
             raise NetworkError(f"Timeout fetching {target_url}") from e
@@ -0,0 +1,211 @@
+"""
+Browser Pool
+============
+Shares one Chromium process between all BrowserScraper fetches of a run.
+
+Playwright's sync API is bound to the thread that started it, so every
+worker thread owns its own pool (see browser_session). Each venue borrows a
+page from a fresh, isolated browser context - cookies and storage never leak
+between venues - and the browser is relaunched after max_pages pages to keep
+memory bounded.
+
+Venue profiles: a context can be seeded from the venue's saved storage state
+(cookies + localStorage, i.e. accepted consent banners) under
+scraper_state/profiles/ and saves it back after a successful page. Profiles
+stay per venue; fresh_profile=True ignores the saved state for a run.
+Chromium's HTTP cache is not persisted: Playwright disables it for routed
+pages anyway (resource_filter), and a persistent user-data-dir would mean a
+browser process per venue instead of one shared browser.
+
+Every launched browser and borrowed page is registered with the run's
+watchdog, which kills the browser of a page hanging past its wall-clock cap
+(see watchdog).
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+from playwright.sync_api import sync_playwright
+
+from .state_store import STATE_DIR, atomic_write_json, slugify
+from .watchdog import get_watchdog
+
+
+DEFAULT_MAX_PAGES = 20
+PROFILE_DIR = STATE_DIR / 'profiles'
+
+logger = logging.getLogger(__name__)
+_local = threading.local()
+
+
+def profile_path(profile: str) -> Path:
+    """Storage state file of a venue profile ('Palác Akropolis' -> profiles/palac-akropolis.json)"""
+    return PROFILE_DIR / f"{slugify(profile)}.json"
+
+
+class BrowserPool:
+    """
+    One lazily launched Chromium browser, handing out one context per page
+
+    Args:
+        headless: Run browser in background
+        max_pages: Relaunch the browser after this many pages (memory bound)
+        fresh_profile: Ignore venue profiles saved by earlier runs (they are
+            still re-saved, and reused within this pool)
+    """
+
+    def __init__(self, headless: bool = True, max_pages: int = DEFAULT_MAX_PAGES,
+                 fresh_profile: bool = False):
+        self.headless = headless
+        self.max_pages = max(1, max_pages)
+        self.fresh_profile = fresh_profile
+        self.profiles_loaded = 0
+        self._profiles_saved = set()
+        self.pages_served = 0
+        self.launches = 0
+        self._pages_since_launch = 0
+        self._playwright = None
+        self._browser = None
+        self._browser_pid: Optional[int] = None
+
+    def _ensure_browser(self):
+        """Start Playwright / launch Chromium on first use or after recycling"""
+        if self._playwright is None:
+            self._playwright = sync_playwright().start()
+        if self._browser is None or not self._browser.is_connected():
+            get_watchdog().forget_browser(self._browser_pid)
+            with get_watchdog().launching(threading.current_thread().name) as pids:
+                self._browser = self._playwright.chromium.launch(headless=self.headless)
+            self._browser_pid = pids[0] if pids else None
+            self._pages_since_launch = 0
+            self.launches += 1
+            logger.debug(f"Launched Chromium (launch #{self.launches})")
+        return self._browser
+
+    def _close_browser(self) -> None:
+        if self._browser is not None:
+            try:
+                self._browser.close()
+            except Exception as e:
+                logger.warning(f"Failed to close browser: {e}")
+            self._browser = None
+            get_watchdog().forget_browser(self._browser_pid)
+            self._browser_pid = None
+
+    @contextmanager
+    def page(self, profile: Optional[str] = None, limit: Optional[float] = None) -> Iterator:
+        """
+        Borrow a page in a fresh browser context
+
+        The context (and with it the page) is closed when the block exits,
+        also on errors, so a failed venue cannot leak tabs.
+
+        Args:
+            profile: Venue profile name; its saved cookies / localStorage are
+                loaded into the context and saved back if the block succeeds
+            limit: Wall-clock cap in seconds for the block (default: the
+                watchdog's page_cap); past it the browser is killed
+        """
+        browser = self._ensure_browser()
+        state_file = profile_path(profile) if profile else None
+        reuse = state_file is not None and (not self.fresh_profile or state_file in self._profiles_saved)
+        if reuse and state_file.exists():
+            context = browser.new_context(storage_state=str(state_file))
+            self.profiles_loaded += 1
+        else:
+            context = browser.new_context()
+        try:
+            with get_watchdog().lease(self._browser_pid, profile or 'page', limit):
+                yield context.new_page()
+            if state_file:
+                try:
+                    atomic_write_json(state_file, context.storage_state())
+                    self._profiles_saved.add(state_file)
+                except Exception as e:
+                    logger.debug(f"Failed to save profile {state_file}: {e}")
+        finally:
+            try:
+                context.close()
+            except Exception as e:
+                logger.debug(f"Failed to close browser context: {e}")
+            self.pages_served += 1
+            self._pages_since_launch += 1
+            if self._pages_since_launch >= self.max_pages:
+                logger.debug(f"Recycling browser after {self._pages_since_launch} pages")
+                self._close_browser()
+
+    def close(self) -> None:
+        """Close the browser and stop Playwright"""
+        self._close_browser()
+        if self._playwright is not None:
+            try:
+                self._playwright.stop()
+            except Exception as e:
+                logger.warning(f"Failed to stop Playwright: {e}")
+            self._playwright = None
+
+    def __enter__(self) -> 'BrowserPool':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def active_pool() -> Optional[BrowserPool]:
+    """Return the pool activated for the current thread, if any"""
+    return getattr(_local, 'pool', None)
+
+
+@contextmanager
+def browser_session(headless: bool = True, max_pages: int = DEFAULT_MAX_PAGES,
+                    fresh_profile: bool = False) -> Iterator[BrowserPool]:
+    """
+    Activate a shared browser pool for the current thread
+
+    Nested sessions reuse the outer pool, so wrapping a whole run in one
+    session keeps a single browser across the first pass and the retry pass
+    (which then also starts from the profiles saved in the first pass).
+    """
+    pool = active_pool()
+    if pool is not None:
+        yield pool
+        return
+
+    pool = BrowserPool(headless=headless, max_pages=max_pages, fresh_profile=fresh_profile)
+    _local.pool = pool
+    try:
+        yield pool
+    finally:
+        _local.pool = None
+        if pool.pages_served:
+            logger.info(f"Browser pool closed: {pool.pages_served} pages, {pool.launches} browser launches, "
+                        f"{pool.profiles_loaded} saved profiles reused")
+        pool.close()
+
+
+@contextmanager
+def borrow_page(headless: bool = True, profile: Optional[str] = None,
+                limit: Optional[float] = None) -> Iterator:
+    """
+    Borrow a page from the thread's pool
+
+    Outside a browser_session (single scraper runs, tests) a one-off browser
+    is launched and closed again, which matches the old behaviour.
+
+    Args:
+        headless: Run browser in background (one-off browsers only)
+        profile: Venue profile name (see BrowserPool.page)
+        limit: Wall-clock cap in seconds (see BrowserPool.page)
+    """
+    pool = active_pool()
+    if pool is not None:
+        with pool.page(profile, limit) as page:
+            yield page
+        return
+
+    with BrowserPool(headless=headless, max_pages=1) as one_off:
+        with one_off.page(profile, limit) as page:
+            yield page
@@ -4,32 +4,126 @@ Browser-Based Scraper
 Uses Playwright for JavaScript-heavy sites (automatic browser automation).
 """
 
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
-from bs4 import BeautifulSoup
+from playwright.sync_api import TimeoutError as PlaywrightTimeout
+import json
 import re
-from typing import List, Dict, Optional
-from .base_scraper import BaseScraper
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, timedelta
+from typing import Any, List, Dict, Optional, Tuple
+from .base_scraper import AttemptCancelled, BaseScraper, NetworkError
+from .browser_pool import borrow_page
+from .date_extract import (CZECH_MONTH_NAME, CZECH_WEEKDAY, DAY_NUMBER, DM, DM_TIME, DMY, DMY_DASHED,
+                           ISO, MONTH_DAY, SLASH_DM, START_TIME, TIME, TIME_DOTTED, find_time,
+                           strip_weekday)
+from .html_parser import has_selector
+from .json_capture import JsonCapture, events_from_json
+from .latency import learned_timeout, record_latency, typical_latency
+from .page_extract import extract_html, fill_placeholders
+from .readiness import LAST_ITEM_PAST_MONTH_JS, scroll_until, wait_until_ready
+from .resource_filter import ResourceFilter
+from .state_store import load_state, slugify, update_state
+from .watchdog import get_watchdog
+
+
+# scraper_state/fetch_tiers.json: venue name -> {"tier": "http"|"browser", "checked": "YYYY-MM-DD"}
+FETCH_TIERS_STATE = 'fetch_tiers'
+# Venues recorded as browser-only get the HTTP tier re-probed after this long
+HTTP_RECHECK_DAYS = 30
+# scraper_state/json_endpoints.json: venue name -> JSON API URLs seen in the browser
+JSON_ENDPOINTS_STATE = 'json_endpoints'
+
+
+def record_fetch_tier(venue_name: str, tier: str) -> None:
+    """Remember which fetch tier produced valid events for a venue"""
+    def update(state: Dict) -> None:
+        state[venue_name] = {'tier': tier, 'checked': date.today().isoformat()}
+    update_state(FETCH_TIERS_STATE, update)
+
+
+def record_json_endpoints(venue_name: str, urls: List[str]) -> None:
+    """Remember JSON API URLs captured for a venue so later runs can GET them directly"""
+    def update(state: Dict) -> None:
+        state[venue_name] = {'urls': list(dict.fromkeys(urls)), 'checked': date.today().isoformat()}
+    update_state(JSON_ENDPOINTS_STATE, update)
+
+# Seconds a page may outlive the venue's time budget before the watchdog kills its browser
+HANG_GRACE = 30
+
+# GoOut venue pages load their event list from the schedules API
+GOOUT_SCHEDULES_API = r'goout\.net/services/.+/schedules'
 
 
 class BrowserScraper(BaseScraper):
     """
     Base class for scrapers that need browser automation
 
-    Uses Playwright to handle JavaScript-rendered content
+    Uses Playwright to handle JavaScript-rendered content. Subclasses
+    declare how their page is fetched via the class attributes below and
+    implement parse_html() (or parse_events()); scrape() ties both together.
     """
 
+    # Selector the browser waits for; the HTTP tier expects it in raw HTML.
+    # Defaults to TARGETS, as does EXTRACT_SELECTOR, so the elements waited
+    # for, serialized and parsed are one declaration
+    WAIT_SELECTOR: Optional[str] = None
+    # Event nodes to watch for readiness when there is no WAIT_SELECTOR
+    READY_SELECTOR: Optional[str] = None
+    # Playwright load state for page.goto
+    WAIT_UNTIL = 'networkidle'
+    # Navigation / selector timeout in milliseconds until the venue has a
+    # latency history (see latency.py; kluby.json "timeout_ms" overrides both)
+    FETCH_TIMEOUT = 30000
+    # Upper bound of the readiness wait when there is no WAIT_SELECTOR
+    SETTLE_MS = 3000
+    # Try a plain HTTP GET before launching the browser
+    HTTP_TIER = True
+    # Regex for JSON API responses carrying the listing (enables response capture)
+    JSON_API_PATTERN: Optional[str] = None
+    # Event containers to serialize instead of the whole page (see page_extract);
+    # both may use the {month}, {mm} and {year} placeholders
+    EXTRACT_SELECTOR: Optional[str] = None
+    EXTRACT_TEXT_PATTERN: Optional[str] = None
+    # Heavy tail latency: race a second attempt once the page is slower than
+    # usual (see scrape_with_retry; kluby.json "hedge" overrides)
+    HEDGE = False
+    # The parser filters by month, so one fetch can be re-parsed for the other
+    # horizon months; False for parsers that stamp every row with self.month
+    HORIZON_REPARSE = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if 'TARGETS' in cls.__dict__ and cls.TARGETS:
+            if 'WAIT_SELECTOR' not in cls.__dict__ and 'READY_SELECTOR' not in cls.__dict__:
+                cls.WAIT_SELECTOR = cls.TARGETS
+            if 'EXTRACT_SELECTOR' not in cls.__dict__:
+                cls.EXTRACT_SELECTOR = cls.TARGETS
+
     def __init__(self, venue_name: str, url: str, city: str, month: int, year: int):
         super().__init__(venue_name, url, city, month, year)
         self.headless = True  # Run browser in background
-
-    def fetch_html_with_browser(self, url: Optional[str] = None, wait_for_selector: Optional[str] = None, timeout: int = 30000) -> str:
+        self.fetch_tier: Optional[str] = None  # 'http' or 'browser' after scrape()
+        # Months the fetched page must cover (scrape_horizon); in-page filters use all of them
+        self.horizon: List[Tuple[int, int]] = [(month, year)]
+        # Last parsed source: ('html', html) or ('json', payloads), re-parsed per horizon month
+        self.source: Optional[Tuple[str, Any]] = None
+        # Set when the other attempt of a hedged scrape won (see scrape_with_retry())
+        self.cancelled = threading.Event()
+
+    def check_cancelled(self) -> None:
+        """Raise AttemptCancelled if another attempt at the venue already won"""
+        if self.cancelled.is_set():
+            raise AttemptCancelled(f"{self.venue_name}: attempt cancelled, another one won")
+
+    def fetch_html_with_browser(self, url: Optional[str] = None, wait_for_selector: Optional[str] = None, timeout: Optional[int] = None) -> str:
         """
         Fetch HTML using Playwright browser automation
 
         Args:
             url: URL to fetch (defaults to self.url)
             wait_for_selector: CSS selector to wait for before extracting HTML
-            timeout: Timeout in milliseconds
+            timeout: Timeout in milliseconds (defaults to fetch_timeout())
 
         Returns:
             HTML content as string
@@ -40,34 +134,18 @@ class BrowserScraper(BaseScraper):
         target_url = url or self.url
 
         try:
-            with sync_playwright() as p:
-                browser = None
-                try:
-                    # Launch browser
-                    browser = p.chromium.launch(headless=self.headless)
-                    page = browser.new_page()
-
-                    self.logger.info(f"Opening browser for {target_url}")
-
-                    # Navigate to page
-                    page.goto(target_url, wait_until='networkidle', timeout=timeout)
-
-                    # Wait for specific selector if provided
-                    if wait_for_selector:
-                        self.logger.info(f"Waiting for selector: {wait_for_selector}")
-                        page.wait_for_selector(wait_for_selector, timeout=timeout)
-                    else:
-                        # Default: wait a bit for JavaScript to load
-                        page.wait_for_timeout(3000)
-
-                    # Get HTML
-                    html = page.content()
-
-                    self.logger.info(f"Successfully fetched {len(html)} chars of HTML")
-                    return html
-                finally:
-                    if browser:
-                        browser.close()
+            with self.open_page() as page:
+                self.logger.info(f"Opening browser for {target_url}")
+
+                # Navigate to page
+                self.navigate(page, target_url, timeout=timeout)
+                self.wait_for_content(page, wait_for_selector, timeout)
+
+                # Get HTML
+                html = self.page_html(page)
+
+                self.logger.info(f"Successfully fetched {len(html)} chars of HTML")
+                return html
 
         except PlaywrightTimeout as e:
             self.logger.error(f"Timeout fetching {target_url}: {e}")
@@ -76,19 +154,518 @@ class BrowserScraper(BaseScraper):
             self.logger.error(f"Failed to fetch {target_url} with browser: {e}")
             raise Exception(f"Failed to fetch {target_url} with browser: {e}")
 
+    def fetch_timeout(self, kind: str = 'navigation', default: Optional[int] = None) -> int:
+        """
+        Page timeout in milliseconds, capped by the time budget
+
+        Args:
+            kind: 'navigation' or 'selector' (see latency.py)
+            default: Timeout while the venue has no history (defaults to FETCH_TIMEOUT)
+        """
+        timeout = (self.venue_config.get('timeout_ms')
+                   or learned_timeout(self.venue_name, kind)
+                   or default or self.FETCH_TIMEOUT)
+        left = self.budget_left()
+        if left is None:
+            return timeout
+        return max(1000, min(timeout, int(left * 1000)))
+
+    @contextmanager
+    def measure(self, kind: str):
+        """Record the duration of the block as a latency sample (successful blocks only)"""
+        start = time.monotonic()
+        yield
+        record_latency(self.venue_name, kind, (time.monotonic() - start) * 1000)
+
+    def navigate(self, page, url: Optional[str] = None, wait_until: Optional[str] = None,
+                 timeout: Optional[int] = None) -> None:
+        """page.goto() with the venue's navigation timeout, recording its latency"""
+        with self.measure('navigation'):
+            page.goto(url or self.url, wait_until=wait_until or self.WAIT_UNTIL,
+                      timeout=timeout or self.fetch_timeout('navigation'))
+
+    def wait_for_content(self, page, wait_for_selector: Optional[str], timeout: Optional[int] = None) -> None:
+        """Wait for wait_for_selector, or for the page to settle (at most SETTLE_MS)"""
+        if wait_for_selector:
+            self.logger.info(f"Waiting for selector: {wait_for_selector}")
+            with self.measure('selector'):
+                page.wait_for_selector(wait_for_selector, timeout=timeout or self.fetch_timeout('selector'))
+        else:
+            wait_until_ready(page, self.READY_SELECTOR, max_wait_ms=self.SETTLE_MS)
+
+    def page_html(self, page) -> str:
+        """
+        Serialize the loaded page for parsing
+
+        Only the EXTRACT_SELECTOR containers when the scraper declares them,
+        the full document otherwise (or when nothing matched).
+        """
+        if self.EXTRACT_SELECTOR:
+            html = extract_html(page, *self.extract_args())
+            if html is not None:
+                return html
+        return page.content()
+
+    def extract_args(self) -> Tuple[str, Optional[str]]:
+        """EXTRACT_SELECTOR / EXTRACT_TEXT_PATTERN filled in for every month of the horizon"""
+        selectors = [fill_placeholders(self.EXTRACT_SELECTOR, m, y) for m, y in self.horizon]
+        selector = ', '.join(dict.fromkeys(selectors))
+        text_pattern = None
+        if self.EXTRACT_TEXT_PATTERN:
+            patterns = [fill_placeholders(self.EXTRACT_TEXT_PATTERN, m, y) for m, y in self.horizon]
+            text_pattern = '|'.join(f"(?:{p})" for p in dict.fromkeys(patterns))
+        return selector, text_pattern
+
+    def fetch_via_json_capture(self) -> Tuple[str, Any]:
+        """
+        Browser tier for JSON-backed listings
+
+        Records responses matching JSON_API_PATTERN during navigation and
+        extracts events from them (parse_json), skipping DOM serialization.
+        Falls back to the rendered DOM of the same page if no JSON events
+        are found.
+
+        Returns:
+            ('events', events) from the captured JSON, or ('html', html) of the DOM
+        """
+        capture = JsonCapture(self.JSON_API_PATTERN)
+
+        try:
+            with self.open_page() as page:
+                capture.install(page)
+                self.logger.info(f"Opening browser for {self.url} (capturing JSON)")
+                self.navigate(page)
+
+                if not capture.responses:
+                    try:
+                        page.wait_for_response(lambda r: capture.matches(r.url), timeout=self.SETTLE_MS)
+                    except PlaywrightTimeout:
+                        pass
+
+                payloads = capture.read_payloads()
+                events = self.parse_json(payloads) if payloads else []
+                if events:
+                    self.logger.info(f"Captured {len(payloads)} JSON responses, {len(events)} events")
+                    self.check_cancelled()
+                    record_json_endpoints(self.venue_name, [url for url, _ in payloads])
+                    return 'events', events
+
+                self.logger.info(f"No events in {len(payloads)} captured JSON responses, parsing DOM")
+                self.wait_for_content(page, self.WAIT_SELECTOR)
+                html = self.page_html(page)
+
+        except PlaywrightTimeout as e:
+            self.logger.error(f"Timeout fetching {self.url}: {e}")
+            raise Exception(f"Timeout fetching {self.url}: {e}")
+
+        return 'html', html
+
+    def parse_json(self, payloads: List) -> List[Dict]:
+        """
+        Extract events from captured JSON payloads
+
+        Args:
+            payloads: (response URL, parsed JSON) pairs
+
+        Returns:
+            List of event dictionaries (also stored in self.events)
+        """
+        self.source = ('json', payloads)
+        self.events = events_from_json(payloads, self.venue_name, self.city, self.month, self.year)
+        return self.events
+
+    @contextmanager
+    def open_page(self):
+        """
+        Borrow a browser page for this venue
+
+        Uses the shared per-thread browser pool when one is active (see
+        browser_pool.browser_session), otherwise launches a one-off browser.
+        Images, media, fonts and trackers are blocked according to the
+        venue's resource_blocking profile (see resource_filter). Cookies and
+        localStorage persist per venue across runs unless kluby.json sets
+        "persistent_profile": false (see browser_pool). Under a time budget
+        the watchdog kills the browser if the page hangs past it (see watchdog).
+        Always use as a context manager so the page is returned on errors.
+        """
+        profile = self.venue_name if self.venue_config.get('persistent_profile', True) else None
+        left = self.budget_left()
+        limit = None if left is None else left + HANG_GRACE
+        with borrow_page(headless=self.headless, profile=profile, limit=limit) as page:
+            resource_filter = ResourceFilter.for_venue(self.url, self.venue_config)
+            if resource_filter:
+                resource_filter.install(page)
+            try:
+                yield page
+            finally:
+                if resource_filter:
+                    self.logger.info(f"Resource filter: {resource_filter.summary()}")
+
+    def fetch_with_browser(self) -> str:
+        """
+        Browser tier: fetch the venue page with Playwright
+
+        Scrapers with custom page handling (scrolling, ...) override this.
+        """
+        return self.fetch_html_with_browser(wait_for_selector=self.WAIT_SELECTOR)
+
+    def should_try_http(self) -> bool:
+        """
+        Decide whether to try the plain HTTP tier first
+
+        kluby.json "fetch_tier": "http"/"browser" forces a tier. Otherwise
+        the HTTP tier is tried unless it is disabled for the scraper or was
+        recorded as insufficient less than HTTP_RECHECK_DAYS ago.
+        """
+        forced = self.venue_config.get('fetch_tier')
+        if forced:
+            return forced == 'http'
+        if not self.HTTP_TIER:
+            return False
+
+        entry = load_state(FETCH_TIERS_STATE).get(self.venue_name)
+        if not entry or entry.get('tier') == 'http':
+            return True
+        try:
+            checked = date.fromisoformat(entry.get('checked', ''))
+        except ValueError:
+            return True
+        return date.today() - checked >= timedelta(days=HTTP_RECHECK_DAYS)
+
+    def scrape_via_http(self) -> Optional[List[Dict]]:
+        """
+        HTTP tier: plain GET + structured data or the venue's parser, no browser
+
+        Returns:
+            Events if structured data or the expected selector and at least
+            max(1, min_akci) events are present, None if the browser is needed
+        """
+        expected_selector = self.WAIT_SELECTOR or self.READY_SELECTOR
+        try:
+            html = self.fetch_html_with_retry(max_retries=1)
+        except NetworkError as e:
+            self.logger.info(f"HTTP tier failed ({e}), using browser")
+            return None
+        self.check_cancelled()
+
+        # Structured data can cover a listing whose DOM is rendered client-side
+        self.source = ('html', html)
+        events = self.parse_structured_data(html)
+        if events is None:
+            if expected_selector and not has_selector(html, expected_selector):
+                self.logger.info(f"HTTP tier: '{expected_selector}' not in static HTML, using browser")
+                return None
+            events = self.parse_venue(html)
+        min_events = max(1, self.venue_config.get('min_akci', 1))
+        if len(events) < min_events:
+            self.logger.info(f"HTTP tier: only {len(events)} events (need {min_events}), using browser")
+            return None
+
+        self.logger.info(f"HTTP tier: {len(events)} events without browser")
+        return events
+
+    def scrape_via_json_endpoint(self) -> Optional[List[Dict]]:
+        """
+        HTTP tier for JSON-backed listings: GET the API URLs captured by an
+        earlier browser run directly
+
+        Returns:
+            Events if at least max(1, min_akci) were found, None otherwise
+        """
+        entry = load_state(JSON_ENDPOINTS_STATE).get(self.venue_name)
+        if not entry or not entry.get('urls'):
+            return None
+
+        payloads = []
+        for url in entry['urls']:
+            try:
+                payloads.append((url, json.loads(self.fetch_html(url))))
+            except (NetworkError, ValueError) as e:
+                self.logger.info(f"JSON endpoint {url} failed: {e}")
+
+        events = self.parse_json(payloads) if payloads else []
+        min_events = max(1, self.venue_config.get('min_akci', 1))
+        if len(events) < min_events:
+            return None
+
+        self.logger.info(f"HTTP tier: {len(events)} events from JSON endpoint")
+        return events
+
+    def scrape_http_tier(self) -> Optional[List[Dict]]:
+        """HTTP tier: recorded JSON endpoints first (JSON-backed listings), then the page itself"""
+        events = None
+        if self.JSON_API_PATTERN:
+            events = self.scrape_via_json_endpoint()
+        if events is None:
+            events = self.scrape_via_http()
+        return events
+
+    def parse(self, html: str) -> List[Dict]:
+        """
+        Parse fetched HTML: schema.org Event data where it covers the venue,
+        the venue's parser (parse_events() or parse_html()) otherwise
+        """
+        self.source = ('html', html)
+        events = self.parse_structured_data(html)
+        if events is not None:
+            self.events = events
+            return self.events
+        return self.parse_venue(html)
+
+    def parse_venue(self, html: str) -> List[Dict]:
+        """Run the venue's parser (parse_events() or parse_html()), retried on bs4 if lxml fails"""
+        parser = getattr(self, 'parse_events', None) or self.parse_html
+        if self.parser_backend == 'bs4':
+            return parser(html)
+        try:
+            return parser(html)
+        except NotImplementedError:
+            raise
+        except Exception as e:
+            # The lxml subset may lack something the parser relies on
+            self.logger.warning(f"Parser failed on {self.parser_backend} backend ({e}), retrying with bs4")
+            self.parser_override = 'bs4'
+            return parser(html)
+
+    def parse_html(self, html: str) -> List[Dict]:
+        """
+        Parse venue HTML into events - must be implemented by subclass
+
+        Returns:
+            List of event dictionaries (also stored in self.events)
+        """
+        raise NotImplementedError("Subclass must implement parse_html() method")
+
+    def scrape_horizon(self, months: List[Tuple[int, int]]) -> Dict[Tuple[int, int], BaseScraper]:
+        """
+        Scrape several months from one fetch
+
+        The page is fetched once for this scraper's month with in-page filters
+        (EXTRACT_*, scroll stop) widened to the whole horizon; the fetched HTML
+        or captured JSON is then parsed again for every other month, so the
+        parsers' month filters act as the bucketing step. Venues whose URL
+        depends on the month (Jazz Dock, Reduta, ...) are fetched per month.
+        Parsers without a month filter (HORIZON_REPARSE = False) on a URL that
+        does not change per month cannot tell the months apart; those months
+        are left out.
+
+        Args:
+            months: (month, year) pairs, starting with this scraper's month
+
+        Returns:
+            (month, year) -> scraper holding that month's events (self for its
+            own month); months left out are missing
+        """
+        self.horizon = list(months)
+        self.scrape_with_retry()
+
+        results = {(self.month, self.year): self}
+        for month, year in months:
+            if (month, year) in results:
+                continue
+            if self.leaves_out(month, year):
+                continue
+            other = self.reparse_for_month(month, year)
+            if other is None:
+                other = self.for_month(month, year)
+                other.scrape_with_retry()
+            results[(month, year)] = other
+        return results
+
+    def leaves_out(self, month: int, year: int) -> bool:
+        """True if a horizon month cannot be scraped: no month filter and the same URL"""
+        if self.HORIZON_REPARSE or self.for_month(month, year).url != self.url:
+            return False
+        self.logger.info(f"{month:02d}/{year} left out of the horizon: the page has no month dates")
+        return True
+
+    def reparse_for_month(self, month: int, year: int) -> Optional['BrowserScraper']:
+        """
+        Scraper for another month parsed from this scraper's fetched source
+
+        Returns:
+            The new scraper with its events, or None if that month needs its
+            own fetch (month-specific URL, no month filter, or nothing fetched yet)
+        """
+        other = self.for_month(month, year)
+        if other.url != self.url or self.source is None or not self.HORIZON_REPARSE:
+            return None
+        kind, data = self.source
+        if kind == 'json':
+            other.parse_json(data)
+        else:
+            other.parse(data)
+        return other
+
+    def fetch_source(self) -> Tuple[str, Any]:
+        """
+        Fetch stage of scrape(): HTTP tier first where it works, Playwright otherwise
+
+        The tier that produced the source is stored in self.fetch_tier and
+        remembered in scraper_state/fetch_tiers.json for the next run. The
+        HTTP tier and JSON capture already parse to decide whether they
+        worked; the browser DOM is returned unparsed so the parse stage can
+        run elsewhere (see scrapers/parse_pool.py).
+
+        Returns:
+            ('events', events), ('html', html) or ('json', payloads) for parse_source()
+        """
+        self.logger.info(f"Scraping {self.venue_name} for {self.month:02d}/{self.year}...")
+
+        http_tried = self.should_try_http()
+        if http_tried:
+            events = self.scrape_http_tier()
+            self.check_cancelled()
+            if events is not None:
+                self.fetch_tier = 'http'
+                record_fetch_tier(self.venue_name, 'http')
+                return 'events', events
+
+        if self.JSON_API_PATTERN:
+            kind, data = self.fetch_via_json_capture()
+        else:
+            kind, data = 'html', self.fetch_with_browser()
+        self.check_cancelled()
+        self.fetch_tier = 'browser'
+        if http_tried:
+            record_fetch_tier(self.venue_name, 'browser')
+        if kind != 'events':
+            self.source = (kind, data)
+        return kind, data
+
+    def parse_source(self, kind: str, data: Any) -> List[Dict]:
+        """
+        Parse stage of scrape(): turn a fetched source into events
+
+        Args:
+            kind: 'events' (already parsed), 'html' or 'json'
+            data: Events, HTML string or captured JSON payloads
+
+        Returns:
+            List of event dictionaries (also stored in self.events)
+        """
+        if kind == 'events':
+            self.events = data
+        elif kind == 'json':
+            self.parse_json(data)
+        else:
+            self.events = self.parse(data)
+        return self.events
+
     def scrape(self) -> List[Dict]:
         """
-        Main scraping method - must be implemented by subclass
+        Main scraping method: fetch_source() followed by parse_source()
 
         Returns:
             List of event dictionaries
         """
-        raise NotImplementedError("Subclass must implement scrape() method")
+        return self.parse_source(*self.fetch_source())
+
+    def fresh_attempt(self) -> 'BrowserScraper':
+        """New scraper for another attempt (same budget and horizon)"""
+        other = super().fresh_attempt()
+        other.horizon = self.horizon
+        return other
+
+    def adopt(self, other: BaseScraper) -> None:
+        """Take over the results of another attempt (events, fetched source, tier)"""
+        super().adopt(other)
+        self.source = other.source
+        self.fetch_tier = other.fetch_tier
+
+    @property
+    def hedged(self) -> bool:
+        """True if the second attempt is raced against a slow first one"""
+        return self.venue_config.get('hedge', self.HEDGE)
+
+    def hedge_delay(self) -> float:
+        """Seconds after which the hedged attempt starts: the venue's typical latency"""
+        typical = typical_latency(self.venue_name)
+        return typical if typical is not None else self.FETCH_TIMEOUT / 2000
+
+    def scrape_with_retry(self) -> List[Dict]:
+        """
+        scrape() with a second attempt, hedged for venues with HEDGE
+
+        Hedging: if the first attempt has no result after hedge_delay(), a
+        second one starts in a separate thread - fresh scraper, its own
+        one-off browser (HTTP tier first where it works). Whichever returns
+        events first wins. The loser is cancelled: its browser is killed by
+        the watchdog, which makes a blocked Playwright call fail, and its
+        cancelled flag stops it between tiers and before it records state
+        (fetch tier, JSON endpoints).
+
+        Returns:
+            List of event dictionaries
+        """
+        if not self.hedged:
+            return super().scrape_with_retry()
+
+        delay = self.hedge_delay()
+        primary_label = threading.current_thread().name
+        hedge_label = f"hedge-{slugify(self.venue_name)}"
+        lock = threading.Lock()
+        primary_done = threading.Event()
+        outcome: Dict[str, Any] = {'winner': None, 'hedge': None, 'hedge_error': None}
+        other = self.fresh_attempt()
+
+        def claim(side: str) -> bool:
+            with lock:
+                if outcome['winner'] is None:
+                    outcome['winner'] = side
+                    return True
+                return False
+
+        def hedge() -> None:
+            if primary_done.wait(delay):
+                return
+            self.logger.info(f"No result after {delay:.1f} s, starting hedged attempt")
+            try:
+                if other.scrape() and claim('hedge'):
+                    outcome['hedge'] = other
+                    self.logger.info("Hedged attempt won, cancelling the first one")
+                    self.cancelled.set()
+                    get_watchdog().kill_browsers(primary_label)
+            except AttemptCancelled:
+                pass
+            except Exception as e:
+                outcome['hedge_error'] = e
+                self.logger.warning(f"Hedged attempt failed: {e}")
+
+        hedge_thread = threading.Thread(target=hedge, name=hedge_label, daemon=True)
+        hedge_thread.start()
+        try:
+            events = self.scrape()
+            primary_error = None
+        except Exception as e:
+            events, primary_error = [], e
+        primary_done.set()
+
+        if events and claim('primary'):
+            other.cancelled.set()
+            if hedge_thread.is_alive() and get_watchdog().kill_browsers(hedge_label):
+                self.logger.info("First attempt won, hedged attempt cancelled")
+            return events
+
+        # First attempt failed, came back empty or lost the race: wait for the hedge
+        hedge_thread.join()
+        self.cancelled.clear()
+        if outcome['hedge'] is not None:
+            self.adopt(outcome['hedge'])
+            return self.events
+        if primary_error is None:
+            return events
+        if outcome['hedge_error'] is None and not self.budget_exhausted():
+            self.logger.warning(f"Scrape failed ({primary_error}) before the hedge was due, retrying once")
+            return self.second_attempt()
+        raise primary_error
 
 
 class RockCafeBrowserScraper(BrowserScraper):
     """Scrapes Rock Café using Playwright"""
 
+    TARGETS = 'a[href*="/en/program/"]'
+
     def __init__(self, month: int, year: int):
         super().__init__(
             venue_name="Rock Café",
@@ -137,21 +714,18 @@ class RockCafeBrowserScraper(BrowserScraper):
         date_text = date_span.get_text(strip=True)
 
         # Parse date: "Friday 24.10.2025, 19:30" or "1.11.2025"
-        date_match = re.search(r'(\d{1,2})\.(\d{1,2})\.(\d{4})', date_text)
-        if not date_match:
+        parsed = DMY.extract(date_text)
+        if not parsed:
             return None
 
-        day = int(date_match.group(1))
-        month = int(date_match.group(2))
-        year_parsed = int(date_match.group(3))
+        day, month, year_parsed, _ = parsed
 
         # Filter by target month and year
         if month != self.month or year_parsed != self.year:
             return None
 
         # Extract time if available
-        time_match = re.search(r'(\d{1,2}):(\d{2})', date_text)
-        time_str = f"{time_match.group(1)}:{time_match.group(2)}" if time_match else None
+        time_str = find_time(date_text)
 
         # Build full URL
         if href.startswith('http'):
@@ -175,20 +749,15 @@ class RockCafeBrowserScraper(BrowserScraper):
             'status': None
         }
 
-    def scrape(self) -> List[Dict]:
+    def parse_html(self, html: str) -> List[Dict]:
         """
-        Main scraping method using Playwright
+        Parse Rock Café HTML and extract events
 
         Returns:
             List of event dictionaries
         """
-        self.logger.info(f"Scraping {self.venue_name} for {self.month}/{self.year}...")
-
-        # Fetch HTML with browser
-        html = self.fetch_html_with_browser(wait_for_selector='a[href*="/en/program/"]')
-
         # Parse with Beautiful Soup
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html)
 
         # Find all event links
         all_links = soup.find_all('a', href=True)
@@ -216,6 +785,8 @@ class RockCafeBrowserScraper(BrowserScraper):
 class LucernaMusicBarBrowserScraper(BrowserScraper):
     """Scrapes Lucerna Music Bar using Playwright"""
 
+    TARGETS = 'a.program-item'
+
     def __init__(self, month: int, year: int):
         super().__init__(
             venue_name="Lucerna Music Bar",
@@ -225,40 +796,30 @@ class LucernaMusicBarBrowserScraper(BrowserScraper):
             year=year
         )
 
-    def scrape(self) -> List[Dict]:
+    def parse_html(self, html: str) -> List[Dict]:
         """
-        Main scraping method using Playwright
+        Parse Lucerna Music Bar HTML and extract events
 
         Returns:
             List of event dictionaries
         """
-        self.logger.info(f"Scraping {self.venue_name} for {self.month}/{self.year}...")
-
-        # Fetch HTML with browser
-        html = self.fetch_html_with_browser(wait_for_selector='a.program-item')
-
         # Parse with Beautiful Soup
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html)
 
         # Find all event links with class="program-item"
         event_links = soup.find_all('a', class_='program-item')
+        texts = [link.get_text(separator=' ', strip=True) for link in event_links]
+        # Date pattern "day/month" (e.g., "1/11", "23/10") and time, for all links at once
+        dates = SLASH_DM.extract_batch(texts)
+        times = TIME.extract_batch(texts)
 
         events = []
-        for link in event_links:
+        for link, text, parsed, timed in zip(event_links, texts, dates, times):
             href = link.get('href', '')
-            if not href:
+            if not href or not parsed:
                 continue
 
-            # Get full text
-            text = link.get_text(separator=' ', strip=True)
-
-            # Look for date pattern "day/month" (e.g., "1/11", "23/10")
-            date_match = re.search(r'(\d{1,2})/(\d{1,2})', text)
-            if not date_match:
-                continue
-
-            day = int(date_match.group(1))
-            month = int(date_match.group(2))
+            day, month, _, _ = parsed
 
             # Filter by target month
             if month != self.month:
@@ -272,18 +833,11 @@ class LucernaMusicBarBrowserScraper(BrowserScraper):
             else:
                 url = f"https://musicbar.cz/{href}"
 
-            # Extract time
-            time_match = re.search(r'(\d{1,2}):(\d{2})', text)
-            time_str = f"{time_match.group(1)}:{time_match.group(2)}" if time_match else None
+            time_str = timed[3] if timed else None
 
             # Extract artist - remove date/time info from text
-            artist = text
-            # Remove "Today/Tomorrow/Monday/etc"
-            artist = re.sub(r'^(Today|Tomorrow|Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\s*', '', artist)
-            # Remove date pattern
-            artist = re.sub(r'\d{1,2}/\d{1,2}', '', artist)
-            # Remove time
-            artist = re.sub(r'\d{1,2}:\d{2}', '', artist)
+            # Remove "Today/Tomorrow/Monday/etc", date and time
+            artist = TIME.remove(SLASH_DM.remove(strip_weekday(text)))
             # Remove status text at end
             artist = re.sub(r'(Buy tickets|Tickets at the door|Sold out|More info|Postponed).*$', '', artist, flags=re.I)
             # Clean whitespace
@@ -331,6 +885,10 @@ class LucernaMusicBarBrowserScraper(BrowserScraper):
 class RoxyBrowserScraper(BrowserScraper):
     """Scrapes Roxy using Playwright"""
 
+    TARGETS = 'a.item[href*="/events/detail/"]'
+    FETCH_TIMEOUT = 60000  # wait longer for dynamic content
+    HEDGE = True  # occasional very slow loads
+
     def __init__(self, month: int, year: int):
         super().__init__(
             venue_name="Roxy",
@@ -340,40 +898,30 @@ class RoxyBrowserScraper(BrowserScraper):
             year=year
         )
 
-    def scrape(self) -> List[Dict]:
+    def parse_html(self, html: str) -> List[Dict]:
         """
-        Main scraping method using Playwright
+        Parse Roxy HTML and extract events
 
         Returns:
             List of event dictionaries
         """
-        self.logger.info(f"Scraping {self.venue_name} for {self.month}/{self.year}...")
-
-        # Fetch HTML with browser - wait longer for dynamic content
-        html = self.fetch_html_with_browser(wait_for_selector='a.item[href*="/events/detail/"]', timeout=60000)
-
         # Parse with Beautiful Soup
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html)
 
         # Find all event links with href containing "/events/detail/"
         event_links = soup.find_all('a', class_='item', href=re.compile(r'/events/detail/'))
+        texts = [link.get_text(separator=' ', strip=True) for link in event_links]
+        # Date pattern with day abbreviation: "So 01/11" or just "01/11"
+        dates = SLASH_DM.extract_batch(texts)
+        times = TIME.extract_batch(texts)
 
         events = []
-        for link in event_links:
+        for link, text, parsed, timed in zip(event_links, texts, dates, times):
             href = link.get('href', '')
-            if not href:
+            if not href or not parsed:
                 continue
 
-            # Get full text
-            text = link.get_text(separator=' ', strip=True)
-
-            # Look for date pattern with day abbreviation: "So 01/11" or just "01/11"
-            date_match = re.search(r'(\d{1,2})/(\d{1,2})', text)
-            if not date_match:
-                continue
-
-            day = int(date_match.group(1))
-            month = int(date_match.group(2))
+            day, month, _, _ = parsed
 
             # Filter by target month
             if month != self.month:
@@ -389,10 +937,8 @@ class RoxyBrowserScraper(BrowserScraper):
 
             # Extract artist - remove date/time info from text
             artist = text
-            # Remove day abbreviations
-            artist = re.sub(r'^(Po|Út|St|Čt|Pá|So|Ne|Mon|Tue|Wed|Thu|Fri|Sat|Sun)\s+', '', artist, flags=re.I)
-            # Remove date pattern
-            artist = re.sub(r'\d{1,2}/\d{1,2}', '', artist)
+            # Remove day abbreviations and date pattern
+            artist = SLASH_DM.remove(strip_weekday(artist))
             # Remove "VYPRODÁNO:" prefix
             artist = re.sub(r'^VYPRODÁNO:\s*', '', artist, flags=re.I)
             artist = re.sub(r'^SOLD OUT:\s*', '', artist, flags=re.I)
@@ -402,9 +948,8 @@ class RoxyBrowserScraper(BrowserScraper):
             if not artist or len(artist) < 2:
                 continue
 
-            # Extract time if available (less common on Roxy)
-            time_match = re.search(r'(\d{1,2}):(\d{2})', text)
-            time_str = f"{time_match.group(1)}:{time_match.group(2)}" if time_match else None
+            # Time if available (less common on Roxy)
+            time_str = timed[3] if timed else None
 
             # Extract status
             status = None
@@ -443,6 +988,10 @@ class RoxyBrowserScraper(BrowserScraper):
 class VagonBrowserScraper(BrowserScraper):
     """Scrapes Vagon using Playwright"""
 
+    TARGETS = 'table.table'
+    # next.php lists only day numbers; every row is stamped with self.month
+    HORIZON_REPARSE = False
+
     def __init__(self, month: int, year: int):
         super().__init__(
             venue_name="Vagon",
@@ -452,20 +1001,15 @@ class VagonBrowserScraper(BrowserScraper):
             year=year
         )
 
-    def scrape(self) -> List[Dict]:
+    def parse_html(self, html: str) -> List[Dict]:
         """
-        Main scraping method using Playwright
+        Parse Vagon HTML and extract events
 
         Returns:
             List of event dictionaries
         """
-        self.logger.info(f"Scraping {self.venue_name} for {self.month}/{self.year}...")
-
-        # Fetch HTML with browser
-        html = self.fetch_html_with_browser(wait_for_selector='table.table')
-
         # Parse with Beautiful Soup
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html)
 
         # Find the program table
         table = soup.find('table', class_='table')
@@ -516,7 +1060,7 @@ class VagonBrowserScraper(BrowserScraper):
                 # Clean the text
                 artist = program_text
                 # Remove time
-                artist = re.sub(r'\d{1,2}:\d{2}', '', artist)
+                artist = TIME.remove(artist)
                 # Remove common prefixes
                 artist = re.sub(r'^(Koncert v rámci|Koncert|V rámci).*?:', '', artist, flags=re.I)
                 artist = re.sub(r'\s+', ' ', artist).strip()
@@ -530,8 +1074,7 @@ class VagonBrowserScraper(BrowserScraper):
             artist = ' + '.join(artists)
 
             # Extract time
-            time_match = re.search(r'(\d{1,2}):(\d{2})', program_text)
-            time_str = f"{time_match.group(1)}:{time_match.group(2)}" if time_match else "21:00"  # Default from page
+            time_str = find_time(program_text, default="21:00")  # Default from page
 
             # Build URL - use first link if available
             url = links[0].get('href') if links else f"https://www.vagon.cz/next.php#{day}"
@@ -563,6 +1106,8 @@ class JazzDockBrowserScraper(BrowserScraper):
     URL: https://www.jazzdock.cz/en/program/2025/11
     """
 
+    TARGETS = 'div.program-item'
+
     def __init__(self, month: int, year: int):
         super().__init__(
             url=f"https://www.jazzdock.cz/en/program/{year}/{month:02d}",
@@ -572,20 +1117,10 @@ class JazzDockBrowserScraper(BrowserScraper):
             year=year
         )
 
-    def scrape(self) -> List[Dict]:
-        """Main scraping method using Playwright"""
-        self.logger.info(f"Scraping {self.venue_name} for {self.month:02d}/{self.year}...")
-
-        # Fetch HTML with browser
-        html = self.fetch_html_with_browser(wait_for_selector='div.program-item')
-
-        # Parse HTML
-        return self.parse_html(html)
-
     def parse_html(self, html: str) -> List[Dict]:
         """Parse Jazz Dock HTML and extract events"""
 
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html)
 
         # Find all program items
         program_items = soup.find_all('div', class_='program-item')
@@ -603,21 +1138,16 @@ class JazzDockBrowserScraper(BrowserScraper):
 
                 # Parse date: "Sa 01. 11. from 15:00"
                 # Pattern: day_abbrev DD. MM. from HH:MM
-                date_match = re.search(r'(\d{1,2})\.\s*(\d{1,2})\.\s*from\s*(\d{1,2}):(\d{2})', date_text)
-                if not date_match:
+                parsed = DM_TIME.extract(date_text)
+                if not parsed:
                     continue
 
-                day = int(date_match.group(1))
-                month = int(date_match.group(2))
-                hour = date_match.group(3)
-                minute = date_match.group(4)
+                day, month, _, time_str = parsed
 
                 # Skip if not our month
                 if month != self.month:
                     continue
 
-                time_str = f"{hour}:{minute}"
-
                 # Find artist name - get full text and parse
                 full_text = item.get_text(separator='|', strip=True)
                 # Format: "Sa 01. 11. from 15:00|Artist Name|Genre|Description..."
@@ -686,6 +1216,9 @@ class ForumKarlinBrowserScraper(BrowserScraper):
     URL: https://www.forumkarlin.cz/en/events/
     """
 
+    WAIT_SELECTOR = 'div[class*="event"]'
+    EXTRACT_SELECTOR = 'div[class*="event" i]'
+
     def __init__(self, month: int, year: int):
         super().__init__(
             url="https://www.forumkarlin.cz/en/events/",
@@ -695,20 +1228,10 @@ class ForumKarlinBrowserScraper(BrowserScraper):
             year=year
         )
 
-    def scrape(self) -> List[Dict]:
-        """Main scraping method using Playwright"""
-        self.logger.info(f"Scraping {self.venue_name} for {self.month:02d}/{self.year}...")
-
-        # Fetch HTML with browser
-        html = self.fetch_html_with_browser(wait_for_selector='div[class*="event"]')
-
-        # Parse HTML
-        return self.parse_html(html)
-
     def parse_html(self, html: str) -> List[Dict]:
         """Parse Forum Karlín HTML and extract events"""
 
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html)
 
         # Find all event divs
         event_divs = soup.find_all('div', class_=re.compile('event', re.I))
@@ -723,13 +1246,11 @@ class ForumKarlinBrowserScraper(BrowserScraper):
                 text = div.get_text(separator='|', strip=True)
 
                 # Look for date pattern: "DD. MM. YYYY"
-                date_match = re.search(r'(\d{1,2})\.\s*(\d{1,2})\.\s*(\d{4})', text)
-                if not date_match:
+                parsed = DMY.extract(text)
+                if not parsed:
                     continue
 
-                day = int(date_match.group(1))
-                month = int(date_match.group(2))
-                year_parsed = int(date_match.group(3))
+                day, month, year_parsed, _ = parsed
 
                 # Skip if not our month
                 if month != self.month or year_parsed != self.year:
@@ -759,8 +1280,7 @@ class ForumKarlinBrowserScraper(BrowserScraper):
                     artist = link.get_text(strip=True)
 
                 # Look for time (19:00, 20:00, etc.)
-                time_match = re.search(r'(\d{1,2}):(\d{2})', text)
-                time_str = f"{time_match.group(1)}:{time_match.group(2)}" if time_match else "20:00"
+                time_str = find_time(text, default="20:00")
 
                 # Check for status (SOLD OUT, etc.)
                 status = None
@@ -800,6 +1320,13 @@ class MeetFactoryBrowserScraper(BrowserScraper):
     URL: https://meetfactory.cz/cs/program/hudba
     """
 
+    # Listing is lazy-loaded on scroll, a plain GET only has the first batch
+    HTTP_TIER = False
+    HEDGE = True  # occasional very slow loads
+
+    EXTRACT_SELECTOR = 'div.ab-box'
+    EXTRACT_TEXT_PATTERN = r'\b\d{1,2}\.\s*{month}\.'
+
     def __init__(self, month: int, year: int):
         super().__init__(
             url="https://meetfactory.cz/cs/program/hudba",
@@ -809,71 +1336,38 @@ class MeetFactoryBrowserScraper(BrowserScraper):
             year=year
         )
 
-    def scrape(self) -> List[Dict]:
-        """Main scraping method using Playwright with infinite scroll"""
-        self.logger.info(f"Scraping {self.venue_name} for {self.month:02d}/{self.year}...")
-
-        # Fetch HTML with browser (custom method with scrolling)
-        html = self.fetch_with_infinite_scroll()
-
-        # Parse HTML
-        return self.parse_html(html)
+    def fetch_with_browser(self) -> str:
+        """Browser tier: custom fetch with infinite scrolling"""
+        return self.fetch_with_infinite_scroll()
 
     def fetch_with_infinite_scroll(self) -> str:
         """
         Fetch HTML with infinite scroll support
-        Scrolls down page to load all lazy-loaded events
+        Scrolls down page to load lazy-loaded events, stopping as soon as
+        the last loaded event is past the target month
         """
         try:
-            with sync_playwright() as p:
-                browser = None
-                try:
-                    browser = p.chromium.launch(headless=self.headless)
-                    page = browser.new_page()
-
-                    self.logger.info(f"Opening browser for {self.url}")
-                    page.goto(self.url, wait_until='networkidle', timeout=30000)
-
-                    # Wait for initial content
-                    self.logger.info("Waiting for initial event boxes")
-                    page.wait_for_selector('div.ab-box', timeout=10000)
-
-                    # Scroll down multiple times to trigger lazy loading
-                    previous_height = 0
-                    scroll_attempts = 0
-                    max_scrolls = 10  # Safety limit
-
-                    self.logger.info("Starting infinite scroll...")
-                    while scroll_attempts < max_scrolls:
-                        # Get current scroll height
-                        current_height = page.evaluate("document.body.scrollHeight")
-
-                        # If height hasn't changed, we've reached the bottom
-                        if current_height == previous_height:
-                            self.logger.info(f"Reached bottom after {scroll_attempts} scrolls")
-                            break
-
-                        # Scroll to bottom
-                        page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-
-                        # Wait for new content to load
-                        page.wait_for_timeout(1500)  # 1.5 seconds between scrolls
-
-                        previous_height = current_height
-                        scroll_attempts += 1
-
-                        # Count current event boxes
-                        event_count = page.evaluate("document.querySelectorAll('div.ab-box').length")
-                        self.logger.info(f"Scroll {scroll_attempts}: Found {event_count} event boxes")
-
-                    # Get final HTML
-                    html = page.content()
-                    self.logger.info(f"Successfully fetched {len(html)} chars of HTML after scrolling")
-                    return html
-                finally:
-                    if browser:
-                        browser.close()
-
+            with self.open_page() as page:
+                self.logger.info(f"Opening browser for {self.url}")
+                self.navigate(page, wait_until='networkidle')
+
+                # Wait for initial content
+                self.logger.info("Waiting for initial event boxes")
+                with self.measure('selector'):
+                    page.wait_for_selector('div.ab-box', timeout=self.fetch_timeout('selector', default=10000))
+
+                # Scroll until the listing moves past the target month
+                self.logger.info("Starting infinite scroll...")
+                scroll_until(
+                    page, 'div.ab-box',
+                    stop_js=LAST_ITEM_PAST_MONTH_JS,
+                    stop_arg=['div.ab-box', 'p.abb-date b', self.horizon[-1][0]],
+                )
+
+                # Get final HTML
+                html = self.page_html(page)
+                self.logger.info(f"Successfully fetched {len(html)} chars of HTML after scrolling")
+                return html
         except Exception as e:
             self.logger.error(f"Failed to fetch with infinite scroll: {e}")
             raise Exception(f"Failed to fetch with infinite scroll: {e}")
@@ -881,7 +1375,7 @@ class MeetFactoryBrowserScraper(BrowserScraper):
     def parse_html(self, html: str) -> List[Dict]:
         """Parse MeetFactory HTML and extract events"""
 
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html)
 
         # Find all event boxes
         event_boxes = soup.find_all('div', class_='ab-box')
@@ -903,12 +1397,11 @@ class MeetFactoryBrowserScraper(BrowserScraper):
                 date_text = date_b.get_text(strip=True)
 
                 # Parse date: "1. 11." or "11. 11."
-                date_match = re.search(r'(\d{1,2})\.\s*(\d{1,2})\.', date_text)
-                if not date_match:
+                parsed = DM.extract(date_text)
+                if not parsed:
                     continue
 
-                day = int(date_match.group(1))
-                month = int(date_match.group(2))
+                day, month, _, _ = parsed
 
                 # Skip if not our month
                 if month != self.month:
@@ -918,9 +1411,9 @@ class MeetFactoryBrowserScraper(BrowserScraper):
                 time_spans = date_elem.find_all('span')
                 time_str = "20:00"  # default
                 for span in time_spans:
-                    text = span.get_text(strip=True)
-                    if re.match(r'\d{1,2}\.\d{2}', text):
-                        time_str = text.replace('.', ':')
+                    parsed_time = TIME_DOTTED.match(span.get_text(strip=True))
+                    if parsed_time:
+                        time_str = parsed_time[3]
                         break
 
                 # Find artist: <h3><a><span itemprop="name">Artist Name</span></a></h3>
@@ -1014,6 +1507,8 @@ class MalostranaskaBesedaBrowserScraper(BrowserScraper):
     URL: https://www.malostranska-beseda.cz/club/program?year=YYYY&month=MM
     """
 
+    TARGETS = 'div.row'
+
     def __init__(self, month: int, year: int):
         # Use URL with month/year parameters
         url = f"https://www.malostranska-beseda.cz/club/program?year={year}&month={month}"
@@ -1025,20 +1520,10 @@ class MalostranaskaBesedaBrowserScraper(BrowserScraper):
             year=year
         )
 
-    def scrape(self) -> List[Dict]:
-        """Main scraping method using Playwright"""
-        self.logger.info(f"Scraping {self.venue_name} for {self.month:02d}/{self.year}...")
-
-        # Fetch HTML with browser
-        html = self.fetch_html_with_browser(wait_for_selector='div.row')
-
-        # Parse HTML
-        return self.parse_html(html)
-
     def parse_html(self, html: str) -> List[Dict]:
         """Parse Malostranská beseda HTML and extract events"""
 
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html)
 
         # Find ALL divs with class row
         rows = soup.find_all('div', class_='row')
@@ -1052,21 +1537,18 @@ class MalostranaskaBesedaBrowserScraper(BrowserScraper):
                 text = row.get_text()
 
                 # Look for date in this row
-                date_match = re.search(r'(\d{1,2})\.\s*(\d{1,2})\.\s*(\d{4})', text)
-                if not date_match:
+                parsed = DMY.extract(text)
+                if not parsed:
                     continue
 
-                day = int(date_match.group(1))
-                month = int(date_match.group(2))
-                year = int(date_match.group(3))
+                day, month, year, _ = parsed
 
                 # Skip if not our month/year
                 if month != self.month or year != self.year:
                     continue
 
                 # Find time
-                time_match = re.search(r'(\d{1,2}):(\d{2})', text)
-                time_str = time_match.group(0) if time_match else "20:00"
+                time_str = find_time(text, default="20:00")
 
                 # Find artist (from h1-h4 tags)
                 h_tags = row.find_all(['h1', 'h2', 'h3', 'h4'])
@@ -1124,6 +1606,10 @@ class RedutaJazzClubBrowserScraper(BrowserScraper):
     URL: https://www.redutajazzclub.cz/program-cs/MMYYYY
     """
 
+    TARGETS = 'td[id]'
+    WAIT_SELECTOR = 'td[data-link]'
+    EXTRACT_SELECTOR = 'td[id^="{year}-{mm}-"]'
+
     def __init__(self, month: int, year: int):
         # Use URL with month/year in format MMYYYY
         url = f"https://www.redutajazzclub.cz/program-cs/{month:02d}{year}"
@@ -1135,21 +1621,11 @@ class RedutaJazzClubBrowserScraper(BrowserScraper):
             year=year
         )
 
-    def scrape(self) -> List[Dict]:
-        """Main scraping method using Playwright"""
-        self.logger.info(f"Scraping {self.venue_name} for {self.month:02d}/{self.year}...")
-
-        # Fetch HTML with browser
-        html = self.fetch_html_with_browser(wait_for_selector='td[data-link]')
-
-        # Parse HTML
-        return self.parse_html(html)
-
     def parse_html(self, html: str) -> List[Dict]:
         """Parse Reduta Jazz Club HTML and extract events from calendar"""
         import json as json_module
 
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html)
 
         # Find all td elements with our month/year in ID
         pattern = re.compile(rf'{self.year}-{self.month:02d}-\d{{2}}')
@@ -1161,12 +1637,11 @@ class RedutaJazzClubBrowserScraper(BrowserScraper):
         for td in event_tds:
             try:
                 # Extract date from ID
-                td_id = td.get('id', '')
-                date_match = re.search(rf'{self.year}-{self.month:02d}-(\d{{2}})', td_id)
-                if not date_match:
+                parsed = ISO.extract(td.get('id', ''))
+                if not parsed or parsed[1:3] != (self.month, self.year):
                     continue
 
-                day = int(date_match.group(1))
+                day = parsed[0]
 
                 # Get data-label JSON
                 data_label = td.get('data-label', '')
@@ -1178,7 +1653,7 @@ class RedutaJazzClubBrowserScraper(BrowserScraper):
 
                 # Extract time and artist from body HTML
                 body_html = event_data.get('body', '')
-                body_soup = BeautifulSoup(body_html, 'lxml')
+                body_soup = self.make_soup(body_html, strain=False)
 
                 # Time from span.tt-time
                 time_span = body_soup.find('span', class_='tt-time')
@@ -1227,6 +1702,10 @@ class WattMusicClubBrowserScraper(BrowserScraper):
     URL: https://goout.net/en/watt-music-club/vztpab/events/
     """
 
+    TARGETS = 'div.event'
+    JSON_API_PATTERN = GOOUT_SCHEDULES_API
+    EXTRACT_TEXT_PATTERN = r'\d{2}/{mm}\b'
+
     def __init__(self, month: int, year: int):
         super().__init__(
             url="https://goout.net/en/watt-music-club/vztpab/events/",
@@ -1236,19 +1715,9 @@ class WattMusicClubBrowserScraper(BrowserScraper):
             year=year
         )
 
-    def scrape(self) -> List[Dict]:
-        """Main scraping method using Playwright"""
-        self.logger.info(f"Scraping {self.venue_name} for {self.month:02d}/{self.year}...")
-
-        # Fetch HTML with browser
-        html = self.fetch_html_with_browser(wait_for_selector='div.event')
-
-        # Parse HTML
-        return self.parse_html(html)
-
     def parse_html(self, html: str) -> List[Dict]:
         """Parse GoOut events page and extract events"""
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html)
 
         # Find all event divs
         event_divs = soup.find_all('div', class_='event')
@@ -1276,12 +1745,11 @@ class WattMusicClubBrowserScraper(BrowserScraper):
                 time_text = time_elem.text.strip()
 
                 # Extract day and month from "01/11"
-                date_match = re.search(r'(\d{2})/(\d{2})', time_text)
-                if not date_match:
+                parsed = SLASH_DM.extract(time_text)
+                if not parsed:
                     continue
 
-                day = int(date_match.group(1))
-                month_num = int(date_match.group(2))
+                day, month_num, _, _ = parsed
 
                 # Only include events for the requested month
                 if month_num != self.month:
@@ -1289,8 +1757,7 @@ class WattMusicClubBrowserScraper(BrowserScraper):
                     continue
 
                 # Extract time (21:00)
-                time_match = re.search(r'(\d{2}:\d{2})', time_text)
-                time_str = time_match.group(1) if time_match else None
+                time_str = find_time(time_text)
 
                 # Create event
                 event = {
@@ -1332,6 +1799,13 @@ class O2ArenaBrowserScraper(BrowserScraper):
     Filters out sports events (hockey, FMX, etc.), keeps only music concerts
     """
 
+    TARGETS = 'div.event_preview'
+    SKIP_CATEGORIES = ('sport',)
+    CATEGORY_KEYWORDS = {'sport': ('HC Sparta', 'Bílí Tygři', 'hockey', 'FMX', 'Global Champions',
+                                   'Equestrian', 'football', 'basketball', 'volleyball', 'Sparta Praha',
+                                   'Tipsport', 'extraliga', 'playoffs', 'Liberec', 'Litvínov',
+                                   'Mladá Boleslav', 'hokey', 'hokej')}
+
     def __init__(self, month: int, year: int):
         super().__init__(
             url="https://www.o2arena.cz/en/events/",
@@ -1340,39 +1814,25 @@ class O2ArenaBrowserScraper(BrowserScraper):
             month=month,
             year=year
         )
-        # Sports keywords to filter out
-        self.sports_keywords = [
-            'HC Sparta', 'Bílí Tygři', 'hockey', 'FMX', 'Global Champions',
-            'Equestrian', 'football', 'basketball', 'volleyball', 'Sparta Praha',
-            'Tipsport', 'extraliga', 'playoffs', 'Liberec', 'Litvínov',
-            'Mladá Boleslav', 'hokey', 'hokej'
-        ]
-
-    def scrape(self) -> List[Dict]:
-        """Main scraping method using Playwright"""
-        self.logger.info(f"Scraping {self.venue_name} for {self.month:02d}/{self.year}...")
-
-        # Fetch HTML with browser
-        html = self.fetch_html_with_browser(wait_for_selector='div.event_preview')
 
-        # Parse HTML
-        return self.parse_html(html)
+    @property
+    def sports_keywords(self) -> List[str]:
+        """Keywords that mark an event as sports"""
+        return list(self.classifier.keywords['sport'])
 
     def is_sports_event(self, event_name: str) -> bool:
         """Check if event is a sports event based on keywords"""
-        event_lower = event_name.lower()
-        return any(keyword.lower() in event_lower for keyword in self.sports_keywords)
+        return self.classifier.classify(event_name).category == 'sport'
 
     def parse_html(self, html: str) -> List[Dict]:
         """Parse O2 Arena events page and extract music concerts only"""
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html)
 
         # Find all event preview divs
         event_divs = soup.find_all('div', class_='event_preview')
         self.logger.info(f"Found {len(event_divs)} event divs on page")
 
         events = []
-        sports_filtered = 0
 
         for event_div in event_divs:
             try:
@@ -1384,14 +1844,11 @@ class O2ArenaBrowserScraper(BrowserScraper):
                 time_text = time_p.text.strip()
 
                 # Parse date DD.MM.YYYY HH:MM
-                date_match = re.search(r'(\d{2})\.(\d{2})\.(\d{4})\s+(\d{2}:\d{2})', time_text)
-                if not date_match:
+                parsed = DMY.extract(time_text)
+                if not parsed or not parsed[3]:
                     continue
 
-                day = int(date_match.group(1))
-                month_num = int(date_match.group(2))
-                year_num = int(date_match.group(3))
-                time_str = date_match.group(4)
+                day, month_num, year_num, time_str = parsed
 
                 # Only include events for the requested month and year
                 if month_num != self.month or year_num != self.year:
@@ -1409,12 +1866,6 @@ class O2ArenaBrowserScraper(BrowserScraper):
                 artist = link.text.strip()
                 url = link.get('href', '')
 
-                # Filter out sports events
-                if self.is_sports_event(artist):
-                    self.logger.debug(f"Filtering out sports event: {artist}")
-                    sports_filtered += 1
-                    continue
-
                 # Create event
                 event = {
                     'date': f"{day:02d}.{self.month:02d}.{self.year}",
@@ -1441,8 +1892,10 @@ class O2ArenaBrowserScraper(BrowserScraper):
                 self.logger.warning(f"Failed to parse event: {e}")
                 continue
 
-        # Sort by day
-        self.events = sorted(events, key=lambda x: x['day'])
+        # Filter out sports events, sort by day
+        music_events = self.filter_categories(events)
+        sports_filtered = len(events) - len(music_events)
+        self.events = sorted(music_events, key=lambda x: x['day'])
 
         self.logger.info(f"Found {len(self.events)} music events for {self.month:02d}/{self.year} (filtered out {sports_filtered} sports events)")
         return self.events
@@ -1455,6 +1908,8 @@ class O2UniversumBrowserScraper(BrowserScraper):
     No sports filtering needed (music venue only)
     """
 
+    TARGETS = 'div.event_preview'
+
     def __init__(self, month: int, year: int):
         super().__init__(
             url="https://www.o2universum.cz/en/events/",
@@ -1464,19 +1919,9 @@ class O2UniversumBrowserScraper(BrowserScraper):
             year=year
         )
 
-    def scrape(self) -> List[Dict]:
-        """Main scraping method using Playwright"""
-        self.logger.info(f"Scraping {self.venue_name} for {self.month:02d}/{self.year}...")
-
-        # Fetch HTML with browser
-        html = self.fetch_html_with_browser(wait_for_selector='div.event_preview')
-
-        # Parse HTML
-        return self.parse_html(html)
-
     def parse_html(self, html: str) -> List[Dict]:
         """Parse O2 Universum events page"""
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html)
 
         # Find all event preview divs
         event_divs = soup.find_all('div', class_='event_preview')
@@ -1494,14 +1939,11 @@ class O2UniversumBrowserScraper(BrowserScraper):
                 time_text = time_p.text.strip()
 
                 # Parse date DD.MM.YYYY HH:MM
-                date_match = re.search(r'(\d{2})\.(\d{2})\.(\d{4})\s+(\d{2}:\d{2})', time_text)
-                if not date_match:
+                parsed = DMY.extract(time_text)
+                if not parsed or not parsed[3]:
                     continue
 
-                day = int(date_match.group(1))
-                month_num = int(date_match.group(2))
-                year_num = int(date_match.group(3))
-                time_str = date_match.group(4)
+                day, month_num, year_num, time_str = parsed
 
                 # Only include events for the requested month and year
                 if month_num != self.month or year_num != self.year:
@@ -1558,6 +2000,12 @@ class DivadloPodLampouBrowserScraper(BrowserScraper):
     URL: https://podlampou.cz/events/
     Note: Primarily theatre venue, filters music events only
     """
+
+    TARGETS = 'a.list-item'
+    SKIP_CATEGORIES = ('theatre', 'other')
+    CATEGORY_KEYWORDS = {'theatre': ('divadlo', 'theatre'),
+                         'other': ('workshop', 'seminář', 'čtení', 'beseda', 'vernisáž')}
+
     def __init__(self, month: int, year: int):
         super().__init__(
             url="https://podlampou.cz/events/",
@@ -1567,26 +2015,15 @@ class DivadloPodLampouBrowserScraper(BrowserScraper):
             year=year
         )
 
-    def scrape(self) -> List[Dict]:
-        """Main scraping method using Playwright"""
-        self.logger.info(f"Scraping {self.venue_name} for {self.month:02d}/{self.year}...")
-
-        # Fetch HTML with browser
-        html = self.fetch_html_with_browser(wait_for_selector='a.list-item')
-
-        # Parse HTML
-        return self.parse_events(html)
-
     def parse_events(self, html: str) -> list:
         """
         Parse events from Divadlo Pod lampou HTML
         Structure: <a class="list-item"> with <span class="date">
         """
-        from bs4 import BeautifulSoup
         import re
         from datetime import datetime
 
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html)
         events = []
 
         # Find all event items
@@ -1604,13 +2041,11 @@ class DivadloPodLampouBrowserScraper(BrowserScraper):
                 # Example: "So 1. 11. 20:00" (day_name day. month. time)
 
                 # Parse date using regex
-                date_match = re.search(r'(\d{1,2})\.\s*(\d{1,2})\.\s*(\d{1,2}:\d{2})', date_text)
-                if not date_match:
+                parsed = DM_TIME.extract(date_text)
+                if not parsed:
                     continue
 
-                day = int(date_match.group(1))
-                month = int(date_match.group(2))
-                time = date_match.group(3)
+                day, month, _, time = parsed
 
                 # Filter for our target month
                 if month != self.month:
@@ -1628,16 +2063,6 @@ class DivadloPodLampouBrowserScraper(BrowserScraper):
                 if not url.startswith('http'):
                     url = f"https://podlampou.cz{url}"
 
-                # Filter for music events (exclude theatre, readings, workshops)
-                # Look for music-related keywords or lack of theatre keywords
-                artist_lower = artist.lower()
-                theatre_keywords = ['divadlo', 'theatre', 'workshop', 'seminář', 'čtení', 'beseda', 'vernisáž']
-
-                # Skip if it's clearly theatre/non-music
-                if any(kw in artist_lower for kw in theatre_keywords):
-                    self.logger.debug(f"Skipping theatre event: {artist}")
-                    continue
-
                 # Add event
                 event = {
                     'date': f"{day:02d}.{month:02d}.{self.year}",
@@ -1657,8 +2082,8 @@ class DivadloPodLampouBrowserScraper(BrowserScraper):
                 self.logger.error(f"Error parsing event item: {e}")
                 continue
 
-        # Sort by day
-        self.events = sorted(events, key=lambda x: x['day'])
+        # Music events only (no theatre, readings, workshops), sorted by day
+        self.events = sorted(self.filter_categories(events), key=lambda x: x['day'])
 
         self.logger.info(f"Found {len(self.events)} music events for {self.month:02d}/{self.year}")
         return self.events
@@ -1670,6 +2095,16 @@ class KDSerikovkaBrowserScraper(BrowserScraper):
     URL: https://www.serikovka.cz/
     Note: Uses domcontentloaded wait strategy (faster than networkidle)
     """
+
+    TARGETS = 'article.mod-articles-item'
+    READY_SELECTOR = TARGETS
+    WAIT_UNTIL = 'domcontentloaded'
+    FETCH_TIMEOUT = 60000
+    SKIP_CATEGORIES = ('theatre', 'other')
+    CATEGORY_KEYWORDS = {'theatre': ('divadlo', 'theatre'),
+                         'other': ('pawlowská', 'manuál', 'show', 'bambuláček', 'čtení', 'beseda')}
+    SETTLE_MS = 5000
+
     def __init__(self, month: int, year: int):
         super().__init__(
             url="https://www.serikovka.cz/",
@@ -1679,43 +2114,14 @@ class KDSerikovkaBrowserScraper(BrowserScraper):
             year=year
         )
 
-    def scrape(self) -> List[Dict]:
-        """Main scraping method using Playwright with custom wait strategy"""
-        self.logger.info(f"Scraping {self.venue_name} for {self.month:02d}/{self.year}...")
-
-        # Fetch HTML with browser (use domcontentloaded instead of networkidle)
-        try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=self.headless)
-                page = browser.new_page()
-
-                self.logger.info(f"Opening browser for {self.url}")
-                page.goto(self.url, wait_until="domcontentloaded", timeout=60000)
-
-                # Wait a bit more for content
-                page.wait_for_timeout(5000)
-
-                html = page.content()
-                browser.close()
-
-                self.logger.info(f"Successfully fetched {len(html)} chars of HTML")
-
-                # Parse HTML
-                return self.parse_events(html)
-
-        except Exception as e:
-            self.logger.error(f"Failed to fetch {self.url}: {e}")
-            raise
-
     def parse_events(self, html: str) -> list:
         """
         Parse events from KD Šeříkovka HTML
         Structure: <article class="mod-articles-item"> with <a class="mod-articles-link">
         """
-        from bs4 import BeautifulSoup
         import re
 
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html)
         events = []
 
         # Find all article items
@@ -1733,13 +2139,11 @@ class KDSerikovkaBrowserScraper(BrowserScraper):
                 # Example: "03.11. 2025 / BONFIRE (DE) + WHITE TYGËR (UK)"
 
                 # Parse date using regex
-                date_match = re.search(r'(\d{1,2})\.(\d{1,2})\.\s*(\d{4})', link_text)
-                if not date_match:
+                parsed = DMY.extract(link_text)
+                if not parsed:
                     continue
 
-                day = int(date_match.group(1))
-                month = int(date_match.group(2))
-                year = int(date_match.group(3))
+                day, month, year, _ = parsed
 
                 # Filter for our target month/year
                 if month != self.month or year != self.year:
@@ -1759,18 +2163,6 @@ class KDSerikovkaBrowserScraper(BrowserScraper):
                 # Default time (no specific time shown on website)
                 time = "20:00"
 
-                # Filter out non-music events
-                artist_lower = artist.lower()
-                non_music_keywords = [
-                    'pawlowská', 'manuál', 'show', 'bambuláček',
-                    'divadlo', 'theatre', 'čtení', 'beseda'
-                ]
-
-                # Skip if it's clearly not music
-                if any(kw in artist_lower for kw in non_music_keywords):
-                    self.logger.debug(f"Skipping non-music event: {artist}")
-                    continue
-
                 # Add event
                 event = {
                     'date': f"{day:02d}.{month:02d}.{year}",
@@ -1790,8 +2182,8 @@ class KDSerikovkaBrowserScraper(BrowserScraper):
                 self.logger.error(f"Error parsing article item: {e}")
                 continue
 
-        # Sort by day
-        self.events = sorted(events, key=lambda x: x['day'])
+        # Music events only, sorted by day
+        self.events = sorted(self.filter_categories(events), key=lambda x: x['day'])
 
         self.logger.info(f"Found {len(self.events)} music events for {self.month:02d}/{self.year}")
         return self.events
@@ -1804,6 +2196,10 @@ class PapirnaPlzenBrowserScraper(BrowserScraper):
     Note: Official website unavailable, using GoOut.net as data source
     """
 
+    TARGETS = 'div.event'
+    JSON_API_PATTERN = GOOUT_SCHEDULES_API
+    EXTRACT_TEXT_PATTERN = r'\d{2}/{mm}\b'
+
     def __init__(self, month: int, year: int):
         super().__init__(
             url="https://goout.net/en/papirna/vzkoab/events/",
@@ -1813,15 +2209,9 @@ class PapirnaPlzenBrowserScraper(BrowserScraper):
             year=year
         )
 
-    def scrape(self) -> List[Dict]:
-        """Main scraping method using Playwright"""
-        self.logger.info(f"Scraping {self.venue_name} for {self.month:02d}/{self.year}...")
-        html = self.fetch_html_with_browser(wait_for_selector='div.event')
-        return self.parse_html(html)
-
     def parse_html(self, html: str) -> List[Dict]:
         """Parse GoOut events page and extract events"""
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html)
 
         # Find all event divs
         event_divs = soup.find_all('div', class_='event')
@@ -1849,12 +2239,11 @@ class PapirnaPlzenBrowserScraper(BrowserScraper):
                 time_text = time_elem.text.strip()
 
                 # Extract day and month from "01/11"
-                date_match = re.search(r'(\d{2})/(\d{2})', time_text)
-                if not date_match:
+                parsed = SLASH_DM.extract(time_text)
+                if not parsed:
                     continue
 
-                day = int(date_match.group(1))
-                month_num = int(date_match.group(2))
+                day, month_num, _, _ = parsed
 
                 # Only include events for the requested month
                 if month_num != self.month:
@@ -1862,8 +2251,7 @@ class PapirnaPlzenBrowserScraper(BrowserScraper):
                     continue
 
                 # Extract time (21:00)
-                time_match = re.search(r'(\d{2}:\d{2})', time_text)
-                time_str = time_match.group(1) if time_match else "20:00"
+                time_str = find_time(time_text, default="20:00")
 
                 # Create event
                 event = {
@@ -1897,6 +2285,8 @@ class BuenaVistaClubBrowserScraper(BrowserScraper):
     URL: https://www.buenavistaclub.cz/program-klubu.aspx
     """
 
+    READY_SELECTOR = 'h2.nadpis'
+
     def __init__(self, month: int, year: int):
         super().__init__(
             url="https://www.buenavistaclub.cz/program-klubu.aspx",
@@ -1906,15 +2296,9 @@ class BuenaVistaClubBrowserScraper(BrowserScraper):
             year=year
         )
 
-    def scrape(self) -> List[Dict]:
-        """Main scraping method using Playwright"""
-        self.logger.info(f"Scraping {self.venue_name} for {self.month:02d}/{self.year}...")
-        html = self.fetch_html_with_browser()
-        return self.parse_events(html)
-
     def parse_events(self, html: str) -> list:
         """Parse events from Buena Vista Club page"""
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html)
 
         # Find all h2.nadpis elements (artist names)
         # Each event follows pattern: h2 (artist) → h4 (date) → p (description)
@@ -1940,13 +2324,11 @@ class BuenaVistaClubBrowserScraper(BrowserScraper):
                 date_text = h4.text.strip()
 
                 # Parse date format: DD.M.YYYY or DD.MM.YYYY
-                date_match = re.search(r'(\d{1,2})\.(\d{1,2})\.(\d{4})', date_text)
-                if not date_match:
+                parsed = DMY.extract(date_text)
+                if not parsed:
                     continue
 
-                day = int(date_match.group(1))
-                month_num = int(date_match.group(2))
-                year_num = int(date_match.group(3))
+                day, month_num, year_num, _ = parsed
 
                 # Only include events for the requested month and year
                 if month_num != self.month or year_num != self.year:
@@ -1990,6 +2372,12 @@ class UStarePaniJazzClubBrowserScraper(BrowserScraper):
     Note: Official website unavailable, using GoOut.net as data source
     """
 
+    TARGETS = 'div.event'
+    JSON_API_PATTERN = GOOUT_SCHEDULES_API
+    EXTRACT_TEXT_PATTERN = r'\d{2}/{mm}\b'
+    # GoOut's JSON-LD lists the same events as parse_html() (minus cancelled ones)
+    STRUCTURED_DATA = True
+
     def __init__(self, month: int, year: int):
         super().__init__(
             url="https://goout.net/en/u-stare-pani-jazz-and-cocktail-club/vzlll/events/",
@@ -1999,15 +2387,9 @@ class UStarePaniJazzClubBrowserScraper(BrowserScraper):
             year=year
         )
 
-    def scrape(self) -> List[Dict]:
-        """Main scraping method using Playwright"""
-        self.logger.info(f"Scraping {self.venue_name} for {self.month:02d}/{self.year}...")
-        html = self.fetch_html_with_browser(wait_for_selector='div.event')
-        return self.parse_html(html)
-
     def parse_html(self, html: str) -> List[Dict]:
         """Parse GoOut events page and extract events"""
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html)
 
         # Find all event divs
         event_divs = soup.find_all('div', class_='event')
@@ -2035,12 +2417,11 @@ class UStarePaniJazzClubBrowserScraper(BrowserScraper):
                 time_text = time_elem.text.strip()
 
                 # Extract day and month from "01/11"
-                date_match = re.search(r'(\d{2})/(\d{2})', time_text)
-                if not date_match:
+                parsed = SLASH_DM.extract(time_text)
+                if not parsed:
                     continue
 
-                day = int(date_match.group(1))
-                month_num = int(date_match.group(2))
+                day, month_num, _, _ = parsed
 
                 # Only include events for the requested month
                 if month_num != self.month:
@@ -2048,8 +2429,7 @@ class UStarePaniJazzClubBrowserScraper(BrowserScraper):
                     continue
 
                 # Extract time (21:00)
-                time_match = re.search(r'(\d{2}:\d{2})', time_text)
-                time_str = time_match.group(1) if time_match else "20:00"
+                time_str = find_time(time_text, default="20:00")
 
                 # Create event
                 event = {
@@ -2083,6 +2463,11 @@ class CrossClubBrowserScraper(BrowserScraper):
     URL: https://www.crossclub.cz/cs/program/
     """
 
+    READY_SELECTOR = 'div.predel'
+    SKIP_CATEGORIES = ('theatre', 'other')
+    CATEGORY_KEYWORDS = {'theatre': ('divadlo', 'theatre'),
+                         'other': ('film', 'movie', 'přednáška', 'lecture')}
+
     def __init__(self, month: int, year: int):
         super().__init__(
             url="https://www.crossclub.cz/cs/program/",
@@ -2092,15 +2477,9 @@ class CrossClubBrowserScraper(BrowserScraper):
             year=year
         )
 
-    def scrape(self) -> List[Dict]:
-        """Main scraping method using Playwright"""
-        self.logger.info(f"Scraping {self.venue_name} for {self.month:02d}/{self.year}...")
-        html = self.fetch_html_with_browser()
-        return self.parse_events(html)
-
     def parse_events(self, html: str) -> list:
         """Parse events from Cross Club page"""
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html)
 
         # Find all div.predel elements (date separators)
         # Structure: <div class="predel"><div>01. 11. 2025 - Sobota</div></div>
@@ -2121,14 +2500,12 @@ class CrossClubBrowserScraper(BrowserScraper):
                 date_text = inner_div.text.strip()
                 # Example: "01. 11. 2025 - Sobota"
 
-                # Parse date using regex: DD. MM. YYYY
-                date_match = re.search(r'(\d{1,2})\.\s*(\d{1,2})\.\s*(\d{4})', date_text)
-                if not date_match:
+                # Parse date: DD. MM. YYYY
+                parsed = DMY.extract(date_text)
+                if not parsed:
                     continue
 
-                day = int(date_match.group(1))
-                month_num = int(date_match.group(2))
-                year_num = int(date_match.group(3))
+                day, month_num, year_num, _ = parsed
 
                 # Only include events for the requested month/year
                 if month_num != self.month or year_num != self.year:
@@ -2154,14 +2531,6 @@ class CrossClubBrowserScraper(BrowserScraper):
                 # Time is usually not specified on Cross Club, default to 20:00
                 time_str = "20:00"
 
-                # Filter out non-music events (theatre, film, etc.)
-                artist_lower = artist.lower()
-                non_music_keywords = ['divadlo', 'theatre', 'film', 'movie', 'přednáška', 'lecture']
-
-                if any(kw in artist_lower for kw in non_music_keywords):
-                    self.logger.debug(f"Skipping non-music event: {artist}")
-                    continue
-
                 # Create event
                 event = {
                     'date': f"{day:02d}.{self.month:02d}.{self.year}",
@@ -2182,8 +2551,8 @@ class CrossClubBrowserScraper(BrowserScraper):
                 self.logger.warning(f"Failed to parse event: {e}")
                 continue
 
-        # Sort by day
-        self.events = sorted(events, key=lambda x: x['day'])
+        # Music events only (no theatre, film, etc.), sorted by day
+        self.events = sorted(self.filter_categories(events), key=lambda x: x['day'])
 
         self.logger.info(f"Found {len(self.events)} events for {self.month:02d}/{self.year}")
         return self.events
@@ -2196,6 +2565,13 @@ class TipsportArenaBrowserScraper(BrowserScraper):
     Data source: Ticketportal (official tickets website)
     """
 
+    READY_SELECTOR = 'div[itemprop="startDate"]'
+    EXTRACT_SELECTOR = 'div.ticket-cover:has(div[itemprop="startDate"][content^="{year}-{mm}-"])'
+    SKIP_CATEGORIES = ('sport',)
+    CATEGORY_KEYWORDS = {'sport': ('hokej', 'hockey', 'sparta', 'slavia', 'fotbal', 'football',
+                                   'extraliga', 'liiga', 'nhl', 'play-off', 'playoff',
+                                   'házená', 'handball', 'basket', 'volejbal', 'volleyball')}
+
     def __init__(self, month: int, year: int):
         super().__init__(
             url="https://www.ticketportal.cz/venue/TIPSPORT-ARENA",
@@ -2205,15 +2581,9 @@ class TipsportArenaBrowserScraper(BrowserScraper):
             year=year
         )
 
-    def scrape(self) -> List[Dict]:
-        """Main scraping method using Playwright"""
-        self.logger.info(f"Scraping {self.venue_name} for {self.month:02d}/{self.year}...")
-        html = self.fetch_html_with_browser()
-        return self.parse_events(html)
-
     def parse_events(self, html: str) -> list:
         """Parse events from Ticketportal page"""
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html)
 
         # Find all event date elements
         # Structure: div[itemprop="startDate"][content="2025-11-07T18:30"]
@@ -2231,23 +2601,17 @@ class TipsportArenaBrowserScraper(BrowserScraper):
                     continue
 
                 # Parse ISO date: YYYY-MM-DDTHH:MM
-                date_match = re.search(r'(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2})', iso_date)
-                if not date_match:
+                parsed = ISO.extract(iso_date)
+                if not parsed or not parsed[3]:
                     continue
 
-                year_num = int(date_match.group(1))
-                month_num = int(date_match.group(2))
-                day = int(date_match.group(3))
-                hour = date_match.group(4)
-                minute = date_match.group(5)
+                day, month_num, year_num, time_str = parsed
 
                 # Only include events for the requested month/year
                 if month_num != self.month or year_num != self.year:
                     self.logger.debug(f"Skipping event from {day:02d}.{month_num:02d}.{year_num} (looking for {self.month:02d}/{self.year})")
                     continue
 
-                time_str = f"{hour}:{minute}"
-
                 # Find the event name
                 # Navigate up to find the container, then find the a.event element
                 container = date_div.find_parent('div', class_='ticket-cover')
@@ -2262,18 +2626,6 @@ class TipsportArenaBrowserScraper(BrowserScraper):
                 relative_url = event_link.get('href', '')
                 url = f"https://www.ticketportal.cz{relative_url}" if relative_url.startswith('/') else relative_url
 
-                # Filter out sports events (hockey, football, etc.)
-                artist_lower = artist.lower()
-                sports_keywords = [
-                    'hokej', 'hockey', 'sparta', 'slavia', 'fotbal', 'football',
-                    'extraliga', 'liiga', 'nhl', 'play-off', 'playoff',
-                    'házená', 'handball', 'basket', 'volejbal', 'volleyball'
-                ]
-
-                if any(kw in artist_lower for kw in sports_keywords):
-                    self.logger.debug(f"Skipping sports event: {artist}")
-                    continue
-
                 # Create event
                 event = {
                     'date': f"{day:02d}.{self.month:02d}.{self.year}",
@@ -2294,20 +2646,13 @@ class TipsportArenaBrowserScraper(BrowserScraper):
                 self.logger.warning(f"Failed to parse event: {e}")
                 continue
 
-        # Sort by day
-        self.events = sorted(events, key=lambda x: x['day'])
+        # Filter out sports events (hockey, football, etc.), sort by day
+        self.events = sorted(self.filter_categories(events), key=lambda x: x['day'])
 
         self.logger.info(f"Found {len(self.events)} events for {self.month:02d}/{self.year}")
         return self.events
 
 
-CZECH_MONTHS = {
-    'leden': 1, 'únor': 2, 'březen': 3, 'duben': 4,
-    'květen': 5, 'červen': 6, 'červenec': 7, 'srpen': 8,
-    'září': 9, 'říjen': 10, 'listopad': 11, 'prosinec': 12
-}
-
-
 class SonoCentrumBrowserScraper(BrowserScraper):
     """
     Sono Centrum Brno scraper using Playwright
@@ -2315,6 +2660,15 @@ class SonoCentrumBrowserScraper(BrowserScraper):
     Structure: div.col-md-4[data-month][data-year] > div.event-item > a.link + div.txt > h2 + p.date
     """
 
+    # domcontentloaded (not networkidle) - Sono has long-running connections
+    TARGETS = 'div.col-md-4[data-month]'
+    READY_SELECTOR = TARGETS
+    WAIT_UNTIL = 'domcontentloaded'
+    FETCH_TIMEOUT = 60000
+    SETTLE_MS = 2000
+    HEDGE = True  # occasional very slow loads
+    EXTRACT_SELECTOR = 'div.col-md-4[data-month="{month}"][data-year="{year}"]'
+
     def __init__(self, month: int, year: int):
         super().__init__(
             url="https://www.sono.cz/program/",
@@ -2324,25 +2678,8 @@ class SonoCentrumBrowserScraper(BrowserScraper):
             year=year
         )
 
-    def scrape(self) -> List[Dict]:
-        """Use domcontentloaded (not networkidle) - Sono has long-running connections"""
-        self.logger.info(f"Scraping {self.venue_name} for {self.month:02d}/{self.year}...")
-        try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=self.headless)
-                page = browser.new_page()
-                page.goto(self.url, wait_until='domcontentloaded', timeout=60000)
-                page.wait_for_timeout(2000)
-                html = page.content()
-                browser.close()
-                self.logger.info(f"Fetched {len(html)} chars")
-        except Exception as e:
-            self.logger.error(f"Failed to fetch {self.url}: {e}")
-            raise
-        return self.parse_html(html)
-
     def parse_html(self, html: str) -> List[Dict]:
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html)
 
         # Events are in div.col-md-4 with data-month and data-year attributes
         event_containers = soup.find_all('div', class_='col-md-4',
@@ -2383,14 +2720,11 @@ class SonoCentrumBrowserScraper(BrowserScraper):
                 if not date_p:
                     continue
 
-                date_text = date_p.get_text(strip=True)
-                date_match = re.search(r'(\d{1,2})\.(\d{1,2})\.(\d{4})', date_text)
-                if not date_match:
+                parsed = DMY.extract(date_p.get_text(strip=True))
+                if not parsed:
                     continue
 
-                day = int(date_match.group(1))
-                month_num = int(date_match.group(2))
-                year_num = int(date_match.group(3))
+                day, month_num, year_num, _ = parsed
 
                 if month_num != self.month or year_num != self.year:
                     continue
@@ -2426,6 +2760,8 @@ class FledaBrowserScraper(BrowserScraper):
     Static HTML: event links /event/ID/, date as Czech text "Sobota Únor 21"
     """
 
+    WAIT_SELECTOR = 'a[href*="/event/"]'
+
     def __init__(self, month: int, year: int):
         super().__init__(
             url=f"https://www.fleda.cz/program/?month={month:02d}&year={year}",
@@ -2435,22 +2771,26 @@ class FledaBrowserScraper(BrowserScraper):
             year=year
         )
 
-    def scrape(self) -> List[Dict]:
-        self.logger.info(f"Scraping {self.venue_name} for {self.month:02d}/{self.year}...")
-        html = self.fetch_html_with_browser(wait_for_selector='a[href*="/event/"]')
-        return self.parse_html(html)
-
     def parse_html(self, html: str) -> List[Dict]:
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html)
 
         # Find all event links
         event_links = soup.find_all('a', href=re.compile(r'/event/\d+/'))
         self.logger.info(f"Found {len(event_links)} event links")
 
+        # Text from every link's parent container; month name, "Únor 21"
+        # day and start time are extracted for all of them at once
+        containers = [link.parent if link.parent else link for link in event_links]
+        texts = [container.get_text(separator=' ', strip=True) for container in containers]
+        months = CZECH_MONTH_NAME.extract_batch(texts)
+        month_days = MONTH_DAY.extract_batch(texts)
+        start_times = START_TIME.extract_batch(texts)
+
         events = []
         seen_urls = set()
 
-        for link in event_links:
+        for link, container, text, month, month_day, start in zip(
+                event_links, containers, texts, months, month_days, start_times):
             try:
                 href = link.get('href', '')
                 url = f"https://www.fleda.cz{href}" if href.startswith('/') else href
@@ -2458,42 +2798,24 @@ class FledaBrowserScraper(BrowserScraper):
                 if url in seen_urls:
                     continue
 
-                # Get text from link and its parent container
-                container = link.parent if link.parent else link
-                text = container.get_text(separator=' ', strip=True)
-
-                # Find Czech month name -> month number
-                month_num = None
-                matched_month_name = None
-                for mname, num in CZECH_MONTHS.items():
-                    if mname in text.lower():
-                        month_num = num
-                        matched_month_name = mname
-                        break
-
-                if month_num != self.month:
+                # Czech month name -> month number
+                if not month or month[1] != self.month:
                     continue
 
-                # Extract day: number after month name pattern "Únor 21"
-                day = None
-                if matched_month_name:
-                    m = re.search(rf'{matched_month_name}\s+(\d{{1,2}})', text, re.I)
-                    if m:
-                        day = int(m.group(1))
+                # Day: number after month name pattern "Únor 21"
+                day = month_day[0] if month_day and month_day[1] == self.month else None
 
                 if not day:
                     # Fallback: last standalone 1-2 digit number that could be a day
-                    candidates = re.findall(r'\b(\d{1,2})\b', text)
-                    day_candidates = [int(n) for n in candidates if 1 <= int(n) <= 31]
+                    day_candidates = [n for n, _, _, _ in DAY_NUMBER.findall(text) if 1 <= n <= 31]
                     if day_candidates:
                         day = day_candidates[-1]
 
                 if not day or day < 1 or day > 31:
                     continue
 
-                # Extract start time: "start: **20:00**" or "start: 20:00"
-                time_match = re.search(r'start:\s*\**(\d{1,2}):(\d{2})', text, re.I)
-                time_str = f"{time_match.group(1)}:{time_match.group(2)}" if time_match else "20:00"
+                # Start time: "start: **20:00**" or "start: 20:00"
+                time_str = start[3] if start else "20:00"
 
                 # Extract artist: prefer heading tags inside container
                 artist = ""
@@ -2505,12 +2827,9 @@ class FledaBrowserScraper(BrowserScraper):
 
                 if not artist:
                     # Fallback: link text, cleaned of date/time noise
-                    artist = link.get_text(strip=True)
-                    for mname in CZECH_MONTHS.keys():
-                        artist = re.sub(mname, '', artist, flags=re.I)
-                    artist = re.sub(r'\b(Po|Út|St|Čt|Pá|So|Ne|Pondělí|Úterý|Středa|Čtvrtek|Pátek|Sobota|Neděle)\b', '', artist, flags=re.I)
-                    artist = re.sub(r'\d{1,2}:\d{2}', '', artist)
-                    artist = re.sub(r'\b\d{1,2}\b', '', artist)
+                    artist = CZECH_MONTH_NAME.remove(link.get_text(strip=True))
+                    artist = CZECH_WEEKDAY.sub('', artist)
+                    artist = DAY_NUMBER.remove(TIME.remove(artist))
                     artist = re.sub(r'(otevíráme|start|vstup|cena|předprodej).*', '', artist, flags=re.I)
                     artist = re.sub(r'\s+', ' ', artist).strip()
 
@@ -2548,6 +2867,9 @@ class KabinetMuzBrowserScraper(BrowserScraper):
     Static HTML: event links /program/YYYY-MM-DD-[slug] (date embedded in URL)
     """
 
+    TARGETS = 'a[href*="/program/"]'
+    EXTRACT_SELECTOR = 'a[href*="/program/{year}-{mm}-"]'
+
     def __init__(self, month: int, year: int):
         super().__init__(
             url="https://www.kabinetmuz.cz/program",
@@ -2557,13 +2879,8 @@ class KabinetMuzBrowserScraper(BrowserScraper):
             year=year
         )
 
-    def scrape(self) -> List[Dict]:
-        self.logger.info(f"Scraping {self.venue_name} for {self.month:02d}/{self.year}...")
-        html = self.fetch_html_with_browser(wait_for_selector='a[href*="/program/"]')
-        return self.parse_html(html)
-
     def parse_html(self, html: str) -> List[Dict]:
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html)
 
         # Event links have URL pattern: /program/YYYY-MM-DD-[slug]
         url_pattern = re.compile(rf'/program/{self.year}-{self.month:02d}-(\d{{2}})-')
@@ -2577,12 +2894,12 @@ class KabinetMuzBrowserScraper(BrowserScraper):
             try:
                 href = link.get('href', '')
 
-                # Extract day from URL
-                url_match = re.search(rf'/program/{self.year}-{self.month:02d}-(\d{{2}})-', href)
-                if not url_match:
+                # Extract day from URL (/program/YYYY-MM-DD-slug)
+                parsed = ISO.extract(href)
+                if not parsed or parsed[1:3] != (self.month, self.year):
                     continue
 
-                day = int(url_match.group(1))
+                day = parsed[0]
                 url = f"https://www.kabinetmuz.cz{href}" if href.startswith('/') else href
 
                 if url in seen_urls:
@@ -2594,16 +2911,15 @@ class KabinetMuzBrowserScraper(BrowserScraper):
                 artist = h3.get_text(strip=True) if h3 else link.get_text(strip=True)
 
                 # Clean up artist: strip date prefix "DNES", weekday, "DD. M." pattern
-                artist = re.sub(r'^(DNES\s*)?(Po|Út|St|Čt|Pá|So|Ne|pondělí|úterý|středa|čtvrtek|pátek|sobota|neděle)\s*', '', artist, flags=re.I)
-                artist = re.sub(r'^\d{1,2}\.\s*\d{1,2}\.\s*', '', artist)
+                artist = strip_weekday(artist)
+                artist = DM.remove(artist, leading=True)
                 artist = artist.strip()
 
                 if not artist or len(artist) < 2:
                     continue
 
                 # Extract time from link text
-                time_match = re.search(r'(\d{1,2}):(\d{2})', link.get_text())
-                time_str = f"{time_match.group(1)}:{time_match.group(2)}" if time_match else "20:00"
+                time_str = find_time(link.get_text(), default="20:00")
 
                 events.append({
                     'date': f"{day:02d}.{self.month:02d}.{self.year}",
@@ -2635,6 +2951,8 @@ class StaraPekarnaBrowserScraper(BrowserScraper):
     Note: No per-event URLs, uses /rezervace/YYYY-MM-DD
     """
 
+    TARGETS = 'div.day-box'
+
     def __init__(self, month: int, year: int):
         super().__init__(
             url="https://www.starapekarna.cz/program",
@@ -2644,13 +2962,8 @@ class StaraPekarnaBrowserScraper(BrowserScraper):
             year=year
         )
 
-    def scrape(self) -> List[Dict]:
-        self.logger.info(f"Scraping {self.venue_name} for {self.month:02d}/{self.year}...")
-        html = self.fetch_html_with_browser(wait_for_selector='div.day-box')
-        return self.parse_html(html)
-
     def parse_html(self, html: str) -> List[Dict]:
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html)
 
         day_boxes = soup.find_all('div', class_='day-box')
         self.logger.info(f"Found {len(day_boxes)} day-box elements")
@@ -2668,13 +2981,11 @@ class StaraPekarnaBrowserScraper(BrowserScraper):
                 if not h3:
                     continue
 
-                date_text = h3.get_text(strip=True)
-                date_match = re.search(r'(\d{1,2})\.(\d{1,2})\.?', date_text)
-                if not date_match:
+                parsed = DM.extract(h3.get_text(strip=True))
+                if not parsed:
                     continue
 
-                day = int(date_match.group(1))
-                month_num = int(date_match.group(2))
+                day, month_num, _, _ = parsed
 
                 if month_num != self.month:
                     continue
@@ -2689,9 +3000,7 @@ class StaraPekarnaBrowserScraper(BrowserScraper):
                 artist = " + ".join(artist_names)
 
                 # Time from box text (e.g. "Začátek v 19:30" or "20:00")
-                box_text = box.get_text()
-                time_match = re.search(r'(\d{1,2}):(\d{2})', box_text)
-                time_str = f"{time_match.group(1)}:{time_match.group(2)}" if time_match else "20:00"
+                time_str = find_time(box.get_text(), default="20:00")
 
                 # URL: per-date reservation page (closest to event-specific)
                 url = f"https://www.starapekarna.cz/rezervace/{self.year}-{self.month:02d}-{day:02d}"
@@ -2725,6 +3034,14 @@ class MelodkaBrowserScraper(BrowserScraper):
     Static HTML: event links /program/akce/DD-MM-YYYY-[slug] (date embedded in URL)
     """
 
+    # domcontentloaded (not networkidle) - Melodka may have long-running connections
+    TARGETS = 'a[href*="/program/akce/"]'
+    READY_SELECTOR = TARGETS
+    WAIT_UNTIL = 'domcontentloaded'
+    FETCH_TIMEOUT = 60000
+    SETTLE_MS = 2000
+    EXTRACT_SELECTOR = 'a[href*="/program/akce/"][href*="-{mm}-{year}-"]'
+
     def __init__(self, month: int, year: int):
         super().__init__(
             url="https://www.melodka.cz/",
@@ -2734,25 +3051,8 @@ class MelodkaBrowserScraper(BrowserScraper):
             year=year
         )
 
-    def scrape(self) -> List[Dict]:
-        """Use domcontentloaded (not networkidle) - Melodka may have long-running connections"""
-        self.logger.info(f"Scraping {self.venue_name} for {self.month:02d}/{self.year}...")
-        try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=self.headless)
-                page = browser.new_page()
-                page.goto(self.url, wait_until='domcontentloaded', timeout=60000)
-                page.wait_for_timeout(2000)
-                html = page.content()
-                browser.close()
-                self.logger.info(f"Fetched {len(html)} chars")
-        except Exception as e:
-            self.logger.error(f"Failed to fetch {self.url}: {e}")
-            raise
-        return self.parse_html(html)
-
     def parse_html(self, html: str) -> List[Dict]:
-        soup = BeautifulSoup(html, 'lxml')
+        soup = self.make_soup(html)
 
         # Event links: /program/akce/DD-MM-YYYY-[slug]
         url_pattern = re.compile(rf'/program/akce/(\d{{2}})-{self.month:02d}-{self.year}-')
@@ -2767,11 +3067,11 @@ class MelodkaBrowserScraper(BrowserScraper):
                 href = link.get('href', '')
 
                 # Extract day from URL: DD-MM-YYYY
-                url_match = re.search(rf'/program/akce/(\d{{2}})-{self.month:02d}-{self.year}-', href)
-                if not url_match:
+                parsed = DMY_DASHED.extract(href)
+                if not parsed or parsed[1:3] != (self.month, self.year):
                     continue
 
-                day = int(url_match.group(1))
+                day = parsed[0]
                 url = f"https://www.melodka.cz{href}" if href.startswith('/') else href
 
                 if url in seen_urls:
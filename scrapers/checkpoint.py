@@ -0,0 +1,62 @@
+"""
+Run Checkpoints
+===============
+Each venue's result (events + validation) is written to
+scraper_state/checkpoints/YYYY-MM/<venue>.json as soon as it completes, so a
+crashed or interrupted run can be resumed (scrape_concerts.py --resume)
+without re-scraping the venues that already succeeded.
+"""
+
+import json
+import logging
+import shutil
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+from .state_store import STATE_DIR, atomic_write_json, slugify
+
+
+CHECKPOINT_DIR = STATE_DIR / 'checkpoints'
+
+logger = logging.getLogger(__name__)
+
+
+class RunCheckpoint:
+    """
+    Checkpoint directory of one scraping run (one target month)
+
+    Args:
+        month: Target month (1-12)
+        year: Target year
+    """
+
+    def __init__(self, month: int, year: int):
+        self.directory = CHECKPOINT_DIR / f"{year}-{month:02d}"
+
+    def save(self, venue_name: str, events: List[Dict], validation: Dict) -> None:
+        """Persist a successfully scraped venue"""
+        atomic_write_json(self.directory / f"{slugify(venue_name)}.json", {
+            'venue': venue_name,
+            'saved_at': datetime.now().isoformat(timespec='seconds'),
+            'events': events,
+            'validation': validation,
+        })
+
+    def load_completed(self) -> Dict[str, Tuple[List[Dict], Dict]]:
+        """Return venue name -> (events, validation) for all checkpointed venues"""
+        completed = {}
+        if not self.directory.exists():
+            return completed
+        for path in sorted(self.directory.glob('*.json')):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                completed[data['venue']] = (data['events'], data['validation'])
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Ignoring unreadable checkpoint {path}: {e}")
+        return completed
+
+    def clear(self) -> None:
+        """Drop the checkpoints of a previous run (fresh, non-resumed run)"""
+        if self.directory.exists():
+            shutil.rmtree(self.directory)
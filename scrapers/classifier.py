@@ -0,0 +1,141 @@
+"""
+Event Classifier
+================
+Labels event titles as music / sport / theatre / other by keyword, for the
+venues that list more than concerts (arenas, theatres, cultural centres).
+
+A venue's keyword sets (scraper CATEGORY_KEYWORDS, kluby.json "kategorie")
+are compiled into one Aho-Corasick automaton, so a title is scanned once
+whatever the number of keywords, and a batch of titles is scanned in one
+pass over their concatenation. Keywords match as case-insensitive substrings, as the
+per-scraper `any(kw in title.lower() ...)` checks did. A title without a
+keyword is music; when several categories fire, the first of CATEGORIES
+wins (then the leftmost keyword). Decisions are cached per normalized title.
+"""
+
+from bisect import bisect_right
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+
+CATEGORIES = ('sport', 'theatre', 'other', 'music')
+DEFAULT_CATEGORY = 'music'
+
+# Joins the titles of a batch; no keyword contains it
+BATCH_SEPARATOR = '\x00'
+
+
+class Label(NamedTuple):
+    """Category of a title and the keyword that decided it (None for the default)"""
+    category: str
+    rule: Optional[str]
+
+
+def normalize(title: str) -> str:
+    """Lowercase, whitespace collapsed - the form keywords and cache keys use"""
+    return ' '.join(title.lower().split())
+
+
+class Classifier:
+    """
+    Aho-Corasick automaton over the keywords of all categories
+
+    Args:
+        keywords: category -> keywords (CATEGORIES other than music)
+    """
+
+    def __init__(self, keywords: Dict[str, Iterable[str]]):
+        self.keywords: Dict[str, Tuple[str, ...]] = {}
+        for category, words in keywords.items():
+            if category not in CATEGORIES:
+                raise ValueError(f"Unknown event category {category!r}")
+            self.keywords[category] = tuple(dict.fromkeys(normalize(w) for w in words if w.strip()))
+        self.cache: Dict[str, Label] = {}
+
+        # Trie: goto[state][char] -> state, out[state] -> (rank, keyword) ending there
+        self.goto: List[Dict[str, int]] = [{}]
+        self.out: List[List[Tuple[int, str]]] = [[]]
+        for category, words in self.keywords.items():
+            rank = CATEGORIES.index(category)
+            for word in words:
+                state = 0
+                for char in word:
+                    if char not in self.goto[state]:
+                        self.goto.append({})
+                        self.out.append([])
+                        self.goto[state][char] = len(self.goto) - 1
+                    state = self.goto[state][char]
+                self.out[state].append((rank, word))
+
+        # Failure links (breadth first), outputs of the fallback states merged in
+        self.fail = [0] * len(self.goto)
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self.goto[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+                self.out[child] = self.out[child] + self.out[self.fail[child]]
+
+    def _scan(self, text: str) -> Iterable[Tuple[int, int, str]]:
+        """(end position, rank, keyword) of every keyword occurrence in text"""
+        goto, fail, out = self.goto, self.fail, self.out
+        state = 0
+        for pos, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for rank, word in out[state]:
+                yield pos, rank, word
+
+    def classify(self, title: str) -> Label:
+        """Label of one title"""
+        return self.classify_batch([title])[0]
+
+    def classify_batch(self, titles: Sequence[str]) -> List[Label]:
+        """
+        Labels of many titles; the uncached ones are scanned in one pass
+
+        Returns:
+            Label per title, in order
+        """
+        keys = [normalize(title) for title in titles]
+        pending = list(dict.fromkeys(key for key in keys if key not in self.cache))
+        if pending:
+            starts, offset = [], 0
+            for key in pending:
+                starts.append(offset)
+                offset += len(key) + len(BATCH_SEPARATOR)
+
+            # Per pending title: (rank, start position, keyword) of the best hit so
+            # far - first category, then leftmost, then longest keyword
+            best: List[Optional[Tuple[int, int, int, str]]] = [None] * len(pending)
+            for pos, rank, word in self._scan(BATCH_SEPARATOR.join(pending)):
+                index = bisect_right(starts, pos) - 1
+                hit = (rank, pos - len(word), -len(word), word)
+                if best[index] is None or hit < best[index]:
+                    best[index] = hit
+
+            for key, hit in zip(pending, best):
+                self.cache[key] = Label(CATEGORIES[hit[0]], hit[3]) if hit else Label(DEFAULT_CATEGORY, None)
+        return [self.cache[key] for key in keys]
+
+
+def get_classifier(keywords: Optional[Dict[str, Iterable[str]]] = None) -> Classifier:
+    """
+    Shared classifier for a venue's keyword sets
+
+    Built once per distinct keyword configuration, so scrapers of the same
+    venue (months, retries) share the automaton and its cache.
+    """
+    frozen = tuple(sorted((category, tuple(words)) for category, words in (keywords or {}).items()))
+    return _compiled(frozen)
+
+
+@lru_cache(maxsize=None)
+def _compiled(keywords: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> Classifier:
+    return Classifier(dict(keywords))
@@ -0,0 +1,187 @@
+"""
+Date Extraction
+===============
+Precompiled date/time extractors shared by the venue parsers, instead of
+inline re.search() patterns (some of them rebuilt for every element).
+
+Every extractor yields normalized DateParts (day, month, year, time): ints,
+None for what the format does not carry, time as zero-padded 'HH:MM'.
+
+- DMY: '7. 11. 2025', '07.11.2025', optionally followed by a time
+  ('07.11.2025 20:00', 'Friday 24.10.2025, 19:30')
+- DM: '7. 11.', '7.11' (no year)
+- DM_TIME: '1. 11. 20:00', '01. 11. from 15:00'
+- SLASH_DM: '01/11' (GoOut, Lucerna, Roxy)
+- ISO: '2025-11-07', '2025-11-07T20:00', '2025-11-07 20:00'
+- DMY_DASHED: '07-11-2025' (URL slugs)
+- MONTH_DAY / DAY_MONTH: Czech or English month names ('Únor 21',
+  '21. února', '21 November'); MONTH_NAME / CZECH_MONTH_NAME: the name alone
+- MONTH_DAY_YEAR: English, optionally abbreviated, with a year and time
+  ('Oct 25 2025 20:00:00 GMT+0200', 'November 7, 2025')
+- TIME ('20:00'), TIME_DOTTED ('20.00'), START_TIME ('start: 20:00',
+  'Začátek v 19:30'), DAY_NUMBER (standalone 1-2 digit number)
+
+extract() returns the first match of a string, extract_batch() the first
+match of every string of a list in one regex pass, findall() all matches and
+remove() deletes them (artist name cleanup). find_time() is the shortcut
+for the time of day alone; strip_weekday() drops a leading Czech / English
+weekday name or "dnes"/"today" in front of a date or time.
+"""
+
+import re
+from bisect import bisect_right
+from typing import Callable, List, Optional, Sequence, Tuple
+
+
+# (day, month, year, 'HH:MM')
+DateParts = Tuple[Optional[int], Optional[int], Optional[int], Optional[str]]
+
+CZECH_MONTHS = {
+    'leden': 1, 'ledna': 1, 'únor': 2, 'února': 2, 'březen': 3, 'března': 3,
+    'duben': 4, 'dubna': 4, 'květen': 5, 'května': 5, 'červen': 6, 'června': 6,
+    'červenec': 7, 'července': 7, 'srpen': 8, 'srpna': 8, 'září': 9,
+    'říjen': 10, 'října': 10, 'listopad': 11, 'listopadu': 11,
+    'prosinec': 12, 'prosince': 12,
+}
+ENGLISH_MONTHS = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'may': 5, 'june': 6,
+    'july': 7, 'august': 8, 'september': 9, 'october': 10, 'november': 11,
+    'december': 12,
+}
+MONTH_NUMBERS = {**CZECH_MONTHS, **ENGLISH_MONTHS}
+ENGLISH_MONTH_ABBREVIATIONS = {**{name[:3]: number for name, number in ENGLISH_MONTHS.items()}, 'sept': 9}
+
+CZECH_WEEKDAYS = ('pondělí', 'úterý', 'středa', 'čtvrtek', 'pátek', 'sobota', 'neděle',
+                  'po', 'út', 'st', 'čt', 'pá', 'so', 'ne')
+ENGLISH_WEEKDAYS = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday',
+                    'mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun')
+
+# Joins the strings of a batch; no pattern matches across it
+BATCH_SEPARATOR = '\x00'
+
+
+def _alternation(words) -> str:
+    """Regex alternation, longest first so 'červenec' wins over 'červen'"""
+    return '|'.join(re.escape(w) for w in sorted(words, key=len, reverse=True))
+
+
+def _time(hour: Optional[str], minute: Optional[str]) -> Optional[str]:
+    return f"{int(hour):02d}:{minute}" if hour is not None else None
+
+
+class Extractor:
+    """
+    One precompiled date/time format
+
+    Args:
+        pattern: Regular expression of the format
+        parts: Maps a match to DateParts
+        flags: re flags
+    """
+
+    def __init__(self, pattern: str, parts: Callable[[re.Match], DateParts], flags: int = 0):
+        self.regex = re.compile(pattern, flags)
+        self.parts = parts
+
+    def extract(self, text: str) -> Optional[DateParts]:
+        """DateParts of the first match in text, None if there is none"""
+        match = self.regex.search(text)
+        return self.parts(match) if match else None
+
+    def match(self, text: str) -> Optional[DateParts]:
+        """Like extract(), but the format must start the text"""
+        match = self.regex.match(text)
+        return self.parts(match) if match else None
+
+    def findall(self, text: str) -> List[DateParts]:
+        """DateParts of every match in text"""
+        return [self.parts(match) for match in self.regex.finditer(text)]
+
+    def extract_batch(self, texts: Sequence[str]) -> List[Optional[DateParts]]:
+        """
+        extract() for many strings in one regex pass over their concatenation
+
+        Returns:
+            DateParts (or None) per input string, in order
+        """
+        starts, offset = [], 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + len(BATCH_SEPARATOR)
+
+        results: List[Optional[DateParts]] = [None] * len(texts)
+        for match in self.regex.finditer(BATCH_SEPARATOR.join(texts)):
+            index = bisect_right(starts, match.start()) - 1
+            if results[index] is None:
+                results[index] = self.parts(match)
+        return results
+
+    def remove(self, text: str, leading: bool = False) -> str:
+        """text with every match deleted (leading: only a match starting the text)"""
+        if not leading:
+            return self.regex.sub('', text)
+        match = self.regex.match(text)
+        return text[match.end():] if match else text
+
+
+def _ints(*groups) -> Tuple[Optional[int], ...]:
+    return tuple(int(g) if g is not None else None for g in groups)
+
+
+DMY = Extractor(r'(\d{1,2})\.\s*(\d{1,2})\.\s*(\d{4})(?:,?\s+(\d{1,2}):(\d{2}))?',
+                lambda m: (*_ints(m.group(1), m.group(2), m.group(3)), _time(m.group(4), m.group(5))))
+DM = Extractor(r'(\d{1,2})\.\s*(\d{1,2})\.?',
+               lambda m: (int(m.group(1)), int(m.group(2)), None, None))
+DM_TIME = Extractor(r'(\d{1,2})\.\s*(\d{1,2})\.\s*(?:(?:from|od)\s*)?(\d{1,2}):(\d{2})',
+                    lambda m: (int(m.group(1)), int(m.group(2)), None, _time(m.group(3), m.group(4))),
+                    re.I)
+SLASH_DM = Extractor(r'(\d{1,2})/(\d{1,2})',
+                     lambda m: (int(m.group(1)), int(m.group(2)), None, None))
+ISO = Extractor(r'(\d{4})-(\d{2})-(\d{2})(?:[T ](\d{2}):(\d{2}))?',
+                lambda m: (*_ints(m.group(3), m.group(2), m.group(1)), _time(m.group(4), m.group(5))))
+DMY_DASHED = Extractor(r'\b(\d{1,2})-(\d{1,2})-(\d{4})\b',
+                       lambda m: (*_ints(m.group(1), m.group(2), m.group(3)), None))
+
+_MONTH_NAMES = _alternation(MONTH_NUMBERS)
+MONTH_DAY = Extractor(rf'\b({_MONTH_NAMES})\.?\s+(\d{{1,2}})\b',
+                      lambda m: (int(m.group(2)), MONTH_NUMBERS[m.group(1).lower()], None, None), re.I)
+DAY_MONTH = Extractor(rf'\b(\d{{1,2}})\.?\s*({_MONTH_NAMES})\b',
+                      lambda m: (int(m.group(1)), MONTH_NUMBERS[m.group(2).lower()], None, None), re.I)
+MONTH_NAME = Extractor(rf'\b({_MONTH_NAMES})\b',
+                       lambda m: (None, MONTH_NUMBERS[m.group(1).lower()], None, None), re.I)
+_ENGLISH_MONTH_NAMES = {**ENGLISH_MONTHS, **ENGLISH_MONTH_ABBREVIATIONS}
+MONTH_DAY_YEAR = Extractor(rf'\b({_alternation(_ENGLISH_MONTH_NAMES)})\b\.?\s+(\d{{1,2}}),?\s+(\d{{4}})'
+                           r'(?:,?\s+(\d{1,2}):(\d{2}))?',
+                           lambda m: (int(m.group(2)), _ENGLISH_MONTH_NAMES[m.group(1).lower()],
+                                      int(m.group(3)), _time(m.group(4), m.group(5))), re.I)
+CZECH_MONTH_NAME = Extractor(rf'\b({_alternation(CZECH_MONTHS)})\b',
+                             lambda m: (None, CZECH_MONTHS[m.group(1).lower()], None, None), re.I)
+
+TIME = Extractor(r'(\d{1,2}):(\d{2})',
+                 lambda m: (None, None, None, _time(m.group(1), m.group(2))))
+TIME_DOTTED = Extractor(r'(\d{1,2})\.(\d{2})\b',
+                        lambda m: (None, None, None, _time(m.group(1), m.group(2))))
+START_TIME = Extractor(r'\b(?:start|začátek)\b\s*:?\s*(?:v\s+)?\**(\d{1,2})[:.](\d{2})',
+                       lambda m: (None, None, None, _time(m.group(1), m.group(2))), re.I)
+DAY_NUMBER = Extractor(r'\b(\d{1,2})\b',
+                       lambda m: (int(m.group(1)), None, None, None))
+
+CZECH_WEEKDAY = re.compile(rf'\b(?:{_alternation(CZECH_WEEKDAYS)})\b', re.I)
+# Only in front of a date ("7. 11.", "07/11", "7 listopadu", "7 Nov") or time,
+# so artists like "Sun Ra", "St. Vincent" or "So What" keep their names
+LEADING_WEEKDAY = re.compile(
+    rf'^(?:(?:dnes|zítra|today|tomorrow)\b[\s,]*)?'
+    rf'(?:(?:{_alternation(CZECH_WEEKDAYS + ENGLISH_WEEKDAYS)})\.?,?\s*)?'
+    rf'(?=\d{{1,2}}\s*[./:]|\d{{1,2}}\.?\s*(?:{_MONTH_NAMES}|{_alternation(ENGLISH_MONTH_ABBREVIATIONS)})\b)',
+    re.I)
+
+
+def find_time(text: str, default: Optional[str] = None, extractor: Extractor = TIME) -> Optional[str]:
+    """First time of day in text as 'HH:MM', default if there is none"""
+    parts = extractor.extract(text)
+    return parts[3] if parts else default
+
+
+def strip_weekday(text: str) -> str:
+    """Drop a leading weekday name / abbreviation (and "dnes", "today", ...) followed by a date or time"""
+    return LEADING_WEEKDAY.sub('', text, count=1)
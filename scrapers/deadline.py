@@ -0,0 +1,96 @@
+"""
+Run Deadline
+============
+Bounds a whole run (--deadline 300s) and gives every venue a time budget.
+
+- budget: the run's worker-seconds (deadline x parallel workers) are shared
+  among the venues by weight - kluby.json "priorita" if set, otherwise by
+  "velikost" (velky 3, stredni 2, maly 1) - with MIN_VENUE_BUDGET as a floor,
+  and never beyond the time left in the run. The scraper caps its page
+  timeouts by it; the async engine cancels the venue outright.
+- admission: a venue starts only if its expected duration still fits the time
+  left; when it does not, lower-priority venues are skipped while the
+  highest-priority ones still get the remaining time. Nothing starts after
+  the deadline. Skipped venues end up in the validation report and in
+  events_data.json ("skipped_venues").
+"""
+
+import re
+import time
+from typing import Callable, Dict, List, Optional
+
+
+SIZE_PRIORITY = {'velky': 3, 'stredni': 2, 'maly': 1}
+MIN_VENUE_BUDGET = 15.0  # seconds
+
+
+class VenueSkipped(Exception):
+    """A venue was not scraped because the run deadline would not allow it"""
+
+
+def parse_duration(text: str) -> float:
+    """
+    Parse a duration like '300', '300s', '5m' or '1h' into seconds
+
+    Raises:
+        ValueError: On an unrecognized format
+    """
+    match = re.fullmatch(r'\s*(\d+(?:\.\d+)?)\s*([smh]?)\s*', text.lower())
+    if not match:
+        raise ValueError(f"Invalid duration: {text!r}")
+    value, unit = match.groups()
+    return float(value) * {'': 1, 's': 1, 'm': 60, 'h': 3600}[unit]
+
+
+def venue_priority(venue: Dict) -> float:
+    """kluby.json "priorita", defaulting to the venue size (velky > stredni > maly)"""
+    if venue.get('priorita') is not None:
+        return float(venue['priorita'])
+    return float(SIZE_PRIORITY.get(venue.get('velikost'), 1))
+
+
+class RunDeadline:
+    """
+    Deadline of one run and the time budgets of its venues
+
+    Args:
+        seconds: Run length limit
+        venues: Venues of the run (their priorities share the budget)
+        parallelism: Number of venues scraped at the same time
+        clock: Monotonic clock (injectable for tests)
+    """
+
+    def __init__(self, seconds: float, venues: List[Dict], parallelism: int = 1,
+                 clock: Callable[[], float] = time.monotonic):
+        self.seconds = seconds
+        self.clock = clock
+        self.ends_at = clock() + seconds
+        self.top_priority = max((venue_priority(v) for v in venues), default=0.0)
+        self._share = seconds * max(1, parallelism) / (sum(venue_priority(v) for v in venues) or 1.0)
+
+    def remaining(self) -> float:
+        """Seconds left until the deadline (negative once it has passed)"""
+        return self.ends_at - self.clock()
+
+    def budget(self, venue: Dict) -> float:
+        """Time budget in seconds for a venue starting now"""
+        share = max(MIN_VENUE_BUDGET, self._share * venue_priority(venue))
+        return max(0.0, min(share, self.remaining()))
+
+    def admit(self, venue: Dict, expected: float) -> Optional[str]:
+        """
+        Decide whether a venue may start now
+
+        Args:
+            venue: Venue configuration dict from kluby.json
+            expected: Expected duration in seconds (see durations.py)
+
+        Returns:
+            None if it may start, otherwise the reason it is skipped
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            return "deadline vypršel"
+        if expected > remaining and venue_priority(venue) < self.top_priority:
+            return f"zbývá {remaining:.0f} s, odhad {expected:.0f} s, nízká priorita"
+        return None
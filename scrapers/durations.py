@@ -0,0 +1,57 @@
+"""
+Venue Durations
+===============
+Per-venue wall-time history (scraper_state/venue_durations.json) used to
+schedule slow venues first, so a parallel run is not held up by a slow venue
+that happened to start last.
+
+The estimate for a venue is the median of its last HISTORY_LENGTH runs;
+venues without history get the median over all known venues (or
+DEFAULT_ESTIMATE on the very first run).
+"""
+
+import heapq
+from statistics import median
+from typing import Dict, Iterable, List
+
+from .state_store import load_state, update_state
+
+
+DURATIONS_STATE = 'venue_durations'
+HISTORY_LENGTH = 5
+DEFAULT_ESTIMATE = 30.0  # seconds
+
+
+class DurationHistory:
+    """Recorded scrape durations per venue name"""
+
+    def __init__(self):
+        self.history: Dict[str, List[float]] = load_state(DURATIONS_STATE)
+        known = [median(runs) for runs in self.history.values() if runs]
+        self.fallback = median(known) if known else DEFAULT_ESTIMATE
+
+    def estimate(self, venue_name: str) -> float:
+        """Expected duration in seconds"""
+        runs = self.history.get(venue_name)
+        return median(runs) if runs else self.fallback
+
+    def record(self, durations: Dict[str, float]) -> None:
+        """Append this run's durations (venue name -> seconds), keeping the last HISTORY_LENGTH"""
+        def update(state: Dict) -> None:
+            for venue_name, seconds in durations.items():
+                runs = state.get(venue_name, []) + [round(seconds, 1)]
+                state[venue_name] = runs[-HISTORY_LENGTH:]
+        self.history = update_state(DURATIONS_STATE, update)
+
+
+def predict_makespan(durations: Iterable[float], workers: int) -> float:
+    """
+    Makespan of longest-job-first list scheduling on `workers` workers
+
+    Ignores the per-host cap, so it is a lower bound when hosts collide.
+    """
+    finish_times = [0.0] * max(1, workers)
+    for duration in sorted(durations, reverse=True):
+        earliest = heapq.heappop(finish_times)
+        heapq.heappush(finish_times, earliest + duration)
+    return max(finish_times)
@@ -0,0 +1,441 @@
+"""
+HTML Parser Backends
+====================
+Venue parsers build their tree through BaseScraper.make_soup() instead of
+BeautifulSoup(html, 'lxml') directly, so the backend is selectable per venue:
+
+- 'lxml' (default): LxmlNode, a thin wrapper over lxml.html elements with the
+  BeautifulSoup subset the parsers use - find(), find_all(), find_parent(),
+  find_next_sibling(), find_next(), get_text(), .text, .name, .parent,
+  .attrs, .get(), ['attr'], select()/select_one() (needs cssselect). Tag,
+  class and plain attribute filters are compiled into cached XPath queries
+  with variables; regex / list / callable filters are checked in Python on
+  the pre-selected elements. No second (BeautifulSoup) tree is built, which
+  is where most of the parsing time went.
+- 'bs4': BeautifulSoup(html, 'lxml'), the reference behaviour.
+
+Scrapers choose with PARSER_BACKEND (kluby.json "parser" overrides), and
+BrowserScraper.parse() re-runs a parser on 'bs4' if it raises on 'lxml'
+(UnsupportedQuery for filters outside the subset).
+
+Partial parsing: a scraper whose parser only reads its event elements
+declares them as TARGETS, a simple CSS selector (tag, .class, [attr],
+[attr=|^=|*=|$=|~="value"]; no combinators). The document then holds just
+those subtrees (outermost matches, in document order): 'bs4' builds nothing
+else (SoupStrainer), 'lxml' moves them out of the full tree - lxml's C tree
+build is cheaper than filtering parser events in Python - so both backends
+give the parser the same view.
+
+debug_scripts/benchmark_parsers.py compares both on the data_raw/ pages.
+"""
+
+import re
+import threading
+from functools import lru_cache
+from typing import Any, Iterator, List, Optional, Tuple
+
+import lxml.html
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
+
+
+BACKENDS = ('lxml', 'bs4')
+DEFAULT_BACKEND = 'lxml'
+
+# Attributes BeautifulSoup splits into lists
+MULTI_VALUED = {'class', 'rel', 'rev', 'accept-charset', 'headers', 'accesskey', 'dropzone'}
+# Their text is not part of get_text() (BeautifulSoup >= 4.10)
+NON_TEXT_TAGS = {'script', 'style', 'template'}
+# Whitespace-only strings are collapsed to '\n' or ' ' except inside these
+PRESERVE_WHITESPACE_TAGS = {'pre', 'textarea'}
+ASCII_SPACES = ' \n\t\x0c\r'
+XPATH_NAME = re.compile(r'^[A-Za-z_][\w.-]*$')
+
+_local = threading.local()
+
+
+class UnsupportedQuery(TypeError):
+    """A query uses BeautifulSoup features LxmlNode does not implement"""
+
+
+def parse_document(html: str, backend: str = DEFAULT_BACKEND, targets: Optional[str] = None):
+    """
+    Parse HTML with the given backend
+
+    Args:
+        html: HTML document or fragment
+        backend: 'lxml' or 'bs4'
+        targets: Optional TARGETS selector; only the matching subtrees are kept
+
+    Returns:
+        LxmlNode of the document root ('lxml') or a BeautifulSoup object ('bs4')
+    """
+    if backend == 'bs4':
+        if targets:
+            return BeautifulSoup(html, 'lxml', parse_only=strainer(targets).soup_strainer())
+        return BeautifulSoup(html, 'lxml')
+    if backend != 'lxml':
+        raise ValueError(f"Unknown parser backend: {backend!r}")
+
+    # lxml parsers are not thread-safe; bytes + explicit encoding also
+    # accept documents that carry an XML encoding declaration
+    parser = getattr(_local, 'parser', None)
+    if parser is None:
+        parser = _local.parser = lxml.html.HTMLParser(encoding='utf-8')
+    data = html.encode('utf-8') if isinstance(html, str) else html
+    if not data.strip():
+        data = b'<html></html>'
+    root = lxml.html.document_fromstring(data, parser=parser)
+    if targets:
+        root = strainer(targets).prune(root)
+    return LxmlNode(root)
+
+
+def has_selector(html: str, selector: str) -> bool:
+    """True if a CSS selector matches in the HTML (lxml + cssselect, else BeautifulSoup)"""
+    try:
+        return parse_document(html, 'lxml').select_one(selector) is not None
+    except UnsupportedQuery:
+        return BeautifulSoup(html, 'lxml').select_one(selector) is not None
+
+
+def _collapse(text: str, preserve: bool) -> str:
+    """BeautifulSoup's handling of whitespace-only strings"""
+    if preserve or text.strip(ASCII_SPACES):
+        return text
+    return '\n' if '\n' in text else ' '
+
+
+def _is_regex(value: Any) -> bool:
+    return hasattr(value, 'search') and not isinstance(value, str)
+
+
+def _match_value(value: Optional[str], matcher: Any) -> bool:
+    """BeautifulSoup attribute filter semantics for one attribute value"""
+    if matcher is True:
+        return value is not None
+    if matcher is None or matcher is False:
+        return value is None
+    if value is None:
+        return False
+    if isinstance(matcher, str):
+        return value == matcher
+    if _is_regex(matcher):
+        return matcher.search(value) is not None
+    if isinstance(matcher, (list, tuple, set)):
+        return any(_match_value(value, m) for m in matcher)
+    if callable(matcher):
+        return bool(matcher(value))
+    raise UnsupportedQuery(f"Unsupported attribute filter: {matcher!r}")
+
+
+def _match_multi(value: Optional[str], matcher: Any) -> bool:
+    """Multi-valued attributes (class): any single value or the whole string may match"""
+    if value is None or matcher is True or matcher is None or matcher is False:
+        return _match_value(value, matcher)
+    return any(_match_value(part, matcher) for part in value.split()) or _match_value(value, matcher)
+
+
+def _match_name(tag: str, matcher: Any) -> bool:
+    if matcher is None or matcher is True:
+        return True
+    if isinstance(matcher, str):
+        return tag == matcher
+    if _is_regex(matcher):
+        return matcher.search(tag) is not None
+    if isinstance(matcher, (list, tuple, set)):
+        return tag in matcher
+    if callable(matcher):
+        raise UnsupportedQuery("Tag functions are not supported")
+    raise UnsupportedQuery(f"Unsupported name filter: {matcher!r}")
+
+
+class _Query:
+    """A find()/find_all() filter split into an XPath part and a Python remainder"""
+
+    def __init__(self, name: Any, attrs: Any, kwargs: dict):
+        for unsupported in ('string', 'text'):
+            if unsupported in kwargs:
+                raise UnsupportedQuery(f"'{unsupported}' filters are not supported")
+        filters = {}
+        if isinstance(attrs, dict):
+            filters.update(attrs)
+        elif attrs is not None:
+            filters['class'] = attrs  # find('div', 'event') filters on class
+        if 'class_' in kwargs:
+            filters['class'] = kwargs.pop('class_')
+        filters.update(kwargs)
+
+        self.name = name
+        self.filters = filters
+        xpath_tag = name if isinstance(name, str) and XPATH_NAME.match(name) else None
+        tests, values, rest = [], {}, {}
+        for key, matcher in filters.items():
+            if not XPATH_NAME.match(key):
+                rest[key] = matcher
+            elif matcher is True:
+                tests.append((key, 'present', None))
+            elif key in MULTI_VALUED and isinstance(matcher, str) and len(matcher.split()) == 1:
+                var = f"v{len(values)}"
+                tests.append((key, 'token', var))
+                values[var] = matcher
+            elif key not in MULTI_VALUED and isinstance(matcher, str):
+                var = f"v{len(values)}"
+                tests.append((key, 'equals', var))
+                values[var] = matcher
+            else:
+                rest[key] = matcher
+        self.key = (xpath_tag, tuple(tests))
+        self.values = values
+        self.rest = rest
+        self.check_name = xpath_tag is None and name not in (None, True)
+
+    def matches(self, el) -> bool:
+        """Python-side checks for what the XPath could not express"""
+        if self.check_name and not _match_name(el.tag, self.name):
+            return False
+        for key, matcher in self.rest.items():
+            value = el.get(key)
+            if key in MULTI_VALUED:
+                if not _match_multi(value, matcher):
+                    return False
+            elif not _match_value(value, matcher):
+                return False
+        return True
+
+
+ATTRIBUTE_TESTS = {
+    None: "@{attr}",
+    '=': "@{attr}=${var}",
+    '^=': "starts-with(@{attr}, ${var})",
+    '*=': "contains(@{attr}, ${var})",
+    '$=': "substring(@{attr}, string-length(@{attr}) - string-length(${var}) + 1)=${var}",
+    '~=': "contains(concat(' ', normalize-space(@{attr}), ' '), concat(' ', ${var}, ' '))",
+}
+TARGET_SELECTOR = re.compile(r'^([A-Za-z][\w-]*|\*)?((?:\.[\w-]+|\[[^\]]+\])*)$')
+TARGET_PART = re.compile(r"""\.([\w-]+)|\[\s*([\w-]+)\s*(?:([~^$*]?=)\s*(?:"([^"]*)"|'([^']*)'|([^\]\s]+))\s*)?\]""")
+
+
+class Strainer:
+    """
+    Keeps only the elements matching a TARGETS selector (see module docstring)
+
+    Raises:
+        UnsupportedQuery: On selector syntax beyond the simple subset
+    """
+
+    def __init__(self, selector: str):
+        match = TARGET_SELECTOR.match(selector.strip())
+        if not match:
+            raise UnsupportedQuery(f"TARGETS must be a simple selector (tag.class[attr]), got {selector!r}")
+        self.selector = selector
+        self.tag = None if match.group(1) == '*' else match.group(1)
+        self.classes: List[str] = []
+        self.attributes: List[Tuple[str, Optional[str], Optional[str]]] = []  # (attr, op, value)
+        parts = list(TARGET_PART.finditer(match.group(2)))
+        if ''.join(part.group(0) for part in parts) != match.group(2):
+            raise UnsupportedQuery(f"Unsupported attribute test in TARGETS {selector!r}")
+        for part in parts:
+            cls, attr, op, *quoted = part.groups()
+            if cls:
+                self.classes.append(cls)
+            else:
+                value = next((v for v in quoted if v is not None), None)
+                self.attributes.append((attr, op, value))
+
+        tests, self.values = [], {}
+        for attr, op, value in [('class', '~=', c) for c in self.classes] + self.attributes:
+            var = f"v{len(self.values)}"
+            tests.append(ATTRIBUTE_TESTS[op].format(attr=attr, var=var))
+            if op is not None:
+                self.values[var] = value
+        step = (self.tag or '*') + ''.join(f"[{t}]" for t in tests)
+        # Outermost matches only, the nested ones come with their ancestor
+        self.xpath = etree.XPath(f"descendant::{step}[not(ancestor::{step})]")
+
+    def prune(self, root):
+        """New root element holding only the matching subtrees of root"""
+        document = etree.Element('html')
+        for el in self.xpath(root, **self.values):
+            el.tail = None
+            document.append(el)
+        return document
+
+    def soup_strainer(self) -> SoupStrainer:
+        """Equivalent BeautifulSoup SoupStrainer (parse_only)"""
+        attrs: dict = {}
+        if self.classes:
+            # Regex on the raw class string (SoupStrainer sees it unsplit);
+            # anchored so every lookahead tests whole class tokens
+            attrs['class'] = re.compile('^' + ''.join(rf'(?=(?:.*\s)?{re.escape(c)}(?:\s|$))' for c in self.classes))
+        for attr, op, value in self.attributes:
+            if op is None:
+                attrs[attr] = True
+            elif op == '=':
+                attrs[attr] = value
+            else:
+                attrs[attr] = re.compile({
+                    '^=': '^{}', '*=': '{}', '$=': '{}$', '~=': r'(?:^|\s){}(?:\s|$)',
+                }[op].format(re.escape(value)))
+        return SoupStrainer(self.tag, attrs=attrs)
+
+
+@lru_cache(maxsize=128)
+def strainer(selector: str) -> Strainer:
+    """Cached Strainer of a TARGETS selector"""
+    return Strainer(selector)
+
+
+@lru_cache(maxsize=512)
+def _compile(axis: str, key: Tuple) -> etree.XPath:
+    tag, tests = key
+    predicates = []
+    for attr, kind, var in tests:
+        if kind == 'present':
+            predicates.append(f"@{attr}")
+        elif kind == 'token':
+            predicates.append(f"contains(concat(' ', normalize-space(@{attr}), ' '), concat(' ', ${var}, ' '))")
+        else:
+            predicates.append(f"@{attr}=${var}")
+    step = (tag or '*') + ''.join(f"[{p}]" for p in predicates)
+    if axis == 'next':
+        return etree.XPath(f"descendant::{step} | following::{step}")
+    return etree.XPath(f"{axis}::{step}")
+
+
+class LxmlNode:
+    """BeautifulSoup-compatible view of an lxml.html element (see module docstring)"""
+
+    __slots__ = ('_el',)
+
+    def __init__(self, el):
+        self._el = el
+
+    # --- identity / representation ---------------------------------------
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, LxmlNode) and other._el is self._el
+
+    def __hash__(self) -> int:
+        return id(self._el)
+
+    def __repr__(self) -> str:
+        return etree.tostring(self._el, encoding='unicode', with_tail=False)
+
+    __str__ = __repr__
+
+    # --- attributes ---------------------------------------------------------
+
+    @property
+    def name(self) -> str:
+        return self._el.tag
+
+    @property
+    def attrs(self) -> dict:
+        return {key: self.get(key) for key in self._el.attrib}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self._el.get(key)
+        if value is None:
+            return default
+        return value.split() if key in MULTI_VALUED else value
+
+    def has_attr(self, key: str) -> bool:
+        return key in self._el.attrib
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._el.attrib:
+            raise KeyError(key)
+        return self.get(key)
+
+    # --- text ---------------------------------------------------------------
+
+    def _strings(self) -> Iterator[str]:
+        preserve = any(a.tag in PRESERVE_WHITESPACE_TAGS for a in self._el.iterancestors())
+        stack = [(self._el, False, preserve)]
+        while stack:
+            el, tail_only, preserve = stack.pop()
+            if tail_only:
+                if el.tail:
+                    yield _collapse(el.tail, preserve)
+                continue
+            inside = preserve or el.tag in PRESERVE_WHITESPACE_TAGS
+            if el.text and (el is self._el or el.tag not in NON_TEXT_TAGS):
+                yield _collapse(el.text, inside)
+            for child in reversed(el):
+                stack.append((child, True, preserve))
+                if isinstance(child.tag, str) and child.tag not in NON_TEXT_TAGS:
+                    stack.append((child, False, inside))
+
+    def get_text(self, separator: str = '', strip: bool = False) -> str:
+        strings = self._strings()
+        if strip:
+            strings = (s.strip() for s in strings)
+            strings = (s for s in strings if s)
+        return separator.join(strings)
+
+    @property
+    def text(self) -> str:
+        return self.get_text()
+
+    # --- navigation ---------------------------------------------------------
+
+    @property
+    def parent(self) -> Optional['LxmlNode']:
+        parent = self._el.getparent()
+        return LxmlNode(parent) if parent is not None else None
+
+    def _search(self, axis: str, name: Any, attrs: Any, kwargs: dict, limit: Optional[int]) -> List['LxmlNode']:
+        query = _Query(name, attrs, kwargs)
+        candidates = _compile(axis, query.key)(self._el, **query.values)
+        if axis == 'ancestor':
+            candidates = reversed(candidates)
+        found = []
+        for el in candidates:
+            if query.matches(el):
+                found.append(LxmlNode(el))
+                if limit and len(found) >= limit:
+                    break
+        return found
+
+    def find_all(self, name: Any = None, attrs: Any = None, recursive: bool = True,
+                 limit: Optional[int] = None, **kwargs) -> List['LxmlNode']:
+        return self._search('descendant' if recursive else 'child', name, attrs, kwargs, limit)
+
+    __call__ = find_all
+
+    def find(self, name: Any = None, attrs: Any = None, recursive: bool = True, **kwargs) -> Optional['LxmlNode']:
+        found = self.find_all(name, attrs, recursive, limit=1, **kwargs)
+        return found[0] if found else None
+
+    def find_parent(self, name: Any = None, attrs: Any = None, **kwargs) -> Optional['LxmlNode']:
+        found = self._search('ancestor', name, attrs, kwargs, limit=1)
+        return found[0] if found else None
+
+    def find_next_sibling(self, name: Any = None, attrs: Any = None, **kwargs) -> Optional['LxmlNode']:
+        found = self._search('following-sibling', name, attrs, kwargs, limit=1)
+        return found[0] if found else None
+
+    def find_next(self, name: Any = None, attrs: Any = None, **kwargs) -> Optional['LxmlNode']:
+        found = self._search('next', name, attrs, kwargs, limit=1)
+        return found[0] if found else None
+
+    # --- CSS ----------------------------------------------------------------
+
+    def select(self, selector: str) -> List['LxmlNode']:
+        return [LxmlNode(el) for el in _css(selector)(self._el)]
+
+    def select_one(self, selector: str) -> Optional['LxmlNode']:
+        found = self.select(selector)
+        return found[0] if found else None
+
+
+@lru_cache(maxsize=128)
+def _css(selector: str):
+    try:
+        from lxml.cssselect import CSSSelector
+        return CSSSelector(selector)
+    except ImportError as e:  # cssselect is optional
+        raise UnsupportedQuery("CSS selectors need the cssselect package") from e
+    except Exception as e:  # selector syntax cssselect does not know
+        raise UnsupportedQuery(f"Unsupported CSS selector {selector!r}: {e}") from e
@@ -0,0 +1,135 @@
+"""
+HTTP Session
+============
+One shared requests session for all plain-HTTP fetches of a run (listing
+pages, JSON endpoints, detail pages).
+
+- keep-alive: connections are pooled per host and reused across venues and
+  worker threads (urllib3 pools are thread-safe)
+- per-host pool sizes: mount_host_pool() widens the pool for hosts that serve
+  several venues (GoOut) or many detail pages (kluby.json "http_pool_size")
+- compression: gzip/deflate always, brotli when brotli/brotlicffi is installed
+  (urllib3 can only decode br then)
+- caching: with requests-cache installed the session is a CachedSession and
+  every request carries its venue's TTL (kluby.json "cache_ttl" in seconds,
+  0 = never cache); without it requests go straight to the network
+"""
+
+import logging
+import threading
+from typing import Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import requests_cache
+except ImportError:  # optional, development cache only
+    requests_cache = None
+
+
+CACHE_NAME = 'concert_scraper_cache'
+DEFAULT_CACHE_TTL = 3600  # seconds
+POOL_CONNECTIONS = 32     # number of hosts kept in the pool manager
+POOL_MAXSIZE = 4          # connections per host
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+logger = logging.getLogger(__name__)
+_lock = threading.Lock()
+_session: Optional[requests.Session] = None
+
+
+def _brotli_available() -> bool:
+    for module in ('brotli', 'brotlicffi'):
+        try:
+            __import__(module)
+            return True
+        except ImportError:
+            continue
+    return False
+
+
+def accept_encoding() -> str:
+    """Accept-Encoding header value for the encodings we can actually decode"""
+    return 'gzip, deflate, br' if _brotli_available() else 'gzip, deflate'
+
+
+def _build_session() -> requests.Session:
+    if requests_cache is not None:
+        session = requests_cache.CachedSession(CACHE_NAME, expire_after=DEFAULT_CACHE_TTL)
+    else:
+        session = requests.Session()
+
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update({
+        'User-Agent': USER_AGENT,
+        'Accept-Encoding': accept_encoding(),
+    })
+    logger.debug(f"HTTP session ready (cache: {requests_cache is not None}, "
+                 f"encodings: {session.headers['Accept-Encoding']})")
+    return session
+
+
+def get_session() -> requests.Session:
+    """Return the shared session, creating it on first use"""
+    global _session
+    with _lock:
+        if _session is None:
+            _session = _build_session()
+        return _session
+
+
+def mount_host_pool(host: str, maxsize: int) -> None:
+    """
+    Give one host its own connection pool size
+
+    Args:
+        host: Host name, e.g. 'goout.net'
+        maxsize: Maximum concurrent keep-alive connections to that host
+    """
+    session = get_session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=maxsize)
+    for scheme in ('http', 'https'):
+        session.mount(f"{scheme}://{host}", adapter)
+
+
+def fetch(url: str, timeout: float = 10, cache_ttl: Optional[int] = None) -> requests.Response:
+    """
+    GET a URL through the shared session
+
+    Args:
+        url: URL to fetch
+        timeout: Request timeout in seconds
+        cache_ttl: Cache lifetime in seconds (None = DEFAULT_CACHE_TTL, 0 = bypass cache)
+
+    Returns:
+        Response (raise_for_status() already called)
+
+    Raises:
+        requests.RequestException: On network or HTTP errors
+    """
+    session = get_session()
+    kwargs = {}
+    if requests_cache is not None:
+        if cache_ttl == 0:
+            kwargs['expire_after'] = requests_cache.DO_NOT_CACHE
+        else:
+            kwargs['expire_after'] = DEFAULT_CACHE_TTL if cache_ttl is None else cache_ttl
+
+    response = session.get(url, timeout=timeout, **kwargs)
+    if getattr(response, 'from_cache', False):
+        logger.debug(f"Cache hit for {urlparse(url).netloc}{urlparse(url).path}")
+    response.raise_for_status()
+    return response
+
+
+def close_session() -> None:
+    """Close pooled connections (end of run)"""
+    global _session
+    with _lock:
+        if _session is not None:
+            _session.close()
+            _session = None
@@ -0,0 +1,210 @@
+"""
+JSON Capture
+============
+Many venue pages (GoOut and other ticketing widgets) render their listings
+from XHR/fetch JSON. Instead of serializing the rendered DOM and re-parsing it
+with BeautifulSoup, JsonCapture records the JSON responses whose URL matches a
+per-venue pattern and events_from_json() turns them into event dicts with
+dates taken from ISO timestamps rather than from display text.
+
+The extractor is generic: it walks the payload and treats every object with a
+start date and a name as an event. JSON:API payloads (GoOut) are supported by
+merging "attributes" into the record and resolving names through
+"relationships" to "included" entities.
+"""
+
+import logging
+import re
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urljoin
+
+from .date_extract import ISO
+
+
+logger = logging.getLogger(__name__)
+
+START_KEYS = ('startAt', 'start', 'startDate', 'start_date', 'startsAt', 'dateFrom',
+              'date_from', 'beginAt', 'datetime', 'dateTime', 'date')
+NAME_KEYS = ('name', 'title', 'eventName', 'nazev', 'headline')
+URL_KEYS = ('url', 'absoluteUrl', 'link', 'href', 'detailUrl', 'siteUrl')
+LOCALES = ('cs', 'en')
+
+class JsonCapture:
+    """
+    Records JSON responses of a Playwright page whose URL matches a pattern
+
+    Response bodies are read after navigation (read_payloads), not inside the
+    event handler, so the sync API never blocks in a callback.
+
+    Args:
+        pattern: Regular expression searched in response URLs
+    """
+
+    def __init__(self, pattern: str):
+        self.pattern = re.compile(pattern)
+        self.responses: List[Any] = []
+
+    def matches(self, url: str) -> bool:
+        return bool(self.pattern.search(url))
+
+    def install(self, page) -> None:
+        """Start recording matching responses of a page (call before goto)"""
+        page.on('response', self._on_response)
+
+    def _on_response(self, response) -> None:
+        if self.matches(response.url):
+            self.responses.append(response)
+
+    def read_payloads(self) -> List[Tuple[str, Any]]:
+        """Return (url, parsed JSON) for every recorded response with a JSON body"""
+        payloads = []
+        for response in self.responses:
+            try:
+                payloads.append((response.url, response.json()))
+            except Exception as e:
+                logger.debug(f"Skipping non-JSON response {response.url}: {e}")
+        return payloads
+
+
+def _localized(value: Any) -> Optional[str]:
+    """Plain string, or the cs/en (or first) entry of a {locale: text} dict"""
+    if isinstance(value, str):
+        return value.strip() or None
+    if isinstance(value, dict):
+        for locale in LOCALES:
+            if isinstance(value.get(locale), str) and value[locale].strip():
+                return value[locale].strip()
+        for text in value.values():
+            if isinstance(text, str) and text.strip():
+                return text.strip()
+    return None
+
+
+def _flatten(record: Dict) -> Dict:
+    """Merge JSON:API "attributes" into the record itself"""
+    attributes = record.get('attributes')
+    if isinstance(attributes, dict):
+        return {**record, **attributes}
+    return record
+
+
+def _index_entities(data: Any, index: Dict[Tuple[str, str], Dict]) -> None:
+    """Collect every {"type", "id"} object so relationships can be resolved"""
+    if isinstance(data, dict):
+        if isinstance(data.get('type'), str) and 'id' in data:
+            key = (data['type'], str(data['id']))
+            # Bare {"type", "id"} references must not shadow the full entity
+            if len(data) > len(index.get(key, {})):
+                index[key] = data
+        for value in data.values():
+            _index_entities(value, index)
+    elif isinstance(data, list):
+        for item in data:
+            _index_entities(item, index)
+
+
+def _related_value(record: Dict, keys: Tuple[str, ...], index: Dict) -> Optional[str]:
+    """Look up the first of keys on entities referenced by record's relationships"""
+    relationships = record.get('relationships')
+    if not isinstance(relationships, dict):
+        return None
+    for relation in relationships.values():
+        refs = relation.get('data') if isinstance(relation, dict) else None
+        for ref in refs if isinstance(refs, list) else [refs]:
+            if not isinstance(ref, dict):
+                continue
+            entity = index.get((ref.get('type'), str(ref.get('id'))))
+            if entity:
+                entity = _flatten(entity)
+                for key in keys:
+                    value = _localized(entity.get(key))
+                    if value:
+                        return value
+    return None
+
+
+def _first(record: Dict, keys: Tuple[str, ...]) -> Optional[str]:
+    for key in keys:
+        value = _localized(record.get(key))
+        if value:
+            return value
+    return None
+
+
+def iter_event_records(data: Any) -> Iterator[Dict]:
+    """Yield every object in a JSON payload that has a parseable start date"""
+    if isinstance(data, dict):
+        record = _flatten(data)
+        start = _first(record, START_KEYS)
+        if start and ISO.match(start):
+            yield record
+            return
+        for value in data.values():
+            yield from iter_event_records(value)
+    elif isinstance(data, list):
+        for item in data:
+            yield from iter_event_records(item)
+
+
+def events_from_json(payloads: List[Tuple[str, Any]], venue: str, city: str,
+                     month: int, year: int) -> List[Dict]:
+    """
+    Convert captured JSON payloads into event dicts for one month
+
+    Args:
+        payloads: (response URL, parsed JSON) pairs from JsonCapture
+        venue: Venue name for the events
+        city: City for the events
+        month: Target month (1-12)
+        year: Target year
+
+    Returns:
+        Events sorted by day, de-duplicated on (day, time, artist)
+    """
+    events = []
+    seen = set()
+
+    for source_url, data in payloads:
+        index: Dict[Tuple[str, str], Dict] = {}
+        _index_entities(data, index)
+
+        for record in iter_event_records(data):
+            day, ev_month, ev_year, time_str = ISO.match(_first(record, START_KEYS))
+            if (ev_year, ev_month) != (year, month):
+                continue
+
+            artist = _first(record, NAME_KEYS) or _related_value(record, NAME_KEYS, index)
+            if not artist:
+                continue
+            if time_str == '00:00':
+                time_str = None  # date-only timestamps
+
+            key = (day, time_str, artist)
+            if key in seen:
+                continue
+            seen.add(key)
+
+            url = _first(record, URL_KEYS) or _related_value(record, URL_KEYS, index) or ''
+            if url and not url.startswith('http'):
+                url = urljoin(source_url, url)
+
+            events.append({
+                'date': f"{day:02d}.{month:02d}.{year}",
+                'day': day,
+                'month': month,
+                'year': year,
+                'time': time_str,
+                'artist': artist,
+                'venue': venue,
+                'city': city,
+                'url': url,
+                # Legacy fields for backwards compatibility
+                'den': day,
+                'den_tydne': None,
+                'cas': time_str,
+                'umelec': artist,
+                'misto': venue,
+                'status': None
+            })
+
+    return sorted(events, key=lambda x: (x['day'], x['time'] or ''))
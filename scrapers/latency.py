@@ -0,0 +1,77 @@
+"""
+Venue Latencies
+===============
+Per-venue page latencies (scraper_state/venue_latencies.json) from which the
+browser tier derives its timeouts, instead of one constant for every site.
+
+Two kinds are recorded after every successful browser fetch:
+- 'navigation': page.goto() until the load state (WAIT_UNTIL)
+- 'selector': waiting for the venue's event nodes after navigation
+
+A venue's timeout for a kind is PERCENTILE of its last HISTORY_LENGTH
+samples times MARGIN, clamped to [MIN_TIMEOUT, MAX_TIMEOUT]. Until
+MIN_SAMPLES are known the scraper's constant (FETCH_TIMEOUT) applies, and
+kluby.json "timeout_ms" overrides everything. A dead site thus fails after a
+few seconds for a fast venue instead of a fixed minute.
+
+typical_latency() (median navigation + median selector wait) is the point
+after which a hedged venue starts its second attempt (see BrowserScraper.HEDGE).
+"""
+
+import math
+from statistics import median
+from typing import Dict, List, Optional
+
+from .state_store import load_state, update_state
+
+
+LATENCIES_STATE = 'venue_latencies'
+HISTORY_LENGTH = 20
+MIN_SAMPLES = 3
+PERCENTILE = 95
+MARGIN = 2.0
+MIN_TIMEOUT = 5000   # ms
+MAX_TIMEOUT = 90000  # ms
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a non-empty sample list"""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def record_latency(venue_name: str, kind: str, ms: float) -> None:
+    """Append one latency sample (milliseconds), keeping the last HISTORY_LENGTH"""
+    def update(state: Dict) -> None:
+        venue = state.setdefault(venue_name, {})
+        venue[kind] = (venue.get(kind, []) + [round(ms)])[-HISTORY_LENGTH:]
+    update_state(LATENCIES_STATE, update)
+
+
+def learned_timeout(venue_name: str, kind: str) -> Optional[int]:
+    """
+    Timeout in milliseconds derived from the venue's history
+
+    Returns:
+        None until MIN_SAMPLES samples of that kind are recorded
+    """
+    samples = load_state(LATENCIES_STATE).get(venue_name, {}).get(kind, [])
+    if len(samples) < MIN_SAMPLES:
+        return None
+    return int(min(MAX_TIMEOUT, max(MIN_TIMEOUT, percentile(samples, PERCENTILE) * MARGIN)))
+
+
+def typical_latency(venue_name: str) -> Optional[float]:
+    """
+    Typical time in seconds until a venue's page shows its events
+
+    Returns:
+        None until MIN_SAMPLES navigation samples are recorded
+    """
+    history = load_state(LATENCIES_STATE).get(venue_name, {})
+    navigation = history.get('navigation', [])
+    if len(navigation) < MIN_SAMPLES:
+        return None
+    selector = history.get('selector', [])
+    return (median(navigation) + (median(selector) if selector else 0)) / 1000
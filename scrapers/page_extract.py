@@ -0,0 +1,68 @@
+"""
+Targeted Page Extraction
+========================
+page.content() serializes the whole document (100-325 KB per venue) only for
+BeautifulSoup to rebuild a tree of it. extract_html() serializes just the
+outerHTML of the event containers a scraper declares, optionally dropping
+in-page the containers whose text does not mention the target month.
+
+Selector and text pattern may contain the placeholders {month} (11),
+{mm} (zero-padded, 11 / 02) and {year}; they are substituted literally, so
+regex quantifiers like \\d{1,2} stay untouched.
+"""
+
+import logging
+from typing import Optional
+
+
+logger = logging.getLogger(__name__)
+
+# Outermost matches only (nested matches are already inside their ancestor's
+# outerHTML). Table cells/rows are wrapped so the HTML parser keeps them.
+EXTRACT_JS = """
+([selector, textPattern]) => {
+    const textRe = textPattern ? new RegExp(textPattern) : null;
+    const nodes = Array.from(document.querySelectorAll(selector)).filter(node =>
+        !(node.parentElement && node.parentElement.closest(selector)) &&
+        (!textRe || textRe.test(node.textContent)));
+    const parts = nodes.map(node => {
+        if (node.tagName === 'TD' || node.tagName === 'TH') {
+            return '<table><tr>' + node.outerHTML + '</tr></table>';
+        }
+        if (node.tagName === 'TR') {
+            return '<table>' + node.outerHTML + '</table>';
+        }
+        return node.outerHTML;
+    });
+    return {count: nodes.length, html: parts.join('\\n')};
+}
+"""
+
+
+def fill_placeholders(template: str, month: int, year: int) -> str:
+    """Substitute {month}, {mm} and {year} in a selector or pattern"""
+    return (template.replace('{month}', str(month))
+                    .replace('{mm}', f"{month:02d}")
+                    .replace('{year}', str(year)))
+
+
+def extract_html(page, selector: str, text_pattern: Optional[str] = None) -> Optional[str]:
+    """
+    Serialize only the nodes matching selector
+
+    Args:
+        page: Playwright page
+        selector: CSS selector of the event containers
+        text_pattern: Optional JS regex; containers whose text does not match are dropped
+
+    Returns:
+        Minimal HTML document with the matching nodes, or None if nothing matched
+    """
+    result = page.evaluate(EXTRACT_JS, [selector, text_pattern])
+    if not result['count']:
+        logger.info(f"No nodes match extract selector {selector!r}")
+        return None
+
+    html = f"<html><body>\n{result['html']}\n</body></html>"
+    logger.info(f"Extracted {result['count']} nodes ({len(html)} chars) for {selector!r}")
+    return html
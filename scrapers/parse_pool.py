@@ -0,0 +1,82 @@
+"""
+Parse Pool
+==========
+Second stage of the fetch -> parse pipeline. A worker thread only fetches
+(BrowserScraper.fetch_source()) and hands the raw HTML string or captured
+JSON to a ParsePool; BeautifulSoup parsing then runs in a worker process
+while the thread and its browser move on to the next venue.
+
+Only picklable data crosses the process boundary: the scraper is rebuilt in
+the worker from its module, class name, month, year and kluby.json entry,
+and the event dicts come back. Validation stays in the main process, on the
+original scraper (see ParsePool.submit). Workers are spawned, not forked:
+the parent runs browser threads that a fork would copy mid-flight.
+"""
+
+import importlib
+import logging
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+def parse_in_process(module: str, class_name: str, month: int, year: int,
+                     venue_config: Dict, kind: str, data: Any) -> List[Dict]:
+    """Rebuild a scraper in the worker process and run its parse stage"""
+    scraper_class = getattr(importlib.import_module(module), class_name)
+    scraper = scraper_class(month=month, year=year)
+    scraper.configure(venue_config)
+    return scraper.parse_source(kind, data)
+
+
+class ParsePool:
+    """
+    Process pool for the parse stage of BrowserScrapers
+
+    Args:
+        processes: Number of worker processes (None = CPU count)
+    """
+
+    def __init__(self, processes: Optional[int] = None):
+        self._executor = ProcessPoolExecutor(max_workers=processes,
+                                             mp_context=multiprocessing.get_context('spawn'))
+        self.submitted = 0
+
+    def __enter__(self) -> 'ParsePool':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def submit(self, scraper, kind: str, data: Any) -> Future:
+        """
+        Parse a fetched source in a worker process
+
+        Args:
+            scraper: The BrowserScraper that fetched the source
+            kind: Source kind from fetch_source() ('html' or 'json')
+            data: HTML string or captured JSON payloads
+
+        Returns:
+            Future of the event list; when it completes the events are also
+            stored in scraper.events, so scraper.validate() works as usual
+        """
+        scraper_class = type(scraper)
+        future = self._executor.submit(
+            parse_in_process, scraper_class.__module__, scraper_class.__qualname__,
+            scraper.month, scraper.year, scraper.venue_config, kind, data)
+        self.submitted += 1
+
+        def store(done: Future) -> None:
+            if done.exception() is None:
+                scraper.events = done.result()
+        future.add_done_callback(store)
+        return future
+
+    def close(self) -> None:
+        """Wait for pending parses and stop the worker processes"""
+        self._executor.shutdown(wait=True)
+        logger.info(f"Parse pool closed: {self.submitted} sources parsed")
@@ -0,0 +1,146 @@
+"""
+Page Readiness
+==============
+Waits until a browser page is ready to serialize instead of sleeping a
+fixed amount of time.
+
+A page counts as ready as soon as either
+- at least `min_count` nodes match the event selector, or
+- the selector has matched (or, without a selector, the body exists) and the
+  DOM tree has not changed for `quiet_ms`.
+
+The old fixed sleep survives only as the upper bound `max_wait_ms`; hitting
+it is not an error, the page is simply serialized as it is.
+
+scroll_until() builds on the same wait for lazy-loading listings.
+"""
+
+import logging
+import time
+from typing import Optional
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeout
+
+
+logger = logging.getLogger(__name__)
+
+# Structural mutations only - carousels and animations touch attributes
+# constantly and would keep the page from ever looking quiet.
+READY_PREDICATE_JS = """
+([selector, minCount, quietMs]) => {
+    if (!window.__koncertyObserver) {
+        window.__koncertyLastMutation = performance.now();
+        window.__koncertyObserver = new MutationObserver(() => {
+            window.__koncertyLastMutation = performance.now();
+        });
+        window.__koncertyObserver.observe(document.documentElement,
+            {childList: true, subtree: true, characterData: true});
+    }
+    const count = selector ? document.querySelectorAll(selector).length
+                           : (document.body ? 1 : 0);
+    if (minCount && count >= minCount) {
+        return true;
+    }
+    if (quietMs === null || count === 0) {
+        return false;
+    }
+    return performance.now() - window.__koncertyLastMutation >= quietMs;
+}
+"""
+
+
+def wait_until_ready(page, selector: Optional[str] = None, min_count: Optional[int] = None,
+                     quiet_ms: Optional[int] = 500, max_wait_ms: int = 3000) -> bool:
+    """
+    Wait until the page is ready (see module docstring)
+
+    Args:
+        page: Playwright page
+        selector: CSS selector of the event container / event nodes
+        min_count: Return immediately once this many nodes match selector
+        quiet_ms: Required DOM quiet window (None = only min_count counts)
+        max_wait_ms: Upper bound, replaces the old fixed sleep
+
+    Returns:
+        True if the page became ready, False if max_wait_ms was reached
+    """
+    start = time.monotonic()
+    try:
+        page.wait_for_function(
+            READY_PREDICATE_JS,
+            arg=[selector, min_count or 0, quiet_ms],
+            timeout=max_wait_ms,
+            polling=100,
+        )
+        ready = True
+    except PlaywrightTimeout:
+        ready = False
+
+    elapsed_ms = (time.monotonic() - start) * 1000
+    logger.debug(f"Page {'ready' if ready else 'not settled'} after {elapsed_ms:.0f} ms "
+                 f"(selector={selector!r}, upper bound {max_wait_ms} ms)")
+    return ready
+
+
+# Stop predicate for chronological listings: has the last item's "D. M." date
+# moved past the target month? Listings start at today, so a month 1-6 ahead
+# of the target (mod 12, handles December -> January) means we are past it.
+LAST_ITEM_PAST_MONTH_JS = """
+([itemSelector, dateSelector, targetMonth]) => {
+    const items = document.querySelectorAll(itemSelector);
+    if (!items.length) {
+        return false;
+    }
+    const last = items[items.length - 1];
+    const dateEl = dateSelector ? last.querySelector(dateSelector) : last;
+    const match = dateEl && dateEl.textContent.match(/(\\d{1,2})\\.\\s*(\\d{1,2})\\./);
+    if (!match) {
+        return false;
+    }
+    const ahead = (parseInt(match[2], 10) - targetMonth + 12) % 12;
+    return ahead >= 1 && ahead <= 6;
+}
+"""
+
+
+def scroll_until(page, item_selector: str, stop_js: Optional[str] = None, stop_arg=None,
+                 max_scrolls: int = 10, max_wait_ms: int = 1500) -> int:
+    """
+    Infinite-scroll a lazy-loading listing
+
+    Scrolls to the bottom and waits for new items to be appended (not for a
+    fixed time). Stops when the stop predicate holds, when a scroll brings no
+    new items within max_wait_ms, or after max_scrolls.
+
+    Args:
+        page: Playwright page
+        item_selector: CSS selector of listing items
+        stop_js: Optional JS predicate evaluated with stop_arg before each scroll
+        stop_arg: Argument passed to stop_js
+        max_scrolls: Safety limit
+        max_wait_ms: How long to wait for new items after a scroll
+
+    Returns:
+        Number of items matched after scrolling
+    """
+    count_js = "(selector) => document.querySelectorAll(selector).length"
+    count = page.evaluate(count_js, item_selector)
+
+    for scroll in range(1, max_scrolls + 1):
+        if stop_js and page.evaluate(stop_js, stop_arg):
+            logger.info(f"Stopping scroll: stop condition met with {count} items")
+            return count
+
+        page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+        wait_until_ready(page, item_selector, min_count=count + 1,
+                         quiet_ms=None, max_wait_ms=max_wait_ms)
+
+        new_count = page.evaluate(count_js, item_selector)
+        logger.info(f"Scroll {scroll}: {new_count} items")
+        if new_count <= count:
+            logger.info(f"Reached end of listing after {scroll} scrolls")
+            return new_count
+        count = new_count
+
+    logger.info(f"Stopped after {max_scrolls} scrolls (safety limit)")
+    return count
@@ -0,0 +1,133 @@
+"""
+Resource Filter
+===============
+Request-level blocking for browser fetches.
+
+None of the images, fonts, videos or analytics scripts on venue pages end up
+in the HTML we parse, but Chromium downloads all of them before `networkidle`
+fires. ResourceFilter aborts those requests via Playwright routing.
+
+Per-venue profile in kluby.json (all keys optional, merged over the defaults):
+
+    "resource_blocking": {
+        "block_types": ["image", "media", "font"],
+        "block_domains": ["example-ads.com"],
+        "allow_domains": ["cdn.venue.cz"],
+        "block_third_party": true
+    }
+
+`"resource_blocking": false` turns blocking off for a venue.
+"""
+
+from collections import Counter
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+
+DEFAULT_BLOCK_TYPES = ('image', 'media', 'font')
+
+# Analytics / ads / social widgets seen on venue pages
+TRACKER_DOMAINS = (
+    'google-analytics.com', 'googletagmanager.com', 'doubleclick.net',
+    'googlesyndication.com', 'googleadservices.com', 'facebook.net',
+    'facebook.com', 'hotjar.com', 'smartlook.com', 'clarity.ms',
+    'gemius.pl', 'criteo.com', 'criteo.net', 'tiktok.com', 'pinterest.com',
+    'instagram.com', 'twitter.com', 'youtube.com', 'ytimg.com', 'vimeo.com',
+)
+
+
+def registrable_domain(host: str) -> str:
+    """Approximate registrable domain: last two labels ('www.goout.net' -> 'goout.net')"""
+    labels = [label for label in host.lower().split('.') if label]
+    return '.'.join(labels[-2:])
+
+
+def _matches_domain(host: str, domains: Iterable[str]) -> bool:
+    """True if host equals or is a subdomain of one of the domains"""
+    host = host.lower()
+    return any(host == d or host.endswith('.' + d) for d in domains)
+
+
+class ResourceFilter:
+    """
+    Decides which requests to abort and counts them per reason
+
+    Args:
+        page_url: URL of the venue page (defines what is first-party)
+        profile: Resource blocking profile (see module docstring)
+    """
+
+    def __init__(self, page_url: str, profile: Optional[Dict] = None):
+        profile = profile or {}
+        self.block_types = set(profile.get('block_types', DEFAULT_BLOCK_TYPES))
+        self.block_domains = tuple(TRACKER_DOMAINS) + tuple(profile.get('block_domains', []))
+        self.allow_domains = tuple(profile.get('allow_domains', []))
+        self.block_third_party = bool(profile.get('block_third_party', False))
+        self.first_party = registrable_domain(urlparse(page_url).netloc)
+        self.blocked: Counter = Counter()
+        self.allowed = 0
+
+    @classmethod
+    def for_venue(cls, page_url: str, venue_config: Dict) -> Optional['ResourceFilter']:
+        """Build the filter for a venue, or None if blocking is disabled"""
+        profile = venue_config.get('resource_blocking', {})
+        if profile is False:
+            return None
+        return cls(page_url, profile if isinstance(profile, dict) else {})
+
+    def block_reason(self, url: str, resource_type: str) -> Optional[str]:
+        """
+        Return why a request should be blocked, or None to let it through
+
+        Args:
+            url: Request URL
+            resource_type: Playwright resource type (image, script, xhr, ...)
+        """
+        host = urlparse(url).netloc.split(':')[0]
+        if not host:
+            return None  # data:, blob: etc.
+        if _matches_domain(host, self.allow_domains):
+            return None
+        if _matches_domain(host, self.block_domains):
+            return 'tracker'
+        if resource_type == 'document':
+            return None  # the page itself (or a first-party frame)
+        if resource_type in self.block_types:
+            return resource_type
+        if self.block_third_party and registrable_domain(host) != self.first_party:
+            return 'third-party'
+        return None
+
+    def install(self, page) -> None:
+        """Route all requests of a Playwright page through this filter"""
+        page.route('**/*', self._handle_route)
+
+    async def install_async(self, page) -> None:
+        """install() for pages of the async Playwright API"""
+        await page.route('**/*', self._handle_route_async)
+
+    def _should_abort(self, request) -> bool:
+        reason = self.block_reason(request.url, request.resource_type)
+        if reason:
+            self.blocked[reason] += 1
+            return True
+        self.allowed += 1
+        return False
+
+    def _handle_route(self, route) -> None:
+        if self._should_abort(route.request):
+            route.abort()
+        else:
+            route.continue_()
+
+    async def _handle_route_async(self, route) -> None:
+        if self._should_abort(route.request):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def summary(self) -> str:
+        """One-line summary for the log, e.g. 'blocked 84/131 requests (image: 60, font: 4, tracker: 20)'"""
+        total_blocked = sum(self.blocked.values())
+        details = ', '.join(f"{reason}: {count}" for reason, count in self.blocked.most_common())
+        return f"blocked {total_blocked}/{total_blocked + self.allowed} requests" + (f" ({details})" if details else "")
@@ -0,0 +1,117 @@
+"""
+Venue Scheduler
+===============
+Runs scrape jobs for many venues on a bounded pool of worker threads.
+
+Results come back in input order regardless of which venue finishes first,
+so events_data.json stays deterministic. A per-host cap keeps us from
+hitting one site with several browsers at once (GoOut serves three venues).
+An optional priority (expected duration, see durations.py) makes workers pick
+the longest jobs first.
+"""
+
+import logging
+import threading
+from collections import Counter
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager, Dict, List, Optional
+from urllib.parse import urlparse
+
+
+logger = logging.getLogger(__name__)
+
+
+def venue_host(venue: Dict) -> str:
+    """Return the lowercased host of a venue URL ('' if missing)"""
+    host = urlparse(venue.get('url', '')).netloc.lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+class VenueScheduler:
+    """
+    Bounded worker pool for venue scrape jobs
+
+    Args:
+        workers: Number of worker threads (1 = run sequentially in caller thread)
+        per_host_limit: Maximum number of jobs running against one host at a time
+        worker_setup: Optional context manager factory entered once per worker
+            thread around all its jobs (e.g. browser_pool.browser_session)
+    """
+
+    def __init__(self, workers: int = 1, per_host_limit: int = 1,
+                 worker_setup: Optional[Callable[[], ContextManager]] = None):
+        self.workers = max(1, workers)
+        self.per_host_limit = max(1, per_host_limit)
+        self.worker_setup = worker_setup or nullcontext
+
+    def run(self, venues: List[Dict], job: Callable[[Dict], Any],
+            priority: Optional[Callable[[Dict], float]] = None) -> List[Any]:
+        """
+        Run job(venue) for every venue
+
+        Args:
+            venues: Venue configuration dicts from kluby.json
+            job: Callable scraping a single venue
+            priority: Optional key; venues with higher values start first
+
+        Returns:
+            List of job results, in the same order as venues
+
+        Raises:
+            Exception: First exception raised by a job (after all workers stop)
+        """
+        if self.workers == 1 or len(venues) <= 1:
+            with self.worker_setup():
+                return [job(venue) for venue in venues]
+
+        results: List[Any] = [None] * len(venues)
+        errors: List[BaseException] = []
+        pending = list(range(len(venues)))
+        if priority is not None:
+            pending.sort(key=lambda idx: priority(venues[idx]), reverse=True)
+        active_hosts: Counter = Counter()
+        cond = threading.Condition()
+
+        def take() -> Optional[int]:
+            """Pop the first pending job whose host has spare capacity"""
+            with cond:
+                while pending:
+                    for idx in pending:
+                        if active_hosts[venue_host(venues[idx])] < self.per_host_limit:
+                            pending.remove(idx)
+                            active_hosts[venue_host(venues[idx])] += 1
+                            return idx
+                    cond.wait()
+                return None
+
+        def release(idx: int) -> None:
+            with cond:
+                active_hosts[venue_host(venues[idx])] -= 1
+                cond.notify_all()
+
+        def worker() -> None:
+            with self.worker_setup():
+                while True:
+                    idx = take()
+                    if idx is None:
+                        return
+                    try:
+                        results[idx] = job(venues[idx])
+                    except BaseException as e:
+                        logger.error(f"Job for {venues[idx].get('nazev')} crashed: {e}")
+                        errors.append(e)
+                    finally:
+                        release(idx)
+
+        threads = [
+            threading.Thread(target=worker, name=f"venue-worker-{n + 1}", daemon=True)
+            for n in range(min(self.workers, len(venues)))
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        if errors:
+            raise errors[0]
+        return results
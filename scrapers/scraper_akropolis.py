@@ -10,11 +10,11 @@ HTML Pattern (verified via WebFetch):
 </a>
 """
 
-from bs4 import BeautifulSoup
 import json
 import re
 from typing import List, Dict, Optional
 from .base_scraper import BaseScraper
+from .date_extract import DM
 
 
 class AkropolisScraper(BaseScraper):
@@ -55,12 +55,11 @@ class AkropolisScraper(BaseScraper):
         text = td_tag.get_text(strip=True)
 
         # Look for date pattern "DD. MM" in November
-        date_match = re.search(r'(\d{1,2})\.\s*(\d{1,2})', text)
+        date_match = DM.regex.search(text)
         if not date_match:
             return None
 
-        day = int(date_match.group(1))
-        month = int(date_match.group(2))
+        day, month, _, _ = DM.parts(date_match)
 
         # Filter by target month
         if month != self.month:
@@ -110,7 +109,12 @@ class AkropolisScraper(BaseScraper):
         print(f"Scraping {self.VENUE_NAME} for {self.month}/{self.year}...")
 
         html = self.fetch_html()
-        soup = BeautifulSoup(html, 'lxml')
+        events = self.parse_structured_data(html)
+        if events is not None:
+            self.events = events
+            return self.events
+
+        soup = self.make_soup(html)
 
         # Find all table cells - events are in <td> elements
         all_tds = soup.find_all('td')
@@ -4,10 +4,9 @@ Rock Café Scraper
 Scrapes concert data from Rock Café Prague.
 """
 
-from bs4 import BeautifulSoup
-import re
 from typing import List, Dict, Optional
 from .base_scraper import BaseScraper
+from .date_extract import DMY, find_time
 
 
 class RockCafeScraper(BaseScraper):
@@ -16,6 +15,7 @@ class RockCafeScraper(BaseScraper):
     BASE_URL = "https://rockcafe.cz/en/program/"
     VENUE_NAME = "Rock Café"
     CITY = "Praha"
+    TARGETS = 'a[href*="/en/program/"]'
 
     def __init__(self, month: int, year: int):
         """
@@ -70,21 +70,18 @@ class RockCafeScraper(BaseScraper):
         date_text = date_p.get_text(strip=True)
 
         # Parse date: "Friday 24.10.2025, 19:30" or "1.11.2025"
-        date_match = re.search(r'(\d{1,2})\.(\d{1,2})\.(\d{4})', date_text)
-        if not date_match:
+        parsed = DMY.extract(date_text)
+        if not parsed:
             return None
 
-        day = int(date_match.group(1))
-        month = int(date_match.group(2))
-        year_parsed = int(date_match.group(3))
+        day, month, year_parsed, _ = parsed
 
         # Filter by target month and year
         if month != self.month or year_parsed != self.year:
             return None
 
         # Extract time if available
-        time_match = re.search(r'(\d{1,2}):(\d{2})', date_text)
-        time_str = f"{time_match.group(1)}:{time_match.group(2)}" if time_match else None
+        time_str = find_time(date_text)
 
         # Build full URL
         if href.startswith('http'):
@@ -118,7 +115,12 @@ class RockCafeScraper(BaseScraper):
         self.logger.info(f"Scraping {self.VENUE_NAME} for {self.month}/{self.year}...")
 
         html = self.fetch_html()
-        soup = BeautifulSoup(html, 'lxml')
+        events = self.parse_structured_data(html)
+        if events is not None:
+            self.events = events
+            return self.events
+
+        soup = self.make_soup(html)
 
         # Find all event links
         all_links = soup.find_all('a', href=True)
@@ -0,0 +1,83 @@
+"""
+State Store
+===========
+Small JSON files under scraper_state/ that persist between runs
+(which fetch tier works for a venue, timing history, ...).
+
+Writes are atomic (temp file + rename) and serialized by a process-wide
+lock, so parallel workers can update the same file safely.
+"""
+
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import unicodedata
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+
+STATE_DIR = Path('scraper_state')
+
+logger = logging.getLogger(__name__)
+_lock = threading.RLock()
+
+
+def slugify(name: str) -> str:
+    """File-name-safe ASCII slug ('Palác Akropolis' -> 'palac-akropolis')"""
+    ascii_name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode()
+    return re.sub(r'[^a-z0-9]+', '-', ascii_name.lower()).strip('-') or 'default'
+
+
+def state_path(name: str) -> Path:
+    """Path of a state file, e.g. state_path('fetch_tiers') -> scraper_state/fetch_tiers.json"""
+    return STATE_DIR / f"{name}.json"
+
+
+def atomic_write_json(path: Path, data: Any) -> None:
+    """Write JSON to path atomically (readers never see a half-written file)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.remove(tmp_name)
+        raise
+
+
+def load_state(name: str) -> Dict:
+    """Load a state file ({} if missing or unreadable)"""
+    path = state_path(name)
+    with _lock:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable state file {path}: {e}")
+            return {}
+
+
+def update_state(name: str, update: Callable[[Dict], None]) -> Dict:
+    """
+    Read-modify-write a state file under the lock
+
+    Args:
+        name: State file name (without .json)
+        update: Callable mutating the loaded dict in place
+
+    Returns:
+        The updated state
+    """
+    with _lock:
+        state = load_state(name)
+        update(state)
+        atomic_write_json(state_path(name), state)
+        return state
@@ -0,0 +1,203 @@
+"""
+Structured Data
+===============
+Many venue and ticketing pages (GoOut, Ticketportal, WordPress event
+plugins) embed their listings as schema.org Event data next to the visible
+HTML: JSON-LD <script type="application/ld+json"> blocks or microdata
+itemscope/itemprop markup. Reading it skips the venue parser's DOM walk and
+its display-text date regexes.
+
+extract_records() finds both kinds in one pass of lxml's HTML tokenizer
+with a parser target - no tree is built. events_from_structured_data()
+turns the Event records into event dicts through json_capture's converter
+(month filter, de-duplication, legacy fields). Start times with a UTC offset
+("Z", "+01:00", "GMT+0200") are converted to Prague time first.
+
+OpenGraph tags describe the page as a whole, not the events it lists, so
+they are not used.
+"""
+
+import html as html_module
+import json
+import logging
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from lxml import etree
+
+from .date_extract import ISO, MONTH_DAY_YEAR
+from .json_capture import events_from_json
+
+
+logger = logging.getLogger(__name__)
+
+# Microdata attributes carrying a property value instead of the element text
+VALUE_ATTRIBUTES = ('content', 'datetime', 'href', 'src')
+
+# Timezone of the venues; event dicts hold local day and time
+LOCAL_TIMEZONE = ZoneInfo('Europe/Prague')
+
+# UTC offset following the time of a startDate: "...20:00:00Z", "...20:00+01:00",
+# "... 20:00:00 GMT+0200 (Central European Summer Time)"
+UTC_OFFSET = re.compile(r'\d:\d{2}(?::\d{2}(?:\.\d+)?)?\s*(?:GMT|UTC)?(Z|[+-]\d{2}:?\d{2})\b')
+
+
+def _is_event_type(value: Any) -> bool:
+    """schema.org Event or a subtype (MusicEvent, TheaterEvent, ...), not EventVenue"""
+    types = value if isinstance(value, list) else [value]
+    return any(isinstance(t, str) and t.rstrip('/').endswith('Event') for t in types)
+
+
+class _Collector:
+    """lxml parser target collecting JSON-LD texts and top-level microdata Event items"""
+
+    def __init__(self):
+        self.json_blocks: List[str] = []
+        self.items: List[Dict] = []
+        self._script: Optional[List[str]] = None
+        # Per open element: (item it opens, itemprop, item owning the property,
+        # attribute value, text chunks); open items and text collectors
+        self._frames: List[tuple] = []
+        self._open_items: List[Dict] = []
+        self._texts: List[List[str]] = []
+
+    def start(self, tag, attrib):
+        if tag == 'script' and 'ld+json' in attrib.get('type', ''):
+            self._script = []
+
+        prop = attrib.get('itemprop')
+        owner = self._open_items[-1] if prop and self._open_items else None
+        item = value = text = None
+        if 'itemscope' in attrib:
+            item = {'@type': attrib.get('itemtype', '')}
+            self._open_items.append(item)
+        elif prop:
+            value = next((attrib[name] for name in VALUE_ATTRIBUTES if name in attrib), None)
+            if value is None:
+                text = []
+                self._texts.append(text)
+        self._frames.append((item, prop, owner, value, text))
+
+    def data(self, data):
+        if self._script is not None:
+            self._script.append(data)
+        for text in self._texts:
+            text.append(data)
+
+    def end(self, tag):
+        if tag == 'script' and self._script is not None:
+            self.json_blocks.append(''.join(self._script))
+            self._script = None
+
+        item, prop, owner, value, text = self._frames.pop()
+        if text is not None:
+            self._texts.pop()
+            value = ' '.join(''.join(text).split())
+        if item is not None:
+            self._open_items.pop()
+            value = item
+            if owner is None and _is_event_type(item['@type']):
+                self.items.append(item)
+        if owner is not None and value:
+            for name in prop.split():
+                owner.setdefault(name, value)
+
+    def close(self):
+        return self
+
+
+def _json_ld_events(data: Any) -> Iterator[Dict]:
+    """Event objects of a JSON-LD document (top level, @graph, item lists, ...)"""
+    if isinstance(data, dict):
+        if _is_event_type(data.get('@type')):
+            yield data
+            return
+        for value in data.values():
+            yield from _json_ld_events(value)
+    elif isinstance(data, list):
+        for item in data:
+            yield from _json_ld_events(item)
+
+
+def _local_start(start: str) -> Optional[Tuple[int, int, int, Optional[str]]]:
+    """(day, month, year, time) of a startDate in Prague time; times without an offset are taken as local"""
+    parts = ISO.match(start) or MONTH_DAY_YEAR.extract(start)
+    offset = UTC_OFFSET.search(start) if parts and parts[3] else None
+    if not offset:
+        return parts
+
+    value = offset.group(1)
+    if value == 'Z':
+        tz = timezone.utc
+    else:
+        digits = value[1:].replace(':', '')
+        delta = timedelta(hours=int(digits[:2]), minutes=int(digits[2:]))
+        tz = timezone(-delta if value[0] == '-' else delta)
+
+    day, month, year, time_str = parts
+    hour, minute = map(int, time_str.split(':'))
+    local = datetime(year, month, day, hour, minute, tzinfo=tz).astimezone(LOCAL_TIMEZONE)
+    return local.day, local.month, local.year, f"{local.hour:02d}:{local.minute:02d}"
+
+
+def _record(event: Dict) -> Optional[Dict]:
+    """Event object -> {startDate (ISO), name, url}, None if cancelled or without a readable start date"""
+    if 'EventCancelled' in str(event.get('eventStatus', '')):
+        return None
+    start = event.get('startDate')
+    parts = _local_start(start) if isinstance(start, str) else None
+    if not parts:
+        return None
+    day, month, year, time_str = parts
+    name = event.get('name')
+    return {
+        'startDate': f"{year}-{month:02d}-{day:02d}" + (f"T{time_str}" if time_str else ''),
+        'name': html_module.unescape(name) if isinstance(name, str) else name,
+        'url': event.get('url'),
+    }
+
+
+def extract_records(html: str) -> List[Dict]:
+    """
+    schema.org Event records of a page, JSON-LD and microdata
+
+    Returns:
+        {startDate (ISO), name, url} dicts in document order, JSON-LD first
+    """
+    data = html.encode('utf-8') if isinstance(html, str) else html
+    if not data.strip():
+        return []
+    collector = etree.fromstring(data, etree.HTMLParser(target=_Collector(), encoding='utf-8'))
+
+    events: List[Dict] = []
+    for block in collector.json_blocks:
+        try:
+            events.extend(_json_ld_events(json.loads(block)))
+        except ValueError as e:
+            logger.debug(f"Skipping invalid JSON-LD block: {e}")
+    events.extend(collector.items)
+    return [record for record in map(_record, events) if record]
+
+
+def events_from_structured_data(html: str, base_url: str, venue: str, city: str,
+                                month: int, year: int) -> List[Dict]:
+    """
+    Event dicts for one month from a page's schema.org Event data
+
+    Args:
+        html: Page HTML
+        base_url: URL relative event URLs are resolved against
+        venue: Venue name for the events
+        city: City for the events
+        month: Target month (1-12)
+        year: Target year
+
+    Returns:
+        Events sorted by day (empty if the page has no Event data)
+    """
+    records = extract_records(html)
+    if not records:
+        return []
+    return events_from_json([(base_url, records)], venue, city, month, year)
@@ -0,0 +1,265 @@
+"""
+Browser Watchdog
+================
+Supervises the Chromium processes the browser pools launch.
+
+- tracking: every launch is bracketed by a snapshot of this process's
+  descendants, so the new browser's root process is known by pid
+- wall-clock cap: every borrowed page holds a lease on its browser; a lease
+  older than its limit (page_cap, or less under a run deadline) means the page
+  hangs past Playwright's own timeouts, and the browser's whole process tree
+  is killed. The blocked Playwright call in the worker then fails, the venue
+  is reported as failed and the pool relaunches Chromium for the next page.
+- leaks: report_leaks() at the end of the run lists browser processes still
+  alive (pid, name, RSS) and kills them.
+
+Process inspection needs psutil (optional). Without it leases are still
+tracked and expiries logged, but nothing can be killed or measured.
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from itertools import count
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+try:
+    import psutil
+except ImportError:  # optional, process supervision only
+    psutil = None
+
+
+DEFAULT_PAGE_CAP = 180.0  # seconds a page may stay borrowed
+CHECK_INTERVAL = 1.0      # seconds between lease checks
+BROWSER_PROCESS_NAMES = ('chrome', 'chromium', 'headless_shell')
+
+logger = logging.getLogger(__name__)
+
+
+def _is_browser_process(process) -> bool:
+    try:
+        name = process.name().lower()
+    except Exception:
+        return False
+    return any(part in name for part in BROWSER_PROCESS_NAMES)
+
+
+class BrowserWatchdog:
+    """
+    Tracks browser processes and page leases, kills browsers of hung pages
+
+    Args:
+        page_cap: Default wall-clock limit of a page lease in seconds
+        check_interval: Seconds between checks of the monitor thread
+        clock: Monotonic clock (injectable for tests)
+    """
+
+    def __init__(self, page_cap: float = DEFAULT_PAGE_CAP, check_interval: float = CHECK_INTERVAL,
+                 clock: Callable[[], float] = time.monotonic):
+        self.page_cap = page_cap
+        self.check_interval = check_interval
+        self.clock = clock
+        self.kills: List[Tuple[str, Optional[int]]] = []  # (lease label, browser pid)
+        self._lock = threading.Lock()
+        self._launch_lock = threading.Lock()
+        self._browsers: Dict[int, str] = {}
+        # token -> (deadline, browser pid, label)
+        self._leases: Dict[int, Tuple[float, Optional[int], str]] = {}
+        self._tokens = count()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def supervising(self) -> bool:
+        """True if processes can be inspected and killed (psutil installed)"""
+        return psutil is not None
+
+    def descendant_pids(self) -> Set[int]:
+        """Pids of all processes below this one (empty without psutil)"""
+        if psutil is None:
+            return set()
+        return {child.pid for child in psutil.Process().children(recursive=True)}
+
+    @contextmanager
+    def launching(self, label: str) -> Iterator[List[int]]:
+        """
+        Bracket a browser launch; the yielded list receives the browser's root pid
+
+        Launches are serialized so concurrent pools cannot claim each other's
+        processes.
+        """
+        found: List[int] = []
+        with self._launch_lock:
+            before = self.descendant_pids()
+            yield found
+            if psutil is None:
+                return
+            new = [p for p in psutil.Process().children(recursive=True)
+                   if p.pid not in before and _is_browser_process(p)]
+            new_pids = {p.pid for p in new}
+            roots = [p.pid for p in new if p.ppid() not in new_pids]
+        if roots:
+            found.append(roots[0])
+            with self._lock:
+                self._browsers[roots[0]] = label
+            logger.debug(f"Tracking browser pid {roots[0]} ({label})")
+
+    def kill_browsers(self, label: str) -> int:
+        """
+        Kill the browsers launched under a label (the launching thread's name)
+
+        Used to cancel the losing side of a hedged fetch; its blocked
+        Playwright call then fails.
+
+        Returns:
+            Number of browsers killed
+        """
+        with self._lock:
+            pids = [pid for pid, owner in self._browsers.items() if owner == label]
+            for pid in pids:
+                self._browsers.pop(pid)
+        for pid in pids:
+            self.kill_tree(pid)
+        return len(pids)
+
+    def forget_browser(self, pid: Optional[int]) -> None:
+        """Stop tracking a browser that was closed normally"""
+        with self._lock:
+            self._browsers.pop(pid, None)
+
+    @contextmanager
+    def lease(self, browser_pid: Optional[int], label: str, limit: Optional[float] = None) -> Iterator[None]:
+        """
+        Hold a page of a browser under the wall-clock cap
+
+        Args:
+            browser_pid: Root pid of the page's browser (None = unknown)
+            label: Venue / profile name for logs
+            limit: Limit in seconds (default page_cap; never above it)
+        """
+        limit = self.page_cap if limit is None else min(limit, self.page_cap)
+        token = next(self._tokens)
+        with self._lock:
+            self._leases[token] = (self.clock() + limit, browser_pid, label)
+        self._ensure_monitor()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._leases.pop(token, None)
+
+    def check(self) -> List[Tuple[str, Optional[int]]]:
+        """Kill browsers holding expired leases; returns the (label, pid) pairs handled"""
+        now = self.clock()
+        with self._lock:
+            expired = [(token, pid, label) for token, (deadline, pid, label) in self._leases.items()
+                       if deadline <= now]
+            for token, _, _ in expired:
+                self._leases.pop(token)
+
+        handled = []
+        for _, pid, label in expired:
+            logger.error(f"Page for {label} exceeded its wall-clock cap, killing browser pid {pid}")
+            if pid is not None:
+                self.kill_tree(pid)
+                self.forget_browser(pid)
+            handled.append((label, pid))
+        self.kills.extend(handled)
+        return handled
+
+    def kill_tree(self, pid: int) -> int:
+        """Kill a process and all its descendants; returns the number killed"""
+        if psutil is None:
+            logger.warning(f"psutil not installed, cannot kill browser pid {pid}")
+            return 0
+        try:
+            root = psutil.Process(pid)
+            processes = root.children(recursive=True) + [root]
+        except psutil.NoSuchProcess:
+            return 0
+        for process in processes:
+            try:
+                process.kill()
+            except psutil.NoSuchProcess:
+                pass
+        psutil.wait_procs(processes, timeout=5)
+        return len(processes)
+
+    def _ensure_monitor(self) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._monitor, name='browser-watchdog', daemon=True)
+            self._thread.start()
+
+    def _monitor(self) -> None:
+        while not self._stop.wait(self.check_interval):
+            try:
+                self.check()
+            except Exception as e:
+                logger.warning(f"Watchdog check failed: {e}")
+
+    def stop(self) -> None:
+        """Stop the monitor thread"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.check_interval * 2)
+            self._thread = None
+
+    def report_leaks(self) -> List[Dict]:
+        """
+        Log and kill browser processes still alive at the end of the run
+
+        Returns:
+            One dict per leaked process: pid, name, rss_mb
+        """
+        self.stop()
+        if self.kills:
+            logger.warning(f"Watchdog killed {len(self.kills)} hung browsers: "
+                           f"{', '.join(label for label, _ in self.kills)}")
+        if psutil is None:
+            return []
+
+        leaked = []
+        for process in psutil.Process().children(recursive=True):
+            if not _is_browser_process(process):
+                continue
+            try:
+                leaked.append({'pid': process.pid, 'name': process.name(),
+                               'rss_mb': round(process.memory_info().rss / 2**20, 1)})
+            except psutil.NoSuchProcess:
+                continue
+
+        if leaked:
+            total = sum(p['rss_mb'] for p in leaked)
+            logger.warning(f"Leaked browser processes: {len(leaked)} ({total:.0f} MB RSS)")
+            for p in leaked:
+                logger.warning(f"  pid {p['pid']} {p['name']}: {p['rss_mb']} MB")
+            for p in leaked:
+                self.kill_tree(p['pid'])
+        with self._lock:
+            self._browsers.clear()
+        return leaked
+
+
+_watchdog: Optional[BrowserWatchdog] = None
+_watchdog_lock = threading.Lock()
+
+
+def get_watchdog() -> BrowserWatchdog:
+    """Return the run's watchdog, creating it with defaults on first use"""
+    global _watchdog
+    with _watchdog_lock:
+        if _watchdog is None:
+            _watchdog = BrowserWatchdog()
+        return _watchdog
+
+
+def configure_watchdog(page_cap: float = DEFAULT_PAGE_CAP) -> BrowserWatchdog:
+    """Replace the run's watchdog (call before any browser is launched)"""
+    global _watchdog
+    with _watchdog_lock:
+        _watchdog = BrowserWatchdog(page_cap=page_cap)
+        return _watchdog
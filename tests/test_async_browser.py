@@ -0,0 +1,82 @@
+"""
+Test suite for the async browser engine's page handling (offline)
+"""
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+from scrapers import watchdog
+from scrapers.async_browser import AsyncBrowserScraper
+from scrapers.browser_scraper import BrowserScraper
+
+
+class ListingScraper(BrowserScraper):
+    """Reads a "<p>" per event"""
+
+    def __init__(self, month: int, year: int):
+        super().__init__(venue_name='Klub', url='https://example.cz/program', city='Praha',
+                         month=month, year=year)
+
+    def parse_html(self, html):
+        self.events = [{'day': 7, 'month': self.month, 'year': self.year, 'artist': 'Kapela'}
+                       for _ in range(html.count('<p>'))]
+        return self.events
+
+
+class FakePage:
+    def __init__(self, hang: bool):
+        self.hang = hang
+
+    async def route(self, pattern, handler):
+        pass
+
+    async def goto(self, url, wait_until=None, timeout=None):
+        if self.hang:
+            await asyncio.sleep(60)
+
+    async def wait_for_function(self, *args, **kwargs):
+        return True
+
+    async def content(self):
+        return '<html><body><p>A</p><p>B</p></body></html>'
+
+
+class FakePool:
+    """AsyncBrowserPool stand-in; records closed pages"""
+
+    def __init__(self, hang: bool = False):
+        self.hang = hang
+        self.closed = 0
+
+    @asynccontextmanager
+    async def page(self, profile=None):
+        try:
+            yield FakePage(self.hang)
+        finally:
+            self.closed += 1
+
+
+@pytest.fixture
+def page_cap(monkeypatch):
+    monkeypatch.setattr(watchdog, '_watchdog', watchdog.BrowserWatchdog(page_cap=0.2))
+
+
+class TestScrapeViaBrowser:
+    """Tests for the browser tier on the event loop"""
+
+    def test_parses_page(self, page_cap):
+        events = asyncio.run(AsyncBrowserScraper(ListingScraper(11, 2025), FakePool()).scrape_via_browser())
+
+        assert len(events) == 2
+
+    def test_hung_page_hits_page_cap(self, page_cap):
+        pool = FakePool(hang=True)
+
+        with pytest.raises(Exception, match='page cap'):
+            asyncio.run(AsyncBrowserScraper(ListingScraper(11, 2025), pool).scrape_via_browser())
+
+        assert pool.closed == 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
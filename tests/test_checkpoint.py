@@ -0,0 +1,40 @@
+"""
+Test suite for per-venue run checkpoints (offline)
+"""
+import pytest
+import scrapers.checkpoint as checkpoint_module
+from scrapers.checkpoint import RunCheckpoint
+
+
+@pytest.fixture
+def checkpoint(tmp_path, monkeypatch):
+    monkeypatch.setattr(checkpoint_module, 'CHECKPOINT_DIR', tmp_path)
+    return RunCheckpoint(month=11, year=2025)
+
+
+class TestRunCheckpoint:
+    """Tests for saving, resuming and clearing checkpoints"""
+
+    def test_save_and_load(self, checkpoint):
+        events = [{'artist': 'Band', 'day': 7}]
+        validation = {'total_events': 1, 'status': 'GREEN'}
+        checkpoint.save('Palác Akropolis', events, validation)
+
+        assert checkpoint.directory.name == '2025-11'
+        assert checkpoint.load_completed() == {'Palác Akropolis': (events, validation)}
+
+    def test_unreadable_checkpoint_is_skipped(self, checkpoint):
+        checkpoint.save('Roxy', [], {'total_events': 0})
+        (checkpoint.directory / 'broken.json').write_text('{not json', encoding='utf-8')
+
+        assert list(checkpoint.load_completed()) == ['Roxy']
+
+    def test_clear(self, checkpoint):
+        checkpoint.save('Roxy', [], {'total_events': 0})
+        checkpoint.clear()
+
+        assert checkpoint.load_completed() == {}
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,62 @@
+"""
+Test suite for the keyword event classifier (offline)
+"""
+import pytest
+from scrapers.classifier import Classifier, Label, get_classifier
+
+
+class TestClassifier:
+    """Tests for labelling event titles"""
+
+    @pytest.fixture
+    def classifier(self):
+        return get_classifier({'sport': ['HC Sparta', 'FMX', 'hokej'], 'theatre': ['divadlo'],
+                               'other': ['vernisáž', 'beseda', 'film']})
+
+    @pytest.mark.parametrize('title, expected', [
+        ('HC Sparta Praha x BK Mladá Boleslav', Label('sport', 'hc sparta')),
+        ('FMX GLADIATOR GAMES 2025', Label('sport', 'fmx')),
+        ('Divadlo Járy Cimrmana', Label('theatre', 'divadlo')),
+        ('Vernisáž: Obrazy', Label('other', 'vernisáž')),
+        ('Hans Zimmer Live', Label('music', None)),
+        ('IL VOLO', Label('music', None)),
+    ])
+    def test_labels(self, classifier, title, expected):
+        assert classifier.classify(title) == expected
+
+    def test_first_category_wins(self, classifier):
+        assert classifier.classify('Film o hokeji: hokejová legenda').category == 'sport'
+
+    def test_no_keywords_is_music(self):
+        assert get_classifier().classify('Divadlo: hokej a vernisáž') == Label('music', None)
+
+    def test_overlapping_keywords(self):
+        classifier = Classifier({'other': ['he', 'she', 'his', 'hers']})
+        assert classifier.classify('ushers') == Label('other', 'she')
+        assert classifier.classify('this') == Label('other', 'his')
+
+    def test_batch_matches_single(self, classifier):
+        titles = ['Koncert', 'HC Sparta  vs Liberec', 'Beseda', '', 'koncert']
+        assert classifier.classify_batch(titles) == [Label('music', None), Label('sport', 'hc sparta'),
+                                                     Label('other', 'beseda'), Label('music', None),
+                                                     Label('music', None)]
+
+    def test_no_match_across_titles(self):
+        classifier = Classifier({'sport': ['hokej']})
+        assert classifier.classify_batch(['Ho', 'kej']) == [Label('music', None)] * 2
+
+    def test_cached_by_normalized_title(self, classifier):
+        classifier.classify('  Divadlo   POD lampou ')
+        assert 'divadlo pod lampou' in classifier.cache
+
+    def test_compiled_once_per_configuration(self):
+        assert get_classifier({'sport': ['FMX']}) is get_classifier({'sport': ('FMX',)})
+        assert get_classifier() is not get_classifier({'sport': ['FMX']})
+
+    def test_unknown_category_rejected(self):
+        with pytest.raises(ValueError):
+            Classifier({'opera': ['aida']})
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
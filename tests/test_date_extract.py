@@ -0,0 +1,81 @@
+"""
+Test suite for the shared date/time extractors (offline)
+"""
+import pytest
+from scrapers.date_extract import (CZECH_MONTH_NAME, DAY_MONTH, DM, DM_TIME, DMY, DMY_DASHED, ISO,
+                                   MONTH_DAY, MONTH_DAY_YEAR, SLASH_DM, START_TIME, TIME, find_time,
+                                   strip_weekday)
+
+
+class TestExtractors:
+    """Tests for the individual formats"""
+
+    @pytest.mark.parametrize('extractor, text, expected', [
+        (DMY, '7. 11. 2025', (7, 11, 2025, None)),
+        (DMY, 'Friday 24.10.2025, 19:30', (24, 10, 2025, '19:30')),
+        (DM, 'St 5.11 Koncert', (5, 11, None, None)),
+        (DM_TIME, '01. 11. from 15:00', (1, 11, None, '15:00')),
+        (SLASH_DM, 'Pá 07/11 20:00', (7, 11, None, None)),
+        (ISO, '2025-11-07T20:00:00+01:00', (7, 11, 2025, '20:00')),
+        (ISO, '/program/2025-11-07-koncert', (7, 11, 2025, None)),
+        (DMY_DASHED, '/program/akce/07-11-2025-koncert', (7, 11, 2025, None)),
+        (MONTH_DAY, 'Únor 21', (21, 2, None, None)),
+        (DAY_MONTH, '21. listopadu', (21, 11, None, None)),
+        (MONTH_DAY_YEAR, 'Sat Oct 25 2025 20:00:00 GMT+0200', (25, 10, 2025, '20:00')),
+        (MONTH_DAY_YEAR, 'November 7, 2025', (7, 11, 2025, None)),
+        (START_TIME, 'start: **20:00**', (None, None, None, '20:00')),
+    ])
+    def test_formats(self, extractor, text, expected):
+        assert extractor.extract(text) == expected
+
+    def test_time_zero_padded(self):
+        assert find_time('Začátek 9:30') == '09:30'
+        assert find_time('bez času', default='20:00') == '20:00'
+
+    def test_longest_month_name_wins(self):
+        assert CZECH_MONTH_NAME.extract('Červenec 12') == (None, 7, None, None)
+        assert CZECH_MONTH_NAME.extract('12. června') == (None, 6, None, None)
+
+    def test_remove(self):
+        assert TIME.remove('Koncert 20:00').strip() == 'Koncert'
+        assert DM.remove('7. 11. Kapela 8. 11.', leading=True) == ' Kapela 8. 11.'
+        assert DM.remove('Kapela 8. 11.', leading=True) == 'Kapela 8. 11.'
+
+
+class TestBatch:
+    """Tests for extracting many strings in one pass"""
+
+    def test_matches_per_string(self):
+        texts = ['Po 03/11 Kapela', 'bez data', '12/11 a 13/11', '']
+        assert SLASH_DM.extract_batch(texts) == [SLASH_DM.extract(t) for t in texts]
+
+    def test_no_match_across_strings(self):
+        assert TIME.extract_batch(['Kapela 20', '30 let']) == [None, None]
+
+
+class TestStripWeekday:
+    """Tests for dropping a leading weekday"""
+
+    @pytest.mark.parametrize('text, expected', [
+        ('Pá 07/11 Kapela', '07/11 Kapela'),
+        ('DNES Čt 7. 11. Kapela', '7. 11. Kapela'),
+        ('Čt7.11.Kapela', '7.11.Kapela'),
+        ('Friday, 20:00 Band', '20:00 Band'),
+        ('Today 07/11 Band', '07/11 Band'),
+        ('Pá 7 listopadu Kapela', '7 listopadu Kapela'),
+        ('Pá\n7. listopadu', '7. listopadu'),
+        ('Fri 7 Nov Band', '7 Nov Band'),
+        ('So 7 Days Band', 'So 7 Days Band'),
+        ('Poutníci', 'Poutníci'),
+        ('Neon', 'Neon'),
+        ('Sun Ra Arkestra', 'Sun Ra Arkestra'),
+        ('St. Vincent', 'St. Vincent'),
+        ('So What Band 7. 11.', 'So What Band 7. 11.'),
+        ('So 80s Band', 'So 80s Band'),
+    ])
+    def test_strip(self, text, expected):
+        assert strip_weekday(text) == expected
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
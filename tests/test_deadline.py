@@ -0,0 +1,70 @@
+"""
+Test suite for the run deadline and per-venue budgets (offline)
+"""
+import pytest
+from scrapers.deadline import MIN_VENUE_BUDGET, RunDeadline, parse_duration, venue_priority
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+VENUES = [
+    {'nazev': 'Arena', 'velikost': 'velky'},
+    {'nazev': 'Klub', 'velikost': 'stredni'},
+    {'nazev': 'Bar', 'velikost': 'maly'},
+]
+
+
+class TestParseDuration:
+    def test_units(self):
+        assert parse_duration('300') == 300
+        assert parse_duration('300s') == 300
+        assert parse_duration('5m') == 300
+        assert parse_duration('1h') == 3600
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            parse_duration('soon')
+
+
+class TestRunDeadline:
+    """Tests for budgets and admission"""
+
+    def test_priority_from_size_or_override(self):
+        assert venue_priority({'velikost': 'velky'}) > venue_priority({'velikost': 'maly'})
+        assert venue_priority({'velikost': 'maly', 'priorita': 5}) == 5
+
+    def test_budget_shared_by_priority(self):
+        deadline = RunDeadline(600, VENUES, parallelism=1, clock=FakeClock())
+
+        assert deadline.budget(VENUES[0]) == pytest.approx(300)
+        assert deadline.budget(VENUES[2]) == pytest.approx(100)
+
+    def test_budget_floor_and_remaining_cap(self):
+        clock = FakeClock()
+        deadline = RunDeadline(60, VENUES, parallelism=1, clock=clock)
+        assert deadline.budget(VENUES[2]) == MIN_VENUE_BUDGET
+
+        clock.now = 55
+        assert deadline.budget(VENUES[0]) == pytest.approx(5)
+
+    def test_low_priority_skipped_when_time_runs_out(self):
+        clock = FakeClock()
+        deadline = RunDeadline(100, VENUES, clock=clock)
+        assert deadline.admit(VENUES[2], expected=30) is None
+
+        clock.now = 80
+        assert deadline.admit(VENUES[2], expected=30) is not None
+        assert deadline.admit(VENUES[0], expected=30) is None
+
+        clock.now = 100
+        assert deadline.admit(VENUES[0], expected=30) is not None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,63 @@
+"""
+Test suite for merging venue results into events_data.json (offline)
+"""
+import pytest
+from scrape_concerts import merge_venue_results, set_skipped_venues
+
+
+KLUBY = [{'nazev': 'A'}, {'nazev': 'B'}, {'nazev': 'C'}]
+
+
+def block(venue, total):
+    return {'venue': venue, 'city': 'Praha', 'events': [{}] * total, 'validation': {'total_events': total}}
+
+
+class TestMergeVenueResults:
+    """Tests for replacing re-scraped venue blocks"""
+
+    def test_replaces_scraped_blocks(self):
+        existing = {'month': 11, 'year': 2025, 'venues': [block('C', 1), block('A', 5)]}
+
+        data = merge_venue_results(existing, [block('A', 2), block('B', 3)], KLUBY)
+
+        assert [(b['venue'], b['validation']['total_events']) for b in data['venues']] == [
+            ('A', 2), ('B', 3), ('C', 1)]
+        assert data['total_events'] == 6
+
+    def test_resumed_venues_leave_skipped_list(self):
+        existing = {'month': 11, 'year': 2025, 'venues': [], 'skipped_venues': ['A', 'B', 'C']}
+        checkpointed, scraped = [block('A', 2)], [block('C', 1)]
+
+        data = merge_venue_results(existing, checkpointed + scraped, KLUBY)
+
+        assert data['skipped_venues'] == ['B']
+        assert existing['skipped_venues'] == ['A', 'B', 'C']
+
+
+class TestSetSkippedVenues:
+    """Tests for the skipped_venues list of a partial run"""
+
+    def test_rescraped_venue_no_longer_skipped(self):
+        existing = {'month': 11, 'year': 2025, 'venues': [block('A', 5)], 'skipped_venues': ['B', 'C']}
+        data = merge_venue_results(existing, [block('B', 3)], KLUBY)
+
+        set_skipped_venues(data, [])
+
+        assert data['skipped_venues'] == ['C']
+
+    def test_key_dropped_when_all_rescraped(self):
+        existing = {'month': 11, 'year': 2025, 'venues': [], 'skipped_venues': ['B']}
+        data = merge_venue_results(existing, [block('B', 3)], KLUBY)
+
+        set_skipped_venues(data, [])
+
+        assert 'skipped_venues' not in data
+
+    def test_skipped_in_this_run_added(self):
+        data = set_skipped_venues({'venues': [], 'skipped_venues': ['C']}, ['A', 'C'])
+
+        assert data['skipped_venues'] == ['C', 'A']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,61 @@
+"""
+Test suite for hedged scrapes (second attempt raced against a slow first one; offline)
+"""
+import threading
+
+import pytest
+from scrapers import browser_scraper
+from scrapers.browser_scraper import BrowserScraper
+
+
+EVENT = {'day': 7, 'month': 11, 'year': 2025, 'artist': 'Kapela'}
+
+
+class HedgedScraper(BrowserScraper):
+    """HTTP tier only; the hedge blocks in it until `release`"""
+    HEDGE = True
+    hedge_started = threading.Event()
+    release = threading.Event()
+
+    def __init__(self, month: int, year: int):
+        super().__init__(venue_name='Klub', url='https://example.cz/program', city='Praha',
+                         month=month, year=year)
+
+    def hedge_delay(self):
+        return 0.01
+
+    def should_try_http(self):
+        return True
+
+    def scrape_http_tier(self):
+        if threading.current_thread().name.startswith('hedge-'):
+            HedgedScraper.hedge_started.set()
+            HedgedScraper.release.wait(timeout=10)
+        else:
+            HedgedScraper.hedge_started.wait(timeout=10)
+        return [dict(EVENT)]
+
+
+class TestHedgedScrape:
+    """Tests for cancelling the losing attempt"""
+
+    def test_loser_in_http_tier_records_no_state(self, monkeypatch):
+        HedgedScraper.hedge_started.clear()
+        HedgedScraper.release.clear()
+        records = []
+        monkeypatch.setattr(browser_scraper, 'record_fetch_tier',
+                            lambda venue, tier: records.append(threading.current_thread().name))
+        scraper = HedgedScraper(11, 2025)
+
+        events = scraper.scrape_with_retry()
+        hedge = next(t for t in threading.enumerate() if t.name == 'hedge-klub')
+        HedgedScraper.release.set()
+        hedge.join(timeout=10)
+
+        assert events == [EVENT]
+        assert records == [threading.current_thread().name]
+        assert not scraper.cancelled.is_set()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
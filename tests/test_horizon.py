@@ -0,0 +1,156 @@
+"""
+Test suite for horizon mode (--months N): month list, re-parse bucketing
+and the per-month output files (offline)
+"""
+import pytest
+from scrape_concerts import collect_horizon, horizon_month_data, horizon_months
+from scrapers.browser_scraper import BrowserScraper, VagonBrowserScraper
+from scrapers.date_extract import DM
+
+
+KLUBY = [{'nazev': 'A'}, {'nazev': 'B'}, {'nazev': 'C'}]
+
+PROGRAM = '<div class="program"><p>3.11. Kapela A</p><p>5.12. Kapela B</p><p>9.1. Kapela C</p></div>'
+
+VAGON = """
+<table class="table">
+  <tr><td>150</td><td>Pá</td><td>7</td><td><a href="/a">Kapela A</a> 21:00</td></tr>
+  <tr><td>150</td><td>So</td><td>8</td><td><a href="/b">Kapela B</a> 21:00</td></tr>
+</table>
+"""
+
+
+class DatedScraper(BrowserScraper):
+    """Listing with "D.M." dates, filtered by month like the venue parsers"""
+
+    def __init__(self, month: int, year: int):
+        super().__init__(venue_name='Dated', url='https://example.cz/program', city='Praha',
+                         month=month, year=year)
+
+    def parse_html(self, html):
+        self.events = [{'day': day, 'month': month, 'year': self.year, 'artist': artist}
+                       for (day, month, _, _), artist in zip(DM.findall(html), ('A', 'B', 'C'))
+                       if month == self.month]
+        return self.events
+
+
+class MonthlyUndatedScraper(DatedScraper):
+    """No month filter, but the URL is per month"""
+    HORIZON_REPARSE = False
+
+    def __init__(self, month: int, year: int):
+        BrowserScraper.__init__(self, venue_name='Monthly', url=f'https://example.cz/{year}/{month}',
+                                city='Praha', month=month, year=year)
+
+
+def fake_fetch(html, fetched):
+    def scrape_with_retry(self):
+        fetched.append((self.month, self.year))
+        return self.parse_source('html', html)
+    return scrape_with_retry
+
+
+class TestHorizonMonths:
+    """Tests for the month list"""
+
+    def test_crosses_year(self):
+        assert horizon_months(11, 2025, 3) == [(11, 2025), (12, 2025), (1, 2026)]
+        assert horizon_months(6, 2026, 1) == [(6, 2026)]
+
+
+class TestScrapeHorizon:
+    """Tests for fetching once and bucketing by month"""
+
+    def test_reparse_buckets_by_month(self, monkeypatch):
+        fetched = []
+        monkeypatch.setattr(DatedScraper, 'scrape_with_retry', fake_fetch(PROGRAM, fetched))
+
+        results = DatedScraper(11, 2025).scrape_horizon(horizon_months(11, 2025, 3))
+
+        assert fetched == [(11, 2025)]
+        assert {key: [e['artist'] for e in s.events] for key, s in results.items()} == {
+            (11, 2025): ['A'], (12, 2025): ['B'], (1, 2026): ['C']}
+
+    def test_undated_page_left_out(self, monkeypatch):
+        fetched = []
+        monkeypatch.setattr(VagonBrowserScraper, 'scrape_with_retry', fake_fetch(VAGON, fetched))
+
+        results = VagonBrowserScraper(11, 2025).scrape_horizon(horizon_months(11, 2025, 3))
+
+        assert fetched == [(11, 2025)]
+        assert list(results) == [(11, 2025)]
+        assert [e['month'] for e in results[(11, 2025)].events] == [11, 11]
+
+    def test_undated_monthly_url_fetched_per_month(self, monkeypatch):
+        fetched = []
+        monkeypatch.setattr(MonthlyUndatedScraper, 'scrape_with_retry', fake_fetch(PROGRAM, fetched))
+
+        results = MonthlyUndatedScraper(11, 2025).scrape_horizon(horizon_months(11, 2025, 2))
+
+        assert fetched == [(11, 2025), (12, 2025)]
+        assert list(results) == [(11, 2025), (12, 2025)]
+
+
+class FakeScraper:
+    def __init__(self, events):
+        self.events = events
+
+    def validate(self, min_events, max_events):
+        return {'total_events': len(self.events), 'range': (min_events, max_events)}
+
+
+class TestCollectHorizon:
+    """Tests for handing extra months to the collector"""
+
+    def test_extra_months_collected(self):
+        collected = []
+        venue = {'nazev': 'A', 'min_akci': 2, 'max_akci': 9}
+        by_month = {(11, 2025): FakeScraper(['x']), (12, 2025): FakeScraper(['y', 'z'])}
+
+        events = collect_horizon(venue, by_month, 11, 2025, lambda *args: collected.append(args))
+
+        assert events == ['x']
+        assert collected == [(venue, (12, 2025), ['y', 'z'], {'total_events': 2, 'range': (2, 9)})]
+
+
+def block(venue, total):
+    return {'venue': venue, 'city': 'Praha', 'events': [{}] * total, 'validation': {'total_events': total}}
+
+
+class TestHorizonMonthData:
+    """Tests for the per-month output files"""
+
+    def test_replaces_without_existing(self):
+        data = horizon_month_data(12, 2025, [block('C', 1), block('A', 2)], KLUBY)
+
+        assert (data['month'], data['year'], data['month_name']) == (12, 2025, 'prosinec')
+        assert [b['venue'] for b in data['venues']] == ['A', 'C']
+        assert data['total_events'] == 3
+
+    def test_merges_into_existing(self):
+        existing = {'month': 12, 'year': 2025, 'month_name': 'prosinec',
+                    'venues': [block('A', 5), block('B', 4)]}
+
+        data = horizon_month_data(12, 2025, [block('A', 2)], KLUBY, existing)
+
+        assert [(b['venue'], b['validation']['total_events']) for b in data['venues']] == [('A', 2), ('B', 4)]
+        assert data['total_events'] == 6
+
+    def test_resumed_venue_leaves_skipped_list(self):
+        existing = {'month': 12, 'year': 2025, 'venues': [block('B', 4)], 'skipped_venues': ['A']}
+
+        data = horizon_month_data(12, 2025, [block('A', 2)], KLUBY, existing)
+
+        assert 'skipped_venues' not in data
+
+    def test_existing_of_other_month_ignored(self):
+        existing = {'month': 11, 'year': 2025, 'venues': [block('B', 4)]}
+
+        data = horizon_month_data(12, 2025, [block('A', 2)], KLUBY, existing)
+
+        assert [b['venue'] for b in data['venues']] == ['A']
+        assert data['month'] == 12
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,111 @@
+"""
+Test suite for the lxml parser backend against BeautifulSoup (offline)
+"""
+import glob
+import re
+import pytest
+from scrapers.html_parser import UnsupportedQuery, has_selector, parse_document, strainer
+
+
+HTML = """
+<html><body>
+  <div class="event big" data-id="1">
+    <span class="date">7. 11.</span><a href="/event/1/">Koncert <b>A</b></a>
+    <script>var x = 1;</script>
+  </div>
+  <div class="event" data-id="2"><span class="date">8. 11.</span><a>Bez odkazu</a></div>
+  <p class="eventual">Jiné</p>
+</body></html>
+"""
+
+
+def both(html=HTML):
+    return parse_document(html, 'lxml'), parse_document(html, 'bs4')
+
+
+def texts(nodes):
+    return [n.get_text(' ', strip=True) for n in nodes]
+
+
+class TestLxmlBackend:
+    """Tests for BeautifulSoup-compatible queries"""
+
+    @pytest.mark.parametrize('args, kwargs', [
+        (('div',), {'class_': 'event'}),
+        (('div', 'big'), {}),
+        ((), {'class_': re.compile('event')}),
+        (('a',), {'href': True}),
+        (('a',), {'href': re.compile(r'/event/\d+/')}),
+        ((['span', 'b'],), {}),
+        (('div',), {'attrs': {'data-id': '2'}}),
+    ])
+    def test_find_all_matches_bs4(self, args, kwargs):
+        lxml_doc, bs4_doc = both()
+        assert texts(lxml_doc.find_all(*args, **kwargs)) == texts(bs4_doc.find_all(*args, **kwargs))
+
+    def test_navigation_and_attributes(self):
+        doc = parse_document(HTML)
+        link = doc.find('a', href=True)
+
+        assert link['href'] == '/event/1/'
+        assert link.find_parent('div').get('class') == ['event', 'big']
+        assert link.find_parent('div').find_next_sibling('div')['data-id'] == '2'
+        assert link.find_next('span').text == '8. 11.'
+        assert doc.find('p').get('id') is None
+
+    def test_text_skips_scripts(self):
+        lxml_doc, bs4_doc = both()
+        assert lxml_doc.find('div').get_text() == bs4_doc.find('div').get_text()
+        assert 'var x' not in lxml_doc.get_text()
+
+    def test_unsupported_filter_raises(self):
+        with pytest.raises(UnsupportedQuery):
+            parse_document(HTML).find_all(string='Jiné')
+
+    def test_has_selector(self):
+        assert has_selector(HTML, 'div.event span.date')
+        assert not has_selector(HTML, 'ul.program')
+
+    @pytest.mark.parametrize('path', sorted(glob.glob('data_raw/*.html')))
+    def test_saved_pages_match_bs4(self, path):
+        with open(path, encoding='utf-8') as f:
+            lxml_doc, bs4_doc = both(f.read())
+        assert lxml_doc.get_text() == bs4_doc.get_text()
+        assert texts(lxml_doc.find_all('a', href=True)) == texts(bs4_doc.find_all('a', href=True))
+
+
+class TestTargets:
+    """Tests for partial parsing of TARGETS subtrees"""
+
+    @pytest.mark.parametrize('targets', ['div.event', 'div.event.big', 'div[data-id="2"]',
+                                         'a[href^="/event/"]', '*[class~=eventual]'])
+    def test_both_backends_keep_same_subtrees(self, targets):
+        lxml_doc = parse_document(HTML, 'lxml', targets)
+        bs4_doc = parse_document(HTML, 'bs4', targets)
+
+        assert lxml_doc.get_text() == bs4_doc.get_text()
+        assert [n.name for n in lxml_doc.find_all(True)] == [n.name for n in bs4_doc.find_all(True)]
+
+    @pytest.mark.parametrize('targets', ['div.event', 'div.event.big'])
+    def test_class_prefixes_not_matched(self, targets):
+        html = ('<div class="myevent big">A</div><div class="prevent">B</div>'
+                '<div class="events big">C</div><div class="big event">D</div>')
+        lxml_doc = parse_document(html, 'lxml', targets)
+        bs4_doc = parse_document(html, 'bs4', targets)
+
+        assert lxml_doc.get_text() == bs4_doc.get_text() == 'D'
+
+    def test_only_targets_kept(self):
+        doc = parse_document(HTML, 'lxml', 'div.event')
+
+        assert [d['data-id'] for d in doc.find_all('div', class_='event')] == ['1', '2']
+        assert doc.find('p') is None
+
+    @pytest.mark.parametrize('selector', ['div .event', 'div > a', 'a:has(b)', 'td[id^2025]'])
+    def test_complex_selectors_rejected(self, selector):
+        with pytest.raises(UnsupportedQuery):
+            strainer(selector)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
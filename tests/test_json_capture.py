@@ -0,0 +1,58 @@
+"""
+Test suite for JSON response event extraction (offline)
+"""
+import pytest
+from scrapers.json_capture import JsonCapture, events_from_json
+
+
+class TestEventsFromJson:
+    """Tests for the generic JSON event walker"""
+
+    def test_flat_listing(self):
+        payload = {'items': [
+            {'title': 'Band A', 'start': '2025-11-07T20:00:00+01:00', 'url': '/akce/band-a'},
+            {'title': 'Band B', 'start': '2025-12-01T20:00:00+01:00'},
+        ]}
+        events = events_from_json([('https://venue.cz/api/events', payload)], 'Venue', 'Praha', 11, 2025)
+
+        assert len(events) == 1
+        assert events[0]['artist'] == 'Band A'
+        assert events[0]['date'] == '07.11.2025'
+        assert events[0]['time'] == '20:00'
+        assert events[0]['url'] == 'https://venue.cz/akce/band-a'
+
+    def test_json_api_relationships(self):
+        payload = {
+            'schedules': [{
+                'id': '1', 'type': 'schedule',
+                'attributes': {'startAt': '2025-11-14T21:00:00+01:00'},
+                'relationships': {'event': {'data': {'id': '9', 'type': 'event'}}},
+            }],
+            'included': {'events': [
+                {'id': '9', 'type': 'event', 'attributes': {'name': {'cs': 'Kapela', 'en': 'Band'}}},
+            ]},
+        }
+        events = events_from_json([('https://goout.net/services/x/schedules', payload)], 'Watt', 'Plzeň', 11, 2025)
+
+        assert [e['artist'] for e in events] == ['Kapela']
+        assert events[0]['day'] == 14
+
+    def test_duplicates_and_date_only(self):
+        record = {'name': 'Band A', 'date': '2025-11-07'}
+        events = events_from_json([('u', [record]), ('u', [record])], 'Venue', 'Praha', 11, 2025)
+
+        assert len(events) == 1
+        assert events[0]['time'] is None
+
+
+class TestJsonCapture:
+    """Tests for URL matching of captured responses"""
+
+    def test_matches_pattern(self):
+        capture = JsonCapture(r'goout\.net/services/.+/schedules')
+        assert capture.matches('https://goout.net/services/entities/v1/schedules?venueIds=1')
+        assert not capture.matches('https://goout.net/en/papirna/vzkoab/events/')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,49 @@
+"""
+Test suite for latency-derived timeouts (offline)
+"""
+import pytest
+import scrapers.state_store as state_store_module
+from scrapers.latency import (MAX_TIMEOUT, MIN_TIMEOUT, learned_timeout, percentile,
+                              record_latency, typical_latency)
+
+
+@pytest.fixture(autouse=True)
+def state_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(state_store_module, 'STATE_DIR', tmp_path)
+
+
+class TestLearnedTimeout:
+    """Tests for recording latencies and deriving timeouts"""
+
+    def test_percentile_nearest_rank(self):
+        assert percentile([1, 2, 3, 4, 5, 6, 7, 8, 9, 10], 95) == 10
+        assert percentile([3, 1, 2], 50) == 2
+
+    def test_needs_history(self):
+        record_latency('Roxy', 'navigation', 4000)
+        record_latency('Roxy', 'navigation', 5000)
+        assert learned_timeout('Roxy', 'navigation') is None
+
+        record_latency('Roxy', 'navigation', 6000)
+        assert learned_timeout('Roxy', 'navigation') == 12000
+        assert learned_timeout('Roxy', 'selector') is None
+
+    def test_clamped(self):
+        for _ in range(3):
+            record_latency('Fast', 'selector', 100)
+            record_latency('Slow', 'selector', 80000)
+        assert learned_timeout('Fast', 'selector') == MIN_TIMEOUT
+        assert learned_timeout('Slow', 'selector') == MAX_TIMEOUT
+
+    def test_typical_latency(self):
+        for ms in (2000, 4000, 3000):
+            record_latency('Roxy', 'navigation', ms)
+        assert typical_latency('Roxy') == pytest.approx(3.0)
+
+        record_latency('Roxy', 'selector', 1000)
+        assert typical_latency('Roxy') == pytest.approx(4.0)
+        assert typical_latency('Unknown') is None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,27 @@
+"""
+Test suite for targeted page extraction helpers (offline)
+"""
+import re
+import pytest
+from scrapers.page_extract import fill_placeholders
+
+
+class TestFillPlaceholders:
+    """Tests for {month}/{mm}/{year} substitution in extract selectors"""
+
+    def test_selector_placeholders(self):
+        selector = fill_placeholders('td[id^="{year}-{mm}-"]', 2, 2026)
+        assert selector == 'td[id^="2026-02-"]'
+
+        selector = fill_placeholders('div[data-month="{month}"]', 2, 2026)
+        assert selector == 'div[data-month="2"]'
+
+    def test_regex_quantifiers_untouched(self):
+        pattern = fill_placeholders(r'\b\d{1,2}\.\s*{month}\.', 11, 2025)
+        assert pattern == r'\b\d{1,2}\.\s*11\.'
+        assert re.search(pattern, '7. 11. 20.00')
+        assert not re.search(pattern, '7. 12. 20.00')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,56 @@
+"""
+Test suite for the process-pool parse stage (offline)
+"""
+import os
+import pytest
+from scrapers.parse_pool import ParsePool
+
+
+class FakeScraper:
+    """Picklable stand-in with the scraper interface ParsePool relies on"""
+
+    def __init__(self, month: int, year: int):
+        self.month = month
+        self.year = year
+        self.venue_config = {}
+        self.events = []
+
+    def configure(self, venue_config):
+        self.venue_config = venue_config
+
+    def parse_source(self, kind, data):
+        if data == 'broken':
+            raise ValueError('unparseable')
+        self.events = [{'artist': line, 'month': self.month, 'pid': os.getpid(),
+                        'city': self.venue_config.get('mesto')} for line in data.splitlines()]
+        return self.events
+
+
+class TestParsePool:
+    """Tests for parsing fetched sources in worker processes"""
+
+    def test_parses_in_worker_and_stores_events(self):
+        scraper = FakeScraper(month=11, year=2025)
+        scraper.configure({'mesto': 'Praha'})
+
+        with ParsePool(processes=1) as pool:
+            events = pool.submit(scraper, 'html', 'Band A\nBand B').result(timeout=30)
+
+        assert [e['artist'] for e in events] == ['Band A', 'Band B']
+        assert events[0]['city'] == 'Praha'
+        assert events[0]['pid'] != os.getpid()
+        assert scraper.events == events
+
+    def test_parse_error_propagates(self):
+        scraper = FakeScraper(month=11, year=2025)
+
+        with ParsePool(processes=1) as pool:
+            future = pool.submit(scraper, 'html', 'broken')
+            with pytest.raises(ValueError):
+                future.result(timeout=30)
+
+        assert scraper.events == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
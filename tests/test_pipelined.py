@@ -0,0 +1,126 @@
+"""
+Test suite for the pipelined fetch/parse stages of scrape_concerts (offline)
+"""
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pytest
+import scrape_concerts
+from scrape_concerts import scrape_venue_pipelined
+from scrapers.browser_scraper import BrowserScraper
+
+
+VENUE = {'nazev': 'Klub', 'min_akci': 1, 'max_akci': 9}
+
+
+class ListingScraper(BrowserScraper):
+    """Fetches a fixed listing; counts the fetches"""
+    fetches = 0
+
+    def __init__(self, month: int, year: int):
+        super().__init__(venue_name='Klub', url='https://example.cz/program', city='Praha',
+                         month=month, year=year)
+
+    def fetch_source(self):
+        ListingScraper.fetches += 1
+        return 'html', 'Kapela A\nKapela B'
+
+    def parse_html(self, html):
+        self.events = [{'day': 7, 'month': self.month, 'year': self.year, 'artist': line}
+                       for line in html.splitlines()]
+        return self.events
+
+
+class SlowRetryScraper(ListingScraper):
+    """First fetch yields an unparseable page, the second waits for `release`"""
+    release = threading.Event()
+
+    def fetch_source(self):
+        ListingScraper.fetches += 1
+        if ListingScraper.fetches == 1:
+            return 'html', 'broken'
+        SlowRetryScraper.release.wait(timeout=10)
+        return super().fetch_source()
+
+
+class BrokenPool:
+    """Parse pool whose worker always fails"""
+
+    def submit(self, scraper, kind, data):
+        future = Future()
+        future.set_exception(RuntimeError('worker died'))
+        return future
+
+
+class SingleThreadPool:
+    """Parse pool with one worker; done-callbacks run on it, as on the process pool's result thread"""
+
+    def __init__(self):
+        self.executor = ThreadPoolExecutor(max_workers=1)
+
+    def submit(self, scraper, kind, data):
+        def parse():
+            if data == 'broken':
+                raise ValueError('unparseable')
+            return scraper.parse_source(kind, data)
+        return self.executor.submit(parse)
+
+
+@pytest.fixture
+def retry_pool():
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        yield executor
+
+
+@pytest.fixture
+def scraper_factory(monkeypatch):
+    ListingScraper.fetches = 0
+    monkeypatch.setattr(scrape_concerts, 'create_scraper', lambda venue, month, year: ListingScraper(month, year))
+
+
+class TestScrapeVenuePipelined:
+    """Tests for retrying a failed worker parse"""
+
+    def test_worker_error_retried(self, scraper_factory, retry_pool):
+        events, validation, error = scrape_venue_pipelined(VENUE, 11, 2025, BrokenPool(),
+                                                           retry_pool).result(timeout=30)
+
+        assert error is None
+        assert [e['artist'] for e in events] == ['Kapela A', 'Kapela B']
+        assert validation['total_events'] == 2
+        assert ListingScraper.fetches == 2
+
+    def test_retry_failure_reported(self, scraper_factory, retry_pool, monkeypatch):
+        monkeypatch.setattr(ListingScraper, 'parse_html', lambda self, html: 1 / 0)
+
+        events, validation, error = scrape_venue_pipelined(VENUE, 11, 2025, BrokenPool(),
+                                                           retry_pool).result(timeout=30)
+
+        assert (events, validation) == ([], None)
+        assert isinstance(error, ZeroDivisionError)
+
+    def test_slow_retry_does_not_delay_other_venues(self, retry_pool, monkeypatch):
+        ListingScraper.fetches = 0
+        SlowRetryScraper.release.clear()
+        scrapers = {'Pomalý': SlowRetryScraper, 'Klub': ListingScraper}
+        monkeypatch.setattr(scrape_concerts, 'create_scraper',
+                            lambda venue, month, year: scrapers[venue['nazev']](month, year))
+        parse_pool = SingleThreadPool()
+        finished = []
+
+        slow = scrape_venue_pipelined({'nazev': 'Pomalý'}, 11, 2025, parse_pool, retry_pool,
+                                      on_done=lambda result: finished.append('Pomalý'))
+        other = scrape_venue_pipelined(VENUE, 11, 2025, parse_pool, retry_pool,
+                                       on_done=lambda result: finished.append('Klub'))
+        try:
+            assert len(other.result(timeout=5)[0]) == 2
+            assert finished == ['Klub']
+        finally:
+            SlowRetryScraper.release.set()
+        assert slow.result(timeout=10)[2] is None
+        assert finished == ['Klub', 'Pomalý']
+        parse_pool.executor.shutdown()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,50 @@
+"""
+Test suite for request-level resource blocking (offline)
+"""
+import pytest
+from scrapers.resource_filter import ResourceFilter
+
+
+class TestResourceFilter:
+    """Tests for block decisions of the default and per-venue profiles"""
+
+    @pytest.fixture
+    def default_filter(self):
+        return ResourceFilter('https://www.o2arena.cz/en/events/')
+
+    def test_blocks_heavy_resource_types(self, default_filter):
+        assert default_filter.block_reason('https://www.o2arena.cz/img/a.jpg', 'image') == 'image'
+        assert default_filter.block_reason('https://www.o2arena.cz/f.woff2', 'font') == 'font'
+        assert default_filter.block_reason('https://www.o2arena.cz/v.mp4', 'media') == 'media'
+
+    def test_keeps_page_scripts_and_xhr(self, default_filter):
+        assert default_filter.block_reason('https://www.o2arena.cz/en/events/', 'document') is None
+        assert default_filter.block_reason('https://www.o2arena.cz/app.js', 'script') is None
+        assert default_filter.block_reason('https://api.o2arena.cz/events', 'xhr') is None
+
+    def test_blocks_trackers(self, default_filter):
+        assert default_filter.block_reason('https://www.googletagmanager.com/gtm.js', 'script') == 'tracker'
+        assert default_filter.block_reason('https://connect.facebook.net/sdk.js', 'script') == 'tracker'
+
+    def test_third_party_only_when_enabled(self, default_filter):
+        url = 'https://cdn.jsdelivr.net/npm/lib.js'
+        assert default_filter.block_reason(url, 'script') is None
+
+        strict = ResourceFilter('https://www.o2arena.cz/en/events/', {'block_third_party': True})
+        assert strict.block_reason(url, 'script') == 'third-party'
+        assert strict.block_reason('https://static.o2arena.cz/app.js', 'script') is None
+
+    def test_allow_domains_win(self):
+        venue_filter = ResourceFilter('https://www.roxy.cz/', {
+            'block_third_party': True,
+            'allow_domains': ['goout.net'],
+        })
+        assert venue_filter.block_reason('https://goout.net/widget.js', 'script') is None
+
+    def test_disabled_per_venue(self):
+        assert ResourceFilter.for_venue('https://www.roxy.cz/', {'resource_blocking': False}) is None
+        assert ResourceFilter.for_venue('https://www.roxy.cz/', {}) is not None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
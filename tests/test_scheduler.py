@@ -0,0 +1,103 @@
+"""
+Test suite for the parallel venue scheduler (offline, no browser needed)
+"""
+import threading
+import time
+
+import pytest
+from scrapers.durations import predict_makespan
+from scrapers.scheduler import VenueScheduler, venue_host
+
+
+def make_venues(*urls):
+    return [{'nazev': f"Venue {i}", 'url': url} for i, url in enumerate(urls)]
+
+
+class TestVenueScheduler:
+    """Tests for ordering, parallelism and the per-host cap"""
+
+    def test_venue_host_strips_www(self):
+        assert venue_host({'url': 'https://www.roxy.cz/tickets/'}) == 'roxy.cz'
+        assert venue_host({'url': 'https://goout.net/en/papirna/'}) == 'goout.net'
+
+    def test_results_keep_input_order(self):
+        """Slow first venue must still come back first"""
+        venues = make_venues('https://a.cz', 'https://b.cz', 'https://c.cz')
+        delays = {'Venue 0': 0.2, 'Venue 1': 0.0, 'Venue 2': 0.1}
+
+        def job(venue):
+            time.sleep(delays[venue['nazev']])
+            return venue['nazev']
+
+        results = VenueScheduler(workers=3).run(venues, job)
+        assert results == ['Venue 0', 'Venue 1', 'Venue 2']
+
+    def test_runs_in_parallel(self):
+        venues = make_venues(*[f"https://host{i}.cz" for i in range(4)])
+
+        start = time.monotonic()
+        VenueScheduler(workers=4).run(venues, lambda v: time.sleep(0.2))
+        assert time.monotonic() - start < 0.6
+
+    def test_per_host_limit(self):
+        """Three GoOut venues must never run at the same time with limit 1"""
+        venues = make_venues('https://goout.net/a', 'https://goout.net/b',
+                             'https://goout.net/c', 'https://roxy.cz')
+        lock = threading.Lock()
+        running = {'goout.net': 0}
+        peak = {'goout.net': 0}
+
+        def job(venue):
+            host = venue_host(venue)
+            if host == 'goout.net':
+                with lock:
+                    running[host] += 1
+                    peak[host] = max(peak[host], running[host])
+            time.sleep(0.05)
+            if host == 'goout.net':
+                with lock:
+                    running[host] -= 1
+
+        VenueScheduler(workers=4, per_host_limit=1).run(venues, job)
+        assert peak['goout.net'] == 1
+
+    def test_job_exception_is_raised(self):
+        venues = make_venues('https://a.cz', 'https://b.cz')
+
+        def job(venue):
+            if venue['nazev'] == 'Venue 1':
+                raise ValueError("boom")
+            return venue['nazev']
+
+        with pytest.raises(ValueError):
+            VenueScheduler(workers=2).run(venues, job)
+
+    def test_priority_starts_longest_first(self):
+        """Jobs start in priority order, results still come back in input order"""
+        venues = make_venues(*[f"https://host{i}.cz" for i in range(4)])
+        expected = {'Venue 0': 1, 'Venue 1': 5, 'Venue 2': 3, 'Venue 3': 4}
+        started = []
+
+        def job(venue):
+            started.append(venue['nazev'])
+            time.sleep(0.05)
+            return venue['nazev']
+
+        results = VenueScheduler(workers=2).run(venues, job, priority=lambda v: expected[v['nazev']])
+        assert results == ['Venue 0', 'Venue 1', 'Venue 2', 'Venue 3']
+        assert set(started[:2]) == {'Venue 1', 'Venue 3'}
+
+
+class TestPredictMakespan:
+    """Tests for the longest-job-first makespan estimate"""
+
+    def test_single_worker_is_sum(self):
+        assert predict_makespan([10, 20, 30], workers=1) == 60
+
+    def test_longest_first_balances_workers(self):
+        assert predict_makespan([60, 10, 20, 30], workers=2) == 60
+        assert predict_makespan([5, 5, 5, 5], workers=4) == 5
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,84 @@
+"""
+Test suite for schema.org Event extraction (JSON-LD, microdata; offline)
+"""
+import os
+import pytest
+from scrapers.structured_data import events_from_structured_data, extract_records
+
+
+HTML = """
+<html><head>
+<script type="application/ld+json">
+{"@context": "https://schema.org", "@graph": [
+  {"@type": "Organization", "name": "Klub"},
+  {"@type": "MusicEvent", "name": "Kapela &amp; Host", "startDate": "2025-11-09T19:30:00+01:00",
+   "url": "https://klub.cz/e/3"},
+  {"@type": "Event", "name": "Zrušeno", "startDate": "2025-11-10T20:00",
+   "eventStatus": "https://schema.org/EventCancelled"}
+]}
+</script>
+<script type="application/ld+json">{"@type": "Event", "name": "GoOut",
+ "startDate": "Sat Oct 25 2025 20:00:00 GMT+0200 (Central European Summer Time)"}</script>
+<script type="application/ld+json">{broken</script>
+</head><body>
+<div itemscope itemtype="https://schema.org/Event">
+  <h2 itemprop="name">Koncert <b>X</b></h2>
+  <meta itemprop="startDate" content="2025-11-07T20:00">
+  <a itemprop="url" href="/e/1">více</a><br>
+  <div itemprop="location" itemscope itemtype="https://schema.org/Place"><span itemprop="name">Sál</span></div>
+</div>
+<div itemscope itemtype="https://schema.org/EventVenue"><span itemprop="name">Klub</span></div>
+<div itemscope itemtype="http://schema.org/Event">
+  <span itemprop="name">Y</span><time itemprop="startDate" datetime="2025-11-08">8. 11.</time>
+</div>
+</body></html>
+"""
+
+
+class TestExtractRecords:
+    """Tests for finding Event records in one scan"""
+
+    def test_json_ld_and_microdata(self):
+        assert extract_records(HTML) == [
+            {'startDate': '2025-11-09T19:30', 'name': 'Kapela & Host', 'url': 'https://klub.cz/e/3'},
+            {'startDate': '2025-10-25T20:00', 'name': 'GoOut', 'url': None},
+            {'startDate': '2025-11-07T20:00', 'name': 'Koncert X', 'url': '/e/1'},
+            {'startDate': '2025-11-08', 'name': 'Y', 'url': None},
+        ]
+
+    def test_no_structured_data(self):
+        assert extract_records('<html><body><div class="event">7. 11.</div></body></html>') == []
+        assert extract_records('') == []
+
+
+class TestEventsFromStructuredData:
+    """Tests for converting records into event dicts"""
+
+    def test_month_filter_and_urls(self):
+        events = events_from_structured_data(HTML, 'https://klub.cz/program/', 'Klub', 'Praha', 11, 2025)
+
+        assert [(e['day'], e['time'], e['artist']) for e in events] == [
+            (7, '20:00', 'Koncert X'), (8, None, 'Y'), (9, '19:30', 'Kapela & Host')]
+        assert events[0]['url'] == 'https://klub.cz/e/1'
+
+    def test_utc_offsets_converted_to_prague_time(self):
+        html = ('<script type="application/ld+json">['
+                '{"@type": "Event", "name": "UTC", "startDate": "2025-11-07T19:00:00Z"},'
+                '{"@type": "Event", "name": "Léto", "startDate": "2025-11-08T20:00:00+02:00"},'
+                '{"@type": "Event", "name": "Silvestr", "startDate": "2025-11-30T23:30:00.000Z"}'
+                ']</script>')
+        events = events_from_structured_data(html, 'https://klub.cz/', 'Klub', 'Praha', 11, 2025)
+
+        assert [(e['day'], e['time'], e['artist']) for e in events] == [(7, '20:00', 'UTC'), (8, '19:00', 'Léto')]
+
+    @pytest.mark.skipif(not os.path.exists('data_raw/u_stare_pani_(goout).html'), reason='saved page missing')
+    def test_saved_goout_page(self):
+        with open('data_raw/u_stare_pani_(goout).html', encoding='utf-8') as f:
+            events = events_from_structured_data(f.read(), 'https://goout.net/', 'U Staré Paní', 'Praha', 11, 2025)
+
+        assert len(events) == 24
+        assert all(e['time'] and e['url'].startswith('https://goout.net/') for e in events)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
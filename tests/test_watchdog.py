@@ -0,0 +1,67 @@
+"""
+Test suite for the browser watchdog lease logic (offline)
+"""
+import pytest
+from scrapers.watchdog import BrowserWatchdog
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def watchdog(monkeypatch):
+    clock = FakeClock()
+    dog = BrowserWatchdog(page_cap=60, check_interval=3600, clock=clock)
+    killed = []
+    monkeypatch.setattr(dog, 'kill_tree', lambda pid: killed.append(pid) or 1)
+    dog.killed = killed
+    yield dog, clock
+    dog.stop()
+
+
+class TestBrowserWatchdog:
+    """Tests for wall-clock caps on borrowed pages"""
+
+    def test_expired_lease_kills_browser(self, watchdog):
+        dog, clock = watchdog
+        with dog.lease(4242, 'Roxy'):
+            clock.now = 30
+            assert dog.check() == []
+            clock.now = 61
+            assert dog.check() == [('Roxy', 4242)]
+
+        assert dog.killed == [4242]
+        assert dog.kills == [('Roxy', 4242)]
+
+    def test_limit_never_above_cap(self, watchdog):
+        dog, clock = watchdog
+        with dog.lease(1, 'short', limit=10), dog.lease(2, 'long', limit=600):
+            clock.now = 11
+            assert [label for label, _ in dog.check()] == ['short']
+            clock.now = 61
+            assert [label for label, _ in dog.check()] == ['long']
+
+    def test_released_lease_is_not_checked(self, watchdog):
+        dog, clock = watchdog
+        with dog.lease(7, 'Vagon'):
+            pass
+        clock.now = 1000
+        assert dog.check() == []
+        assert dog.killed == []
+
+    def test_kill_browsers_by_label(self, watchdog):
+        dog, _ = watchdog
+        dog._browsers.update({11: 'venue-worker-1', 12: 'hedge-roxy', 13: 'hedge-roxy'})
+
+        assert dog.kill_browsers('hedge-roxy') == 2
+        assert sorted(dog.killed) == [12, 13]
+        assert dog.kill_browsers('hedge-roxy') == 0
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])